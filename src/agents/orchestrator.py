@@ -2,7 +2,7 @@
 
 from agents import Agent, function_tool
 from typing import Optional
-import json
+import orjson
 
 
 @function_tool
@@ -16,7 +16,7 @@ def parse_product_list(products_json: str) -> str:
         Formatted list of products to process
     """
     try:
-        products = json.loads(products_json)
+        products = orjson.loads(products_json)
         output = ["Products to purchase:"]
         for i, p in enumerate(products, 1):
             name = p.get("name", "Unknown")
@@ -24,7 +24,7 @@ def parse_product_list(products_json: str) -> str:
             country = p.get("country", "IL")
             output.append(f"{i}. {name} (Max: {max_price}, Country: {country})")
         return "\n".join(output)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return f"Error parsing product list. Expected JSON format."
 
 
@@ -55,7 +55,7 @@ def create_product_request(
         "quantity": quantity,
         "country": country,
     }
-    return f"Created product request:\n{json.dumps(request, indent=2)}"
+    return f"Created product request:\n{orjson.dumps(request).decode()}"
 
 
 @function_tool
@@ -85,7 +85,7 @@ def update_negotiation_status(
         "current_price": current_price,
         "notes": notes,
     }
-    return f"Status updated:\n{json.dumps(update, indent=2)}"
+    return f"Status updated:\n{orjson.dumps(update).decode()}"
 
 
 @function_tool
@@ -16,20 +16,36 @@ The criteria store learns over time - when a new product category is encountered
 the agent discovers relevant criteria and saves them for future use.
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import os
 import re
 import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 
+import orjson
+import structlog
 from agents import Agent, function_tool
+from bs4 import BeautifulSoup
 from openai import AsyncOpenAI
 
-from src.tools.scraping import ScraperRegistry
-from src.cache import cached
-from src.observability import report_progress, record_search, record_error, record_warning
+from src.state.models import PriceOption
+from src.tools.scraping import BaseScraper, ScraperRegistry
+from src.tools.scraping.filters import ResultDeduplicator
+from src.tools.scraping.http_client import get_research_http_client
+from src.tools.scraping.runner import run_scraper
+from src.cache import cached, get_cache_manager, get_component_version, make_cache_key
+from src.config.settings import settings
+from src.observability import PhaseTimer, report_progress, record_search, record_error, record_warning
 from src.db.criteria_store import get_criteria_store
 
+logger = structlog.get_logger()
+
 
 # Country to language mapping
 COUNTRY_LANGUAGES = {
@@ -81,8 +97,12 @@ COUNTRY_LANGUAGES = {
 }
 
 
+@lru_cache(maxsize=512)
 def get_country_info(country: str) -> dict:
-    """Get language and currency info for a country."""
+    """Get language and currency info for a country.
+
+    Cached per country code; callers must treat the returned dict as read-only.
+    """
     return COUNTRY_LANGUAGES.get(country.upper(), {
         "language": "English",
         "code": "en",
@@ -94,12 +114,77 @@ def get_country_info(country: str) -> dict:
     })
 
 
+# Shared OpenAI client - reuses its connection pool across LLM calls
+_openai_client: Optional[AsyncOpenAI] = None
+# Client for settings.extraction_llm_base_url, when one is configured
+_extraction_client: Optional[AsyncOpenAI] = None
+
+
 def get_openai_client() -> AsyncOpenAI:
-    """Get OpenAI client with API key from environment."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    return AsyncOpenAI(api_key=api_key)
+    """Get the shared OpenAI client, creating it from the environment if needed."""
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        _openai_client = AsyncOpenAI(api_key=api_key)
+    return _openai_client
+
+
+def get_extraction_client() -> AsyncOpenAI:
+    """Get the client for the small extraction calls.
+
+    Uses settings.extraction_llm_base_url (any OpenAI-compatible server, e.g.
+    a local vLLM) when set, otherwise the shared OpenAI client.
+    """
+    global _extraction_client
+    if not settings.extraction_llm_base_url:
+        return get_openai_client()
+    if _extraction_client is None:
+        # Local servers typically ignore the key, but the client requires one
+        _extraction_client = AsyncOpenAI(
+            base_url=settings.extraction_llm_base_url,
+            api_key=os.environ.get("OPENAI_API_KEY") or "local",
+        )
+    return _extraction_client
+
+
+def reset_openai_client() -> None:
+    """Reset the shared OpenAI clients (for testing)."""
+    global _openai_client, _extraction_client
+    _openai_client = None
+    _extraction_client = None
+
+
+def _strip_code_fence(text: str) -> str:
+    """Strip a surrounding markdown code fence (```json ... ```) from LLM output."""
+    if text.startswith("```json"):
+        text = text[7:]
+    elif text.startswith("```"):
+        text = text[3:]
+    else:
+        return text
+    if text.startswith("\n"):
+        text = text[1:]
+    if text.endswith("```"):
+        text = text[:-3]
+        if text.endswith("\n"):
+            text = text[:-1]
+    return text
+
+
+async def _report_timings(tool: str, timer: PhaseTimer) -> None:
+    """Log and report a tool's per-phase latency breakdown.
+
+    Timings go to the logs and the progress trace only - tool outputs are
+    cached and fed back to the LLM, so they stay free of per-run data.
+    """
+    timings = timer.summary()
+    logger.info(f"{tool} timings", **timings)
+    await report_progress(
+        "⏱ Timings",
+        " ".join(f"{name}={ms}ms" for name, ms in timings.items()),
+    )
 
 
 # Category keywords for filtering search results
@@ -217,15 +302,53 @@ def filter_by_category(products: list, category: str, logger=None) -> list:
     return filtered
 
 
+def _normalize_llm_text(text: str) -> str:
+    """Normalize free text for LLM reply cache keys (case and whitespace)."""
+    return " ".join(text.casefold().split())
+
+
+async def _get_cached_llm_reply(key: str) -> Optional[str]:
+    """Get a cached LLM reply, if caching is enabled."""
+    if _cache_disabled or not settings.cache_enabled:
+        return None
+    return await get_cache_manager().get(key)
+
+
+async def _set_cached_llm_reply(key: str, reply: str) -> None:
+    """Store an LLM reply that was parsed/normalized successfully."""
+    if _cache_disabled or not settings.cache_enabled:
+        return
+    await get_cache_manager().set(
+        key,
+        reply,
+        ttl_seconds=settings.cache_ttl_agent_hours * 3600,
+        cache_type="agent",
+    )
+
+
 async def detect_category_with_llm(requirement: str) -> str:
     """Use LLM to detect the product category from a user requirement.
 
+    Replies are cached on the case- and whitespace-normalized requirement,
+    so trivially different phrasings of the same request skip the call.
+
     Returns a normalized category name (e.g., "refrigerator", "car", "laptop").
     """
-    client = get_openai_client()
+    cache_key = make_cache_key(
+        "agent",
+        "detect_category",
+        get_component_version(detect_category_with_llm),
+        settings.extraction_llm_model,
+        _normalize_llm_text(requirement),
+    )
+    cached_category = await _get_cached_llm_reply(cache_key)
+    if cached_category is not None:
+        return cached_category
+
+    client = get_extraction_client()
 
     response = await client.chat.completions.create(
-        model="gpt-4o-mini",
+        model=settings.extraction_llm_model,
         messages=[
             {"role": "system", "content": """You are a product category classifier.
 Given a user's product requirement, identify the main product category.
@@ -246,6 +369,7 @@ Use underscores for multi-word categories (e.g., washing_machine, air_conditione
     category = response.choices[0].message.content.strip().lower()
     # Normalize: remove quotes, extra spaces
     category = category.strip('"\'').replace(" ", "_")
+    await _set_cached_llm_reply(cache_key, category)
     return category
 
 
@@ -282,13 +406,10 @@ Return valid JSON array only, no markdown."""},
 
     result_text = response.choices[0].message.content.strip()
 
-    # Clean up response
-    if result_text.startswith("```"):
-        result_text = re.sub(r'^```(?:json)?\n?', '', result_text)
-        result_text = re.sub(r'\n?```$', '', result_text)
+    result_text = _strip_code_fence(result_text)
 
     try:
-        criteria = json.loads(result_text)
+        criteria = orjson.loads(result_text)
         return criteria
     except json.JSONDecodeError:
         # Fallback: return empty list, let research phase handle it
@@ -300,9 +421,6 @@ async def get_or_discover_criteria(category: str) -> list[dict]:
 
     This is the main entry point for getting category criteria.
     """
-    import structlog
-    logger = structlog.get_logger()
-
     store = get_criteria_store()
 
     # Try to get from store
@@ -338,10 +456,22 @@ async def translate_query_for_search(query: str, target_language: str) -> str:
     if target_language.lower() == "english":
         return query
 
-    client = get_openai_client()
+    cache_key = make_cache_key(
+        "agent",
+        "translate_query",
+        get_component_version(translate_query_for_search),
+        settings.extraction_llm_model,
+        _normalize_llm_text(query),
+        target_language.lower(),
+    )
+    cached_translation = await _get_cached_llm_reply(cache_key)
+    if cached_translation is not None:
+        return cached_translation
+
+    client = get_extraction_client()
 
     response = await client.chat.completions.create(
-        model="gpt-4o-mini",
+        model=settings.extraction_llm_model,
         messages=[
             {"role": "system", "content": f"""Translate the following product search query to {target_language}.
 Keep it natural for a product search - use common local terms.
@@ -352,7 +482,9 @@ Return ONLY the translated text, nothing else."""},
         max_tokens=200,
     )
 
-    return response.choices[0].message.content.strip()
+    translation = response.choices[0].message.content.strip()
+    await _set_cached_llm_reply(cache_key, translation)
+    return translation
 
 
 # ============================================================================
@@ -380,10 +512,7 @@ async def _research_and_discover_impl(
     Returns:
         JSON with researched criteria and product recommendations
     """
-    import structlog
-    import httpx
-
-    logger = structlog.get_logger()
+    timer = PhaseTimer()
     country_info = get_country_info(country)
     language = country_info["language"]
     lang_code = country_info["code"]
@@ -394,21 +523,32 @@ async def _research_and_discover_impl(
         f"Searching for expert recommendations in {language}..."
     )
 
-    # Detect product category using LLM (works for any product, any language)
-    category_key = await detect_category_with_llm(requirement)
+    async def load_category_criteria() -> tuple[str, list[dict]]:
+        # Detect product category using LLM (works for any product, any language)
+        category_key = await detect_category_with_llm(requirement)
 
-    await report_progress(
-        "📋 Category detected",
-        f"'{category_key}' - Loading or discovering criteria..."
-    )
+        await report_progress(
+            "📋 Category detected",
+            f"'{category_key}' - Loading or discovering criteria..."
+        )
 
-    # Get criteria from store, or discover and save if new category
-    category_criteria = await get_or_discover_criteria(category_key)
+        # Get criteria from store, or discover and save if new category
+        category_criteria = await get_or_discover_criteria(category_key)
 
-    if category_criteria:
-        await report_progress(
-            "✅ Criteria loaded",
-            f"{len(category_criteria)} criteria for {category_key}: {', '.join([c.get('name', '') for c in category_criteria[:5]])}"
+        if category_criteria:
+            await report_progress(
+                "✅ Criteria loaded",
+                f"{len(category_criteria)} criteria for {category_key}: {', '.join([c.get('name', '') for c in category_criteria[:5]])}"
+            )
+
+        return category_key, category_criteria
+
+    # Translate query to native language for better search results. It doesn't
+    # depend on the category, so it overlaps the category/criteria LLM calls.
+    with timer.phase("research.category"):
+        (category_key, category_criteria), native_query = await asyncio.gather(
+            load_category_criteria(),
+            translate_query_for_search(requirement, language),
         )
 
     # Collect research from web searches
@@ -419,9 +559,6 @@ async def _research_and_discover_impl(
         "social_mentions": [],
     }
 
-    # Translate query to native language for better search results
-    native_query = await translate_query_for_search(requirement, language)
-
     GOOGLE_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -429,47 +566,63 @@ async def _research_and_discover_impl(
     }
 
     # Generate search queries dynamically
-    search_queries = await _generate_research_queries_dynamic(
-        requirement, native_query, category_key, language, lang_code
-    )
+    with timer.phase("research.queries"):
+        search_queries = await _generate_research_queries_dynamic(
+            requirement, native_query, category_key, language, lang_code
+        )
 
-    for query_info in search_queries[:4]:  # Limit to 4 queries
-        try:
-            await report_progress(
-                "🔍 Searching",
-                f"{query_info['purpose']}: {query_info['query'][:50]}..."
-            )
+    async def run_research_query(query_info: dict) -> list[dict]:
+        await report_progress(
+            "🔍 Searching",
+            f"{query_info['purpose']}: {query_info['query'][:50]}..."
+        )
 
-            params = {
-                "q": query_info["query"],
-                "gl": country.lower(),
-                "hl": lang_code,
-                "num": 10,
-            }
+        params = {
+            "q": query_info["query"],
+            "gl": country.lower(),
+            "hl": lang_code,
+            "num": 10,
+        }
 
-            async with httpx.AsyncClient(timeout=15.0, headers=GOOGLE_HEADERS) as client:
-                response = await client.get("https://www.google.com/search", params=params)
-                if response.status_code == 200:
-                    html = response.text
+        response = await client.get(
+            "https://www.google.com/search", params=params, headers=GOOGLE_HEADERS
+        )
 
-                    # Parse search results from Google HTML
-                    # Extract titles, snippets, and URLs from search result divs
-                    results = _parse_google_search_results(html)
+        if response.status_code != 200:
+            return []
 
-                    for result in results[:5]:
-                        title = result.get("title", "")
-                        snippet = result.get("snippet", "")
-                        link = result.get("url", "")
+        await record_search("google_research", cached=False)
 
-                        if title and snippet:
-                            research_data[query_info["category"]].append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": link,
-                                "source_type": query_info["purpose"],
-                            })
+        # Parse search results from Google HTML
+        # Extract titles, snippets, and URLs from search result divs
+        return _parse_google_search_results(response.text)
 
-                    await record_search("google_research", cached=False)
+    # Run the research queries concurrently over the pooled client, so they
+    # reuse its connections to Google; results are collected in query order
+    client = get_research_http_client()
+    research_queries = search_queries[:4]  # Limit to 4 queries
+    with timer.phase("research.web"):
+        research_outcomes = await asyncio.gather(
+            *(run_research_query(q) for q in research_queries), return_exceptions=True
+        )
+
+    for query_info, results in zip(research_queries, research_outcomes):
+        try:
+            if isinstance(results, Exception):
+                raise results
+
+            for result in results[:5]:
+                title = result.get("title", "")
+                snippet = result.get("snippet", "")
+                link = result.get("url", "")
+
+                if title and snippet:
+                    research_data[query_info["category"]].append({
+                        "title": title,
+                        "snippet": snippet,
+                        "url": link,
+                        "source_type": query_info["purpose"],
+                    })
 
         except Exception as e:
             logger.warning("Research query failed", query=query_info["query"], error=str(e))
@@ -484,7 +637,11 @@ async def _research_and_discover_impl(
     try:
         client = get_openai_client()
 
-        research_summary = json.dumps(research_data, indent=2, ensure_ascii=False)
+        # Compact JSON without empty categories - this is LLM input only, so
+        # indentation would just cost prompt tokens
+        research_summary = orjson.dumps(
+            {k: v for k, v in research_data.items() if v}
+        ).decode()
 
         # Build category criteria section for prompt
         category_criteria_text = ""
@@ -599,24 +756,21 @@ REMEMBER:
 - Include ALL domain-specific criteria even if user didn't ask
 - Be transparent about which criteria came from user vs. domain knowledge"""
 
-        response = await client.chat.completions.create(
-            model="gpt-4o",  # Using GPT-4o for better research analysis
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=3000,
-        )
-
-        result_text = response.choices[0].message.content.strip()
-
-        # Clean up response
-        if result_text.startswith("```"):
-            result_text = re.sub(r'^```(?:json)?\n?', '', result_text)
-            result_text = re.sub(r'\n?```$', '', result_text)
+        with timer.phase("research.llm"):
+            response = await client.chat.completions.create(
+                model="gpt-4o",  # Using GPT-4o for better research analysis
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=3000,
+            )
 
-        result = json.loads(result_text)
+        with timer.phase("research.parse"):
+            result_text = response.choices[0].message.content.strip()
+            result_text = _strip_code_fence(result_text)
+            result = orjson.loads(result_text)
 
         # Add metadata
         result["country"] = country
@@ -644,13 +798,18 @@ REMEMBER:
                    user_criteria=user_criteria,
                    domain_criteria=domain_criteria,
                    research_quality=result.get("research_quality"))
+        await _report_timings("Research", timer)
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        # The agent's next step is search_products_smart; start its model
+        # searches now so they overlap the agent's LLM turn
+        _prefetch_model_searches(result, country)
+
+        return orjson.dumps(result).decode()
 
     except json.JSONDecodeError as e:
         logger.error("Failed to parse research JSON", error=str(e))
         await record_error(f"Research JSON error: {str(e)}")
-        return json.dumps({
+        return orjson.dumps({
             "category": "appliance",
             "criteria": [],
             "recommended_models": [],
@@ -658,12 +817,12 @@ REMEMBER:
             "error": f"Research analysis failed: {str(e)}",
             "original_requirement": requirement,
             "country": country,
-        }, ensure_ascii=False)
+        }).decode()
 
     except Exception as e:
         logger.error("Research failed", error=str(e))
         await record_error(f"Research failed: {str(e)[:100]}")
-        return json.dumps({
+        return orjson.dumps({
             "category": "appliance",
             "criteria": [],
             "recommended_models": [],
@@ -671,7 +830,7 @@ REMEMBER:
             "error": str(e),
             "original_requirement": requirement,
             "country": country,
-        }, ensure_ascii=False)
+        }).decode()
 
 
 def _parse_google_search_results(html: str) -> list[dict]:
@@ -679,8 +838,6 @@ def _parse_google_search_results(html: str) -> list[dict]:
 
     Extracts titles, snippets, and URLs from Google search result page.
     """
-    from bs4 import BeautifulSoup
-
     results = []
     soup = BeautifulSoup(html, "lxml")
 
@@ -692,13 +849,14 @@ def _parse_google_search_results(html: str) -> list[dict]:
         "div.tF2Cxc",  # Another common class
     ]
 
+    # Only the first 10 results are used, so stop the traversal there
     result_divs = []
     for selector in selectors:
-        result_divs = soup.select(selector)
+        result_divs = soup.select(selector, limit=10)
         if result_divs:
             break
 
-    for div in result_divs[:10]:
+    for div in result_divs:
         try:
             # Extract URL - look for the main link
             link_elem = div.select_one("a[href^='http']")
@@ -710,7 +868,8 @@ def _parse_google_search_results(html: str) -> list[dict]:
                 href = link_elem.get("href", "")
                 if href.startswith("/url?q="):
                     # Extract actual URL from Google redirect
-                    url = href.split("/url?q=")[1].split("&")[0]
+                    end = href.find("&", 7)
+                    url = href[7:end] if end != -1 else href[7:]
                 else:
                     url = href
 
@@ -767,10 +926,10 @@ async def _generate_research_queries_dynamic(
     This replaces hardcoded query templates with dynamic generation
     that works for any product category and language.
     """
-    client = get_openai_client()
+    client = get_extraction_client()
 
     response = await client.chat.completions.create(
-        model="gpt-4o-mini",
+        model=settings.extraction_llm_model,
         messages=[
             {"role": "system", "content": f"""Generate 4-5 search queries for product research.
 Target language: {language}
@@ -797,13 +956,10 @@ Return ONLY valid JSON, no markdown."""},
 
     result_text = response.choices[0].message.content.strip()
 
-    # Clean up response
-    if result_text.startswith("```"):
-        result_text = re.sub(r'^```(?:json)?\n?', '', result_text)
-        result_text = re.sub(r'\n?```$', '', result_text)
+    result_text = _strip_code_fence(result_text)
 
     try:
-        queries = json.loads(result_text)
+        queries = orjson.loads(result_text)
         return queries
     except json.JSONDecodeError:
         # Fallback: return basic queries
@@ -821,6 +977,26 @@ Return ONLY valid JSON, no markdown."""},
         ]
 
 
+# (English keyword, Hebrew product name) pairs, checked in order
+_HE_PRODUCT_HINTS = (
+    ("refrigerator", "מקרר"),
+    ("fridge", "מקרר"),
+    ("washing machine", "מכונת כביסה"),
+    ("dishwasher", "מדיח כלים"),
+    ("air conditioner", "מזגן"),
+    ("oven", "תנור"),
+    ("dryer", "מייבש כביסה"),
+)
+
+# (query template, purpose, research category) for English/other-language research
+_EN_QUERY_TEMPLATES = (
+    ("best {r} 2024 reviews recommendations", "Reviews and recommendations", "product_recommendations"),
+    ("{r} buying guide what to look for specifications", "Buying guide criteria", "buying_guides"),
+    ("{r} noise level decibel range typical", "Market noise level reality", "buying_guides"),
+    ("{r} expert recommendations reddit", "Community recommendations", "social_mentions"),
+)
+
+
 def _generate_research_queries(requirement: str, language: str, lang_code: str) -> list:
     """Generate research queries in the user's native language.
 
@@ -831,21 +1007,10 @@ def _generate_research_queries(requirement: str, language: str, lang_code: str)
     # Hebrew-specific queries for Israel
     if lang_code == "he":
         # Extract product type from requirement
-        product_hints = {
-            "refrigerator": "מקרר",
-            "fridge": "מקרר",
-            "washing machine": "מכונת כביסה",
-            "dishwasher": "מדיח כלים",
-            "air conditioner": "מזגן",
-            "oven": "תנור",
-            "dryer": "מייבש כביסה",
-        }
-
-        hebrew_product = None
-        for eng, heb in product_hints.items():
-            if eng in requirement.lower():
-                hebrew_product = heb
-                break
+        requirement_lower = requirement.lower()
+        hebrew_product = next(
+            (heb for eng, heb in _HE_PRODUCT_HINTS if eng in requirement_lower), None
+        )
 
         if hebrew_product:
             queries.extend([
@@ -900,28 +1065,10 @@ def _generate_research_queries(requirement: str, language: str, lang_code: str)
 
     else:
         # English or other language queries
-        queries.extend([
-            {
-                "query": f"best {requirement} 2024 reviews recommendations",
-                "purpose": "Reviews and recommendations",
-                "category": "product_recommendations"
-            },
-            {
-                "query": f"{requirement} buying guide what to look for specifications",
-                "purpose": "Buying guide criteria",
-                "category": "buying_guides"
-            },
-            {
-                "query": f"{requirement} noise level decibel range typical",
-                "purpose": "Market noise level reality",
-                "category": "buying_guides"
-            },
-            {
-                "query": f"{requirement} expert recommendations reddit",
-                "purpose": "Community recommendations",
-                "category": "social_mentions"
-            },
-        ])
+        queries.extend(
+            {"query": template.format(r=requirement), "purpose": purpose, "category": category}
+            for template, purpose, category in _EN_QUERY_TEMPLATES
+        )
 
     return queries
 
@@ -930,13 +1077,25 @@ def _generate_research_queries(requirement: str, language: str, lang_code: str)
 # Set DISABLE_AGENT_CACHE=true to disable caching for debugging
 _cache_disabled = os.environ.get("DISABLE_AGENT_CACHE", "").lower() in ("true", "1", "yes")
 
+
+def _is_cacheable_output(output: str) -> bool:
+    """Check whether a tool output may be cached.
+
+    Error outputs and searches that found nothing are usually transient (LLM
+    or scraper failures, timeouts), so they're recomputed on the next call
+    rather than served for the whole agent cache TTL.
+    """
+    data = orjson.loads(output)
+    return "error" not in data and data.get("products") != []
+
+
 if _cache_disabled:
     research_and_discover = function_tool(
         _research_and_discover_impl, name_override="research_and_discover"
     )
 else:
     _research_and_discover_cached = cached(
-        cache_type="agent", key_prefix="research_discover"
+        cache_type="agent", key_prefix="research_discover", should_cache=_is_cacheable_output
     )(_research_and_discover_impl)
     research_and_discover = function_tool(
         _research_and_discover_cached, name_override="research_and_discover"
@@ -947,6 +1106,142 @@ else:
 # Tool 2: Smart Product Search
 # ============================================================================
 
+@asynccontextmanager
+async def _progress_queue() -> AsyncIterator[Callable[[str, str], None]]:
+    """Report progress through a queue drained by one background task.
+
+    Yields a non-blocking progress(name, output) callable, so the search
+    fan-out doesn't wait on the trace store between queries. Spans are
+    written in order, and the queue is flushed before the block exits.
+    """
+    queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+
+    async def drain() -> None:
+        while (item := await queue.get()) is not None:
+            await report_progress(*item)
+
+    def progress(name: str, output: str) -> None:
+        queue.put_nowait((name, output))
+
+    consumer = asyncio.create_task(drain())
+    try:
+        yield progress
+    finally:
+        queue.put_nowait(None)
+        await consumer
+
+
+# Max results per scraper for the specific_model strategy
+_MODEL_SEARCH_MAX_RESULTS = 8
+# Prefetched searches not picked up within this long are dropped
+_PREFETCH_TTL_SECONDS = 120.0
+# (country, scraper name, query, max_results) -> (monotonic start time, search task)
+_prefetched_searches: dict[tuple[str, str, str, int], tuple[float, asyncio.Task]] = {}
+
+
+def _model_search_queries(research: dict) -> list[str]:
+    """Get the specific-model queries search_products_smart runs first."""
+    queries = [m.get("model") for m in research.get("recommended_models", []) if m.get("model")]
+    queries.extend(research.get("search_terms", {}).get("model_searches", []))
+    return queries[:10]
+
+
+def _evict_stale_prefetches(now: float) -> None:
+    """Cancel and drop prefetched searches not claimed within the TTL."""
+    for key, (started, task) in list(_prefetched_searches.items()):
+        if now - started > _PREFETCH_TTL_SECONDS:
+            task.cancel()
+            del _prefetched_searches[key]
+
+
+def _prefetch_model_searches(research: dict, country: str) -> None:
+    """Start the specific-model searches for a research result in the background.
+
+    research_and_discover calls this with its result, so the scrapers work
+    while the agent LLM plans its search_products_smart call, which then
+    picks the searches up instead of starting them itself.
+    """
+    now = time.monotonic()
+    _evict_stale_prefetches(now)
+
+    if not settings.scraper_prefetch_enabled:
+        return
+
+    queries = _model_search_queries(research)
+    for scraper in ScraperRegistry.get_scrapers_for_country(country):
+        for query in queries:
+            key = (country, scraper.name, query, _MODEL_SEARCH_MAX_RESULTS)
+            if key not in _prefetched_searches:
+                task = asyncio.create_task(
+                    run_scraper(scraper, query, _MODEL_SEARCH_MAX_RESULTS)
+                )
+                _prefetched_searches[key] = (now, task)
+
+
+def _take_prefetched_search(
+    country: str,
+    scraper_name: str,
+    query: str,
+    max_results: int,
+) -> asyncio.Task | None:
+    """Claim a prefetched search, if one is still fresh."""
+    _evict_stale_prefetches(time.monotonic())
+    entry = _prefetched_searches.pop((country, scraper_name, query, max_results), None)
+    return entry[1] if entry is not None else None
+
+
+def reset_prefetched_searches() -> None:
+    """Cancel and drop all prefetched searches (for testing)."""
+    for _, task in _prefetched_searches.values():
+        task.cancel()
+    _prefetched_searches.clear()
+
+
+async def _search_all_scrapers(
+    scrapers: list[BaseScraper],
+    query: str,
+    max_results: int,
+    country: str,
+    timer: PhaseTimer | None = None,
+) -> list[tuple[BaseScraper, list[PriceOption] | Exception]]:
+    """Run one query on all scrapers concurrently.
+
+    Each scraper is capped at settings.scraper_timeout_seconds, so one slow
+    site bounds the query's latency instead of stalling it. Searches already
+    prefetched by research_and_discover are reused rather than repeated.
+
+    Returns:
+        (scraper, results or exception) pairs, in scraper order
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            _take_prefetched_search(country, s.name, query, max_results)
+            or tg.create_task(run_scraper(s, query, max_results, timer))
+            for s in scrapers
+        ]
+    # Prefetched tasks aren't part of the group, so they may still be running
+    return [(scraper, await task) for scraper, task in zip(scrapers, tasks)]
+
+
+def _search_attempt(
+    query: str,
+    strategy: str,
+    outcomes: list[tuple[BaseScraper, list[PriceOption] | Exception]],
+) -> dict:
+    """Summarize one query's scraper outcomes as a search_attempts entry."""
+    scrapers = [
+        {"name": scraper.name, "count": len(results)}
+        for scraper, results in outcomes
+        if results and not isinstance(results, Exception)
+    ]
+    return {
+        "query": query,
+        "strategy": strategy,
+        "results": sum(s["count"] for s in scrapers),
+        "scrapers": scrapers,
+    }
+
+
 async def _search_products_smart_impl(
     research_json: str,
     country: str = "IL",
@@ -967,195 +1262,414 @@ async def _search_products_smart_impl(
     Returns:
         JSON with search results and metadata about what was searched
     """
-    import structlog
-    from src.tools.scraping.filters import deduplicate_results
-
-    logger = structlog.get_logger()
-
     try:
-        research = json.loads(research_json)
+        research = orjson.loads(research_json)
     except json.JSONDecodeError:
-        return json.dumps({
+        return orjson.dumps({
             "error": "Invalid research JSON",
             "products": [],
             "search_attempts": [],
-        })
+        }).decode()
 
     search_terms = research.get("search_terms", {})
-    recommended_models = research.get("recommended_models", [])
     category = research.get("category", "product")
 
     scrapers = ScraperRegistry.get_scrapers_for_country(country)
 
     if not scrapers:
-        return json.dumps({
+        return orjson.dumps({
             "error": f"No scrapers available for country: {country}",
             "products": [],
             "search_attempts": [],
-        })
+        }).decode()
+
+    model_searches = _model_search_queries(research)
+    native_terms = search_terms.get("native_language", search_terms.get("local_language", []))
+    category_terms = search_terms.get("category_searches", [])
+    broad_max = max(8, max_results // 2)
+
+    # Strategies in priority order:
+    # (strategy, queries, max results per scraper, progress label, report per-scraper hits)
+    strategies = (
+        ("specific_model", model_searches, _MODEL_SEARCH_MAX_RESULTS, "🔍 Model search", True),
+        ("local_language", native_terms[:5], broad_max, "🔍 Local search", True),
+        ("category", category_terms[:4], broad_max, "🔍 Category search", False),
+    )
+    searches = [
+        (strategy, query, cap, label, report_hits)
+        for strategy, queries, cap, label, report_hits in strategies
+        for query in queries
+    ]
 
+    timer = PhaseTimer()
     all_results = []
-    search_attempts = []
+    search_attempts: list[dict] = []
+    # Deduplicate by URL, not name. Stores hash(url) ints rather than URL
+    # strings - the set never leaves this call, so process-local hashing is fine.
+    seen_urls: set[int] = set()
+    # Seller/price-bucket dedup in the same pass (same rules as deduplicate_results)
+    deduplicator = ResultDeduplicator()
+
+    def add_unseen(results: list[PriceOption]) -> None:
+        """Add results to all_results, dropping repeated URLs and seller/price duplicates."""
+        for result in results:
+            # Results without a URL are never URL-deduplicated (the "" key was
+            # always skipped); only the seller/price dedup below applies to them
+            if result.url:
+                url_key = hash(result.url.lower())
+                if url_key in seen_urls:
+                    continue
+                seen_urls.add(url_key)
+            if deduplicator.accept(result):
+                all_results.append(result)
+
+    async with _progress_queue() as progress:
+        async def run_search(query: str, cap: int, label: str) -> list[tuple]:
+            progress(label, f"Searching: {query}")
+            return await _search_all_scrapers(
+                scrapers, query, max_results=cap, country=country, timer=timer
+            )
 
-    # Strategy 1: Search for specific recommended models
-    model_searches = [m.get("model") for m in recommended_models if m.get("model")]
-    model_searches.extend(search_terms.get("model_searches", []))
+        # Every query of every strategy runs concurrently; outcomes are then
+        # ingested in priority order so earlier strategies win URL dedup
+        with timer.phase("search.scrapers"):
+            all_outcomes = await asyncio.gather(
+                *(run_search(query, cap, label) for _, query, cap, label, _ in searches)
+            )
 
-    for model in model_searches[:10]:  # Search up to 10 models
-        await report_progress(
-            "🔍 Model search",
-            f"Looking for: {model}"
+        with timer.phase("search.dedup"):
+            for (strategy, query, _, _, report_hits), outcomes in zip(searches, all_outcomes):
+                for scraper, results in outcomes:
+                    if isinstance(results, Exception):
+                        logger.warning(
+                            "Search failed",
+                            strategy=strategy,
+                            query=query,
+                            scraper=scraper.name,
+                            error=str(results) or type(results).__name__,
+                        )
+                        continue
+
+                    await record_search(scraper.name, cached=False)
+
+                    if results:
+                        if report_hits:
+                            progress(
+                                f"✅ {scraper.name}",
+                                f"Found {len(results)} for '{query}'"
+                            )
+                        add_unseen(results)
+
+                search_attempts.append(_search_attempt(query, strategy, outcomes))
+
+        # Filter by category to remove wrong product types BEFORE LLM analysis
+        if all_results and category:
+            original_count = len(all_results)
+            with timer.phase("search.filter"):
+                all_results = filter_by_category(all_results, category, logger)
+            if len(all_results) < original_count:
+                progress(
+                    "🔍 Category filter",
+                    f"Filtered {original_count - len(all_results)} products not matching '{category}'"
+                )
+
+        # Convert to simple format
+        products = []
+        products_append = products.append
+
+        with timer.phase("search.format"):
+            for result in all_results[:max_results]:
+                seller = result.seller
+                # Use product_name if available, otherwise fall back to seller name
+                name = result.product_name or seller.name
+                brand, model_number = extract_brand_and_model(name)
+                products_append({
+                    "name": name,
+                    "brand": brand,
+                    "model_number": model_number,
+                    "price": result.listed_price,
+                    "currency": result.currency,
+                    "url": result.url,
+                    "source": seller.source,
+                    "rating": seller.reliability_score,
+                })
+
+        total_attempts = len(search_attempts)
+        successful_attempts = sum(1 for a in search_attempts if a["results"] > 0)
+
+        progress(
+            "✅ Search complete",
+            f"Found {len(products)} products from {successful_attempts}/{total_attempts} searches"
         )
 
-        attempt = {"query": model, "strategy": "specific_model", "results": 0, "scrapers": []}
+    await _report_timings("Search", timer)
 
-        for scraper in scrapers:
-            try:
-                results = await scraper.search(model, max_results=8)
-                await record_search(scraper.name, cached=False)
+    return orjson.dumps({
+        "category": category,
+        "products": products,
+        "total_found": len(products),
+        "search_attempts": search_attempts,
+        "country": country,
+    }).decode()
 
-                if results:
-                    await report_progress(
-                        f"✅ {scraper.name}",
-                        f"Found {len(results)} for '{model}'"
-                    )
-                    all_results.extend(results)
-                    attempt["results"] += len(results)
-                    attempt["scrapers"].append({"name": scraper.name, "count": len(results)})
 
-            except Exception as e:
-                logger.warning("Model search failed", model=model, scraper=scraper.name, error=str(e))
+if _cache_disabled:
+    search_products_smart = function_tool(
+        _search_products_smart_impl, name_override="search_products_smart"
+    )
+else:
+    _search_products_smart_cached = cached(
+        cache_type="agent", key_prefix="search_smart", should_cache=_is_cacheable_output
+    )(_search_products_smart_impl)
+    search_products_smart = function_tool(
+        _search_products_smart_cached, name_override="search_products_smart"
+    )
 
-        search_attempts.append(attempt)
 
-    # Strategy 2: Search using native language terms
-    native_terms = search_terms.get("native_language", search_terms.get("local_language", []))
+# ============================================================================
+# Tool 3: Analyze, Score, and Format Results
+# ============================================================================
 
-    for term in native_terms[:5]:  # Search up to 5 native language terms
-        await report_progress(
-            "🔍 Local search",
-            f"Searching: {term}"
-        )
+# Static so it forms an identical prefix on every analysis call, which lets
+# OpenAI's automatic prompt caching reuse it; per-request data (category,
+# country, units, criteria, products) goes in the user message.
+_ANALYSIS_SYSTEM_PROMPT = """You are a product analyst using ADAPTIVE FILTERING.
 
-        attempt = {"query": term, "strategy": "local_language", "results": 0, "scrapers": []}
+Your job is to:
+1. FIRST: Validate criteria for logical impossibilities (e.g., "dishwasher without electricity" - all dishwashers require electricity)
+2. CATEGORY FILTER: ONLY analyze products that match the REQUESTED CATEGORY
+3. Score products against VALID criteria
+4. If strict criteria eliminate all products, RELAX criteria based on market reality
+5. Always return the BEST AVAILABLE products, even if they don't perfectly match
 
-        for scraper in scrapers:
-            try:
-                results = await scraper.search(term, max_results=max(8, max_results // 2))
-                await record_search(scraper.name, cached=False)
+CRITICAL - CATEGORY MATCHING (STRICT ENFORCEMENT):
+- The user's requirement and the REQUESTED CATEGORY are given in the user message
+- You MUST determine the TRUE category of each product from its Hebrew/English name
+- Hebrew category keywords to EXCLUDE unless they match the REQUESTED CATEGORY:
+  * מדיח כלים = dishwasher
+  * מעבד מזון = food processor
+  * מיקסר = mixer
+  * שואב אבק = vacuum cleaner
+  * קולט אדים = range hood
+  * תנור = oven
+  * מקרר = refrigerator
+  * מייבש = dryer
+  * מכונת כביסה = washing machine
+- ONLY include products whose TRUE category matches the REQUESTED CATEGORY
+- If a product name contains keywords for a DIFFERENT appliance category, SKIP IT completely
+- Do NOT just copy the requested category - actually verify each product
 
-                if results:
-                    await report_progress(
-                        f"✅ {scraper.name}",
-                        f"Found {len(results)} for '{term}'"
-                    )
-                    all_results.extend(results)
-                    attempt["results"] += len(results)
-                    attempt["scrapers"].append({"name": scraper.name, "count": len(results)})
+CRITICAL - RETURN DIFFERENT MODELS:
+- You MUST return 5 DIFFERENT product models (different brands or model numbers)
+- Do NOT return the same model multiple times even if it's available at different stores
+- Each product in your output must be a UNIQUE model
+- Prioritize variety: different brands, different price points, different feature sets
+- If products list has duplicates, SKIP the duplicates and find unique models
 
-            except Exception as e:
-                logger.warning("Local search failed", term=term, scraper=scraper.name, error=str(e))
+CRITICAL - ONLY USE PRODUCTS FROM "PRODUCTS FOUND" LIST:
+- You may ONLY return products that appear in the "PRODUCTS FOUND IN LOCAL STORES" list
+- Do NOT include any product that wasn't found in local stores, even if it's in recommended models
+- If a recommended model wasn't found in stores, it means it's NOT AVAILABLE in the user's country - DO NOT include it
+- The recommended models list is ONLY for prioritization - a product must be in "PRODUCTS FOUND" to be returned
 
-        search_attempts.append(attempt)
+CRITERIA VALIDATION:
+- If a criterion is physically/logically impossible, IGNORE IT and note why in filtering_notes
+- Examples of impossible criteria: "dishwasher without electricity", "silent jackhammer", "waterproof paper"
+- Do NOT claim products meet impossible criteria - be honest that the criterion was ignored
 
-    # Strategy 3: Category searches
-    category_terms = search_terms.get("category_searches", [])
+ADAPTIVE FILTERING RULES:
+- If criteria specify "< 40dB" but best available is 42dB, accept 42dB as "best in market"
+- Explain the adaptation: "While you requested <40dB, the quietest available in <country> is 42dB"
+- Prioritize products that are relatively best, not just those matching absolute criteria
+- Include market_reality_note explaining any adaptations made
+- Use the UNITS given in the user message for volumes, dimensions and prices
 
-    for term in category_terms[:4]:  # Search up to 4 category terms
-        await report_progress(
-            "🔍 Category search",
-            f"Searching: {term}"
-        )
+Output:
+{
+  "products": [
+    {
+      "id": "prod_<timestamp>_<index>",
+      "name": "full product name",
+      "brand": "brand",
+      "model_number": "model if found - MUST BE UNIQUE",
+      "category": "<REQUESTED CATEGORY>",
+      "key_specs": ["Capacity: 8kg", "Noise: 52dB", "Energy: A+++"],
+      "price_range": "<currency symbol>X,XXX",
+      "criteria_match": {
+        "matched": ["which criteria this product meets"],
+        "adapted": ["criteria relaxed due to market reality"],
+        "unknown": ["criteria that can't be verified"],
+        "unmet": ["criteria definitely not met"]
+      },
+      "match_score": "high/medium/low",
+      "why_recommended": "explanation - if adapted, explain why this is the best available option",
+      "market_reality_note": "optional - explain any criteria adaptation (e.g., 'Quietest available in Israel at 42dB')"
+    }
+  ],
+  "filtering_notes": "explain any adaptive filtering applied (e.g., 'Relaxed noise criteria from <40dB to <43dB as no products under 40dB available in Israel')"
+}
 
-        attempt = {"query": term, "strategy": "category", "results": 0, "scrapers": []}
+KEY_SPECS REQUIREMENTS:
+- key_specs MUST contain actual values for each product, NOT empty arrays
+- Use format "Attribute: Value" for each spec (e.g., "Capacity: 8kg", "Noise: 52dB")
+- Include specs for the main criteria from the FULL CRITERIA list
+- Use your knowledge of the product model to infer specs (e.g., Bosch WAN24170BY has 8kg capacity)
+- If you don't know a spec value, omit it (don't say "unknown")
+- Common appliance specs to include: Capacity, Noise Level, Energy Class, Dimensions, RPM, Programs
 
-        for scraper in scrapers:
-            try:
-                results = await scraper.search(term, max_results=max(8, max_results // 2))
-                await record_search(scraper.name, cached=False)
+IMPORTANT:
+- FIRST: Filter out ANY product that is NOT in the REQUESTED CATEGORY - check Hebrew names carefully!
+- Return EXACTLY 5 DIFFERENT models (unique brand+model combinations), or all available if fewer than 5 unique models of the REQUESTED CATEGORY exist
+- Each model MUST have a unique model_number - no duplicates; do NOT return the same model from different stores
+- NEVER return empty products if there are products of the REQUESTED CATEGORY available - adapt criteria instead
+- If NO products match the REQUESTED CATEGORY, return empty products array and explain in filtering_notes
+- If a product matches a recommended model, prioritize it
+- Be honest about what can't be verified from the product name
+- Prices should use the currency symbol from the UNITS section
+- Add market_reality_note when criteria were adapted
+- Include model_diversity_note confirming the 5 models are unique
 
-                if results:
-                    all_results.extend(results)
-                    attempt["results"] += len(results)
-                    attempt["scrapers"].append({"name": scraper.name, "count": len(results)})
+Respond with valid JSON only."""
 
-            except Exception as e:
-                logger.warning("Category search failed", term=term, scraper=scraper.name, error=str(e))
+# Product fields the analysis prompt needs; the rest (rating, etc.) and
+# empty values are dropped to keep the prompt small.
+_PROMPT_PRODUCT_FIELDS = ("name", "brand", "model_number", "price", "currency", "url", "source")
 
-        search_attempts.append(attempt)
 
-    # Deduplicate results
-    if all_results:
-        all_results = deduplicate_results(all_results)
+# Products sent to the analysis LLM, picked by _prescore_product; 3x the five
+# models it must return leaves room for category filtering and dedup
+_ANALYSIS_MAX_PRODUCTS = 15
 
-    # Filter by category to remove wrong product types BEFORE LLM analysis
-    if all_results and category:
-        original_count = len(all_results)
-        all_results = filter_by_category(all_results, category, logger)
-        if len(all_results) < original_count:
-            await report_progress(
-                "🔍 Category filter",
-                f"Filtered {original_count - len(all_results)} products not matching '{category}'"
-            )
 
-    # Convert to simple format
-    products = []
-    seen_urls = set()  # Deduplicate by URL, not name
+def _prescore_product(
+    product: dict,
+    recommended_models: list[str],
+    recommended_brands: set[str],
+) -> int:
+    """Cheap relevance score used to pick which products the analysis LLM sees.
 
-    for result in all_results[:max_results]:
-        # Skip if we've already seen this exact URL
-        url_key = (result.url or "").lower()[:100]
-        if url_key and url_key in seen_urls:
-            continue
-        if url_key:
-            seen_urls.add(url_key)
-
-        # Use product_name if available, otherwise fall back to seller name
-        name = result.product_name or result.seller.name
-        products.append({
-            "name": name,
-            "brand": extract_brand(name),
-            "model_number": extract_model_number(name),
-            "price": result.listed_price,
-            "currency": result.currency,
-            "url": result.url,
-            "source": result.seller.source,
-            "rating": result.seller.reliability_score,
-        })
+    +3 for matching a recommended model, +2 for having a model number at all,
+    +1 for a brand the research recommended.
 
-    total_attempts = len(search_attempts)
-    successful_attempts = sum(1 for a in search_attempts if a["results"] > 0)
+    Args:
+        product: Product dict from search_products_smart
+        recommended_models: Lowercased recommended model names
+        recommended_brands: Lowercased recommended brand names
+    """
+    score = 0
+    model = (product.get("model_number") or "").lower()
+    if model:
+        score += 2
+        if any(model in rec or rec in model for rec in recommended_models):
+            score += 3
+    brand = (product.get("brand") or "").lower()
+    if brand and brand in recommended_brands:
+        score += 1
+    return score
+
+
+def _slim_products(products: list[dict]) -> list[dict]:
+    """Reduce products to the non-empty fields sent to the analysis LLM."""
+    return [
+        {k: p[k] for k in _PROMPT_PRODUCT_FIELDS if p.get(k) is not None}
+        for p in products
+    ]
 
-    await report_progress(
-        "✅ Search complete",
-        f"Found {len(products)} products from {successful_attempts}/{total_attempts} searches"
-    )
 
-    return json.dumps({
-        "category": category,
-        "products": products,
-        "total_found": len(products),
-        "search_attempts": search_attempts,
-        "country": country,
-    }, indent=2, ensure_ascii=False)
+def _canonical_list(items: list) -> list[str]:
+    """Order-independent representation of a list of JSON values."""
+    return sorted(orjson.dumps(item, option=orjson.OPT_SORT_KEYS).decode() for item in items)
 
 
-if _cache_disabled:
-    search_products_smart = function_tool(
-        _search_products_smart_impl, name_override="search_products_smart"
-    )
-else:
-    _search_products_smart_cached = cached(
-        cache_type="agent", key_prefix="search_smart"
-    )(_search_products_smart_impl)
-    search_products_smart = function_tool(
-        _search_products_smart_cached, name_override="search_products_smart"
+def _analysis_cache_key(
+    requirement: str,
+    category: str,
+    country: str,
+    criteria_transparency: dict,
+    criteria: list,
+    market_notes: str,
+    recommended_models: list,
+    products: list,
+) -> str:
+    """Build a stable cache key for the analysis LLM call.
+
+    Lists are sorted and dict keys normalized, so semantically identical
+    inputs map to the same key regardless of JSON formatting or ordering.
+    The version hash invalidates entries when the prompt code changes.
+    """
+    return make_cache_key(
+        "agent",
+        "analyze_llm",
+        get_component_version(_analyze_and_format_results_impl),
+        requirement,
+        category,
+        country,
+        orjson.dumps(criteria_transparency, option=orjson.OPT_SORT_KEYS).decode(),
+        _canonical_list(criteria),
+        market_notes,
+        _canonical_list(recommended_models),
+        _canonical_list(products),
     )
 
 
-# ============================================================================
-# Tool 3: Analyze, Score, and Format Results
-# ============================================================================
+def _prepare_analysis_inputs(
+    research_json: str,
+    products_json: str,
+) -> tuple[dict, dict, list[dict], int, list[str]]:
+    """Parse the analysis inputs, dedup products and build criteria feedback.
+
+    Pure CPU work; the analyze tool runs it via asyncio.to_thread so large
+    product lists don't block concurrent scraping on the event loop.
+
+    Returns:
+        (research, search_results, deduplicated products, unique model count,
+        criteria feedback lines)
+
+    Raises:
+        json.JSONDecodeError: If either input is not valid JSON
+    """
+    research = orjson.loads(research_json)
+    search_results = orjson.loads(products_json)
+
+    # Deduplicate products by model number (keep the one with lowest price).
+    # Single pass: dict insertion order keeps each key at its first-seen slot.
+    seen_models: dict[str, dict] = {}
+    unkeyed_products = []
+    for product in search_results.get("products", []):
+        model = product.get("model_number") or product.get("model") or ""
+        name = product.get("name", "")
+
+        # Create a key from model or product name
+        key = model.lower().strip() if model else name.lower().strip()
+        if not key:
+            unkeyed_products.append(product)
+            continue
+
+        existing = seen_models.get(key)
+        if existing is None:
+            seen_models[key] = product
+        elif (product.get("price") or float("inf")) < (existing.get("price") or float("inf")):
+            # Replace with cheaper option
+            seen_models[key] = product
+
+    deduplicated_products = [*seen_models.values(), *unkeyed_products]
+
+    # Criteria lines with market context, for the search summary feedback
+    criteria_with_context = []
+    for c in research.get("criteria", []):
+        criterion_text = f"• {c.get('attribute')}: "
+        if c.get('market_value'):
+            criterion_text += f"{c.get('market_value')} (market reality)"
+            if c.get('market_context'):
+                criterion_text += f" - {c.get('market_context')}"
+        elif c.get('value'):
+            criterion_text += f"{c.get('value')} ({c.get('source', 'research')})"
+        else:
+            criterion_text += f"{c.get('ideal_value', 'N/A')}"
+        criteria_with_context.append(criterion_text)
+
+    return research, search_results, deduplicated_products, len(seen_models), criteria_with_context
+
 
 async def _analyze_and_format_results_impl(
     research_json: str,
@@ -1177,23 +1691,27 @@ async def _analyze_and_format_results_impl(
     Returns:
         JSON with products array and search summary for frontend
     """
-    import structlog
-    logger = structlog.get_logger()
-
     await report_progress(
         "📊 Analyzing",
         "Scoring products against criteria..."
     )
 
+    timer = PhaseTimer()
     try:
-        research = json.loads(research_json)
-        search_results = json.loads(products_json)
+        with timer.phase("analyze.prepare"):
+            (
+                research,
+                search_results,
+                deduplicated_products,
+                unique_models,
+                criteria_with_context,
+            ) = await asyncio.to_thread(_prepare_analysis_inputs, research_json, products_json)
     except json.JSONDecodeError as e:
         logger.error("Failed to parse input JSON", error=str(e))
-        return json.dumps({
+        return orjson.dumps({
             "products": [],
             "search_summary": {"error": f"Invalid input: {str(e)}"},
-        })
+        }).decode()
 
     products = search_results.get("products", [])
     criteria = research.get("criteria", [])
@@ -1202,32 +1720,10 @@ async def _analyze_and_format_results_impl(
     category = research.get("category", "product")
     country = research.get("country", "IL")
     country_info = get_country_info(country)
-
-    # Deduplicate products by model number (keep the one with lowest price)
-    seen_models: dict[str, dict] = {}
-    deduplicated_products = []
-    for product in products:
-        model = product.get("model_number") or product.get("model") or ""
-        name = product.get("name", "")
-
-        # Create a key from model or product name
-        key = model.lower().strip() if model else name.lower().strip()
-        if not key:
-            deduplicated_products.append(product)
-            continue
-
-        if key in seen_models:
-            # Keep the one with lower price
-            existing_price = seen_models[key].get("price") or float("inf")
-            new_price = product.get("price") or float("inf")
-            if new_price < existing_price:
-                # Replace with cheaper option
-                deduplicated_products = [p for p in deduplicated_products if p != seen_models[key]]
-                deduplicated_products.append(product)
-                seen_models[key] = product
-        else:
-            seen_models[key] = product
-            deduplicated_products.append(product)
+    currency = country_info["currency"]
+    currency_name = country_info["currency_name"]
+    volume_unit = country_info["volume_unit"]
+    dimension_unit = country_info["dimension_unit"]
 
     if len(products) != len(deduplicated_products):
         logger.info(
@@ -1240,18 +1736,6 @@ async def _analyze_and_format_results_impl(
     # Build search summary (always included)
     # Include market context from criteria
     market_notes = research.get("market_notes", "")
-    criteria_with_context = []
-    for c in criteria:
-        criterion_text = f"• {c.get('attribute')}: "
-        if c.get('market_value'):
-            criterion_text += f"{c.get('market_value')} (market reality)"
-            if c.get('market_context'):
-                criterion_text += f" - {c.get('market_context')}"
-        elif c.get('value'):
-            criterion_text += f"{c.get('value')} ({c.get('source', 'research')})"
-        else:
-            criterion_text += f"{c.get('ideal_value', 'N/A')}"
-        criteria_with_context.append(criterion_text)
 
     search_summary = {
         "original_requirement": original_requirement,
@@ -1262,7 +1746,7 @@ async def _analyze_and_format_results_impl(
         "recommended_models_searched": [m.get("model") for m in recommended_models],
         "search_attempts": search_results.get("search_attempts", []),
         "total_products_found": len(products),
-        "unique_models_found": len(seen_models),
+        "unique_models_found": unique_models,
         "research_quality": research.get("research_quality", "unknown"),
         "market_notes": market_notes,
     }
@@ -1281,165 +1765,102 @@ async def _analyze_and_format_results_impl(
             suggestions.append(f"Search directly for: {', '.join([m.get('model', '') for m in recommended_models[:3]])}")
         suggestions.append("Try different keywords or product description")
 
-        return json.dumps({
+        return orjson.dumps({
             "products": [],
             "search_summary": search_summary,
             "no_results_message": f"No products found matching '{original_requirement}'",
             "suggestions": suggestions,
             "criteria_feedback": criteria_with_context,
             "market_notes": market_notes,
-        }, indent=2, ensure_ascii=False)
+        }).decode()
 
     # Analyze products with LLM - using ADAPTIVE FILTERING
     try:
-        client = get_openai_client()
-
         # Get criteria transparency info
         criteria_transparency = research.get("criteria_transparency", {})
 
-        system_prompt = f"""You are a product analyst using ADAPTIVE FILTERING.
-
-Your job is to:
-1. FIRST: Validate criteria for logical impossibilities (e.g., "dishwasher without electricity" - all dishwashers require electricity)
-2. CATEGORY FILTER: ONLY analyze products that match the requested category "{category}"
-3. Score products against VALID criteria
-4. If strict criteria eliminate all products, RELAX criteria based on market reality
-5. Always return the BEST AVAILABLE products, even if they don't perfectly match
-
-CRITICAL - CATEGORY MATCHING (STRICT ENFORCEMENT):
-- The user requested: "{original_requirement}"
-- This is a {category} search
-- You MUST determine the TRUE category of each product from its Hebrew/English name
-- Hebrew category keywords to EXCLUDE for {category} search:
-  * מדיח כלים = dishwasher (NOT {category} unless searching for dishwasher)
-  * מעבד מזון = food processor (NOT {category})
-  * מיקסר = mixer (NOT {category})
-  * שואב אבק = vacuum cleaner (NOT {category})
-  * קולט אדים = range hood (NOT {category})
-  * תנור = oven (NOT {category} unless searching for oven)
-  * מקרר = refrigerator (NOT {category} unless searching for refrigerator)
-  * מייבש = dryer (NOT {category} unless searching for dryer)
-  * מכונת כביסה = washing machine
-- ONLY include products whose TRUE category matches "{category}"
-- If a product name contains keywords for a DIFFERENT appliance category, SKIP IT completely
-- Do NOT just copy the requested category - actually verify each product
+        # Stage 1: cheap heuristic ranking, so the gpt-4o call only scores the
+        # most promising candidates. nlargest keeps only the top entries (no
+        # full sort) and, like a stable sort, keeps search order among ties
+        rec_models = [m["model"].lower() for m in recommended_models if m.get("model")]
+        rec_brands = {m["brand"].lower() for m in recommended_models if m.get("brand")}
+        with timer.phase("analyze.prescore"):
+            prescores = [_prescore_product(p, rec_models, rec_brands) for p in products]
+            ranked = heapq.nlargest(
+                _ANALYSIS_MAX_PRODUCTS, range(len(products)), key=prescores.__getitem__
+            )
+        candidates = [products[i] for i in ranked]
+        logger.info(
+            "Pre-scored products for analysis",
+            total=len(products),
+            sent=len(candidates),
+            top_score=prescores[ranked[0]],
+            recommended_matches=sum(1 for score in prescores if score >= 5),
+        )
 
-CRITICAL - RETURN DIFFERENT MODELS:
-- You MUST return 5 DIFFERENT product models (different brands or model numbers)
-- Do NOT return the same model multiple times even if it's available at different stores
-- Each product in your output must be a UNIQUE model
-- Prioritize variety: different brands, different price points, different feature sets
-- If products list has duplicates, SKIP the duplicates and find unique models
+        prompt_products = _slim_products(candidates)
+        products_blob = orjson.dumps(prompt_products).decode()
+        other_volume_unit = "cubic feet" if volume_unit == "liters" else "liters"
 
-CRITERIA VALIDATION:
-- If a criterion is physically/logically impossible, IGNORE IT and note why in filtering_notes
-- Examples of impossible criteria: "dishwasher without electricity", "silent jackhammer", "waterproof paper"
-- Do NOT claim products meet impossible criteria - be honest that the criterion was ignored
+        # Only per-request data goes in the user message; the static rules and
+        # output format stay in _ANALYSIS_SYSTEM_PROMPT as a cacheable prefix
+        user_prompt = f"""Analyze these products for: "{original_requirement}"
 
-ADAPTIVE FILTERING RULES:
-- If criteria specify "< 40dB" but best available is 42dB, accept 42dB as "best in market"
-- Explain the adaptation: "While you requested <40dB, the quietest available in {country} is 42dB"
-- Prioritize products that are relatively best, not just those matching absolute criteria
-- Include market_reality_note explaining any adaptations made
+REQUESTED CATEGORY: {category}
+USER COUNTRY: {country}
 
 UNITS - Use {country}'s measurement system:
-- Volume: {country_info['volume_unit']} (NOT {('cubic feet' if country_info['volume_unit'] == 'liters' else 'liters')})
-- Dimensions: {country_info['dimension_unit']}
-- Currency for prices: {country_info['currency']} ({country_info['currency_name']})
-
-Respond with valid JSON only."""
-
-        user_prompt = f"""Analyze these products for: "{original_requirement}"
+- Volume: {volume_unit} (NOT {other_volume_unit})
+- Dimensions: {dimension_unit}
+- Currency for prices: {currency} ({currency_name})
 
 CRITERIA TRANSPARENCY:
-- User specified: {json.dumps(criteria_transparency.get('user_specified', []), ensure_ascii=False)}
-- Domain knowledge added: {json.dumps(criteria_transparency.get('domain_added', []), ensure_ascii=False)}
+- User specified: {orjson.dumps(criteria_transparency.get('user_specified', [])).decode()}
+- Domain knowledge added: {orjson.dumps(criteria_transparency.get('domain_added', [])).decode()}
 
 FULL CRITERIA (may include market context):
-{json.dumps(criteria, indent=2, ensure_ascii=False)}
+{orjson.dumps(criteria).decode()}
 
 MARKET NOTES:
 {market_notes}
 
 RECOMMENDED MODELS FROM RESEARCH (use for prioritization only):
-{json.dumps(recommended_models, indent=2, ensure_ascii=False)}
+{orjson.dumps(recommended_models).decode()}
 
 PRODUCTS FOUND IN LOCAL STORES ({len(products)} total):
-{json.dumps(products[:30], indent=2, ensure_ascii=False)}
-
-CRITICAL - ONLY USE PRODUCTS FROM "PRODUCTS FOUND" LIST:
-- You may ONLY return products that appear in the "PRODUCTS FOUND IN LOCAL STORES" list above
-- Do NOT include any product that wasn't found in local stores, even if it's in recommended models
-- If a recommended model wasn't found in stores, it means it's NOT AVAILABLE in {country} - DO NOT include it
-- The recommended models list is ONLY for prioritization - a product must be in "PRODUCTS FOUND" to be returned
-
-Use ADAPTIVE FILTERING - return best available products even if they don't perfectly match criteria.
-
-IMPORTANT: Return exactly 5 DIFFERENT models (unique brand+model combinations).
-Do NOT return the same model from different stores.
-
-Output:
-{{
-  "products": [
-    {{
-      "id": "prod_<timestamp>_<index>",
-      "name": "full product name",
-      "brand": "brand",
-      "model_number": "model if found - MUST BE UNIQUE",
-      "category": "{category}",
-      "key_specs": ["Capacity: 8kg", "Noise: 52dB", "Energy: A+++"],
-      "price_range": "{country_info['currency']}X,XXX",
-      "criteria_match": {{
-        "matched": ["which criteria this product meets"],
-        "adapted": ["criteria relaxed due to market reality"],
-        "unknown": ["criteria that can't be verified"],
-        "unmet": ["criteria definitely not met"]
-      }},
-      "match_score": "high/medium/low",
-      "why_recommended": "explanation - if adapted, explain why this is the best available option",
-      "market_reality_note": "optional - explain any criteria adaptation (e.g., 'Quietest available in Israel at 42dB')"
-    }}
-  ],
-  "filtering_notes": "explain any adaptive filtering applied (e.g., 'Relaxed noise criteria from <40dB to <43dB as no products under 40dB available in Israel')"
-}}
-
-KEY_SPECS REQUIREMENTS:
-- key_specs MUST contain actual values for each product, NOT empty arrays
-- Use format "Attribute: Value" for each spec (e.g., "Capacity: 8kg", "Noise: 52dB")
-- Include specs for the main criteria from the FULL CRITERIA list above
-- Use your knowledge of the product model to infer specs (e.g., Bosch WAN24170BY has 8kg capacity)
-- If you don't know a spec value, omit it (don't say "unknown")
-- Common appliance specs to include: Capacity, Noise Level, Energy Class, Dimensions, RPM, Programs
-
-IMPORTANT:
-- FIRST: Filter out ANY product that is NOT a {category} - check Hebrew names carefully!
-- Return EXACTLY 5 DIFFERENT models (or all available if fewer than 5 unique {category} models exist)
-- Each model MUST have a unique model_number - no duplicates
-- NEVER return empty products if there are {category} products available - adapt criteria instead
-- If NO products match the {category} category, return empty products array and explain in filtering_notes
-- If a product matches a recommended model, prioritize it
-- Be honest about what can't be verified from the product name
-- Price should use {country_info['currency']} symbol
-- Add market_reality_note when criteria were adapted
-- Include model_diversity_note confirming the 5 models are unique"""
-
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=2500,
+{products_blob}"""
+
+        # The outer tool cache keys on the raw JSON strings; this one keys on
+        # the normalized prompt inputs, so formatting/ordering differences in
+        # the same research + products still skip the gpt-4o call
+        analysis_key = _analysis_cache_key(
+            original_requirement, category, country, criteria_transparency,
+            criteria, market_notes, recommended_models, prompt_products,
         )
+        result_text = await _get_cached_llm_reply(analysis_key)
+
+        if result_text is None:
+            client = get_openai_client()
+            with timer.phase("analyze.llm"):
+                response = await client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=2500,
+                )
 
-        result_text = response.choices[0].message.content.strip()
-
-        if result_text.startswith("```"):
-            result_text = re.sub(r'^```(?:json)?\n?', '', result_text)
-            result_text = re.sub(r'\n?```$', '', result_text)
-
-        result = json.loads(result_text)
+            with timer.phase("analyze.json_parse"):
+                result_text = response.choices[0].message.content.strip()
+                result_text = _strip_code_fence(result_text)
+                result = orjson.loads(result_text)
+            await _set_cached_llm_reply(analysis_key, result_text)
+        else:
+            logger.info("Analysis cache hit", key=analysis_key[:60])
+            with timer.phase("analyze.json_parse"):
+                result = orjson.loads(result_text)
 
         # Check raw data quality - if products lack model numbers, we can't validate
         products_with_models = sum(1 for p in products if p.get("model_number"))
@@ -1547,31 +1968,33 @@ IMPORTANT:
             )
             timestamp = int(time.time() * 1000)
             fallback_products = []
+            fallback_append = fallback_products.append
 
             for i, p in enumerate(products[:10]):
                 # Try to extract brand and model from URL or name
                 url = p.get("url", "")
                 name = p.get("name", "Unknown")
+                price = p.get("price")
                 extracted_brand = extract_brand(url) or extract_brand(name)
 
                 # Try to extract model from URL path
                 model = None
                 if url:
                     # Common patterns: /product/BRAND-MODEL, /MODEL.html
-                    model_match = re.search(r'[/-]([A-Z]{2,}[\w-]{3,20})\b', url, re.IGNORECASE)
+                    model_match = _URL_MODEL_RE.search(url)
                     if model_match:
                         model = model_match.group(1).upper()
 
-                fallback_products.append({
+                fallback_append({
                     "id": f"prod_{timestamp}_{i}",
                     "name": f"{extracted_brand or 'Product'} {model or ''} - {name}".strip(),
                     "brand": extracted_brand,
                     "model_number": model,
                     "category": category,
                     "key_specs": [],
-                    "price": p.get("price"),
-                    "currency": p.get("currency", country_info['currency']),
-                    "price_range": f"{country_info['currency']}{p.get('price', 0):,.0f}" if p.get('price') else None,
+                    "price": price,
+                    "currency": p.get("currency", currency),
+                    "price_range": f"{currency}{price:,.0f}" if price else None,
                     "url": p.get("url"),
                     "rating": p.get("rating"),
                     "why_recommended": "Found in local stores matching your search",
@@ -1602,8 +2025,9 @@ IMPORTANT:
             "✅ Analysis complete",
             f"Scored {len(result.get('products', []))} products"
         )
+        await _report_timings("Analysis", timer)
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return orjson.dumps(result).decode()
 
     except Exception as e:
         logger.error("Product analysis failed", error=str(e))
@@ -1611,25 +2035,26 @@ IMPORTANT:
 
         # Fallback: return products with basic formatting
         timestamp = int(time.time() * 1000)
-        fallback_products = []
-
-        for i, p in enumerate(products[:10]):
-            fallback_products.append({
+        fallback_products = [
+            {
                 "id": f"prod_{timestamp}_{i}",
                 "name": p.get("name", "Unknown"),
                 "brand": p.get("brand"),
                 "model_number": p.get("model_number"),
                 "category": category,
                 "key_specs": [],
-                "price_range": f"{country_info['currency']}{p.get('price', 0):,.0f}",
+                "price_range": f"{currency}{p.get('price', 0):,.0f}",
                 "why_recommended": "Found matching your search",
                 "match_score": "unknown",
-            })
+            }
+            for i, p in enumerate(products[:10])
+        ]
 
-        return json.dumps({
+        return orjson.dumps({
             "products": fallback_products,
             "search_summary": search_summary,
-        }, indent=2, ensure_ascii=False)
+            "error": f"Analysis failed: {str(e)[:100]}",
+        }).decode()
 
 
 if _cache_disabled:
@@ -1638,7 +2063,7 @@ if _cache_disabled:
     )
 else:
     _analyze_and_format_results_cached = cached(
-        cache_type="agent", key_prefix="analyze_format"
+        cache_type="agent", key_prefix="analyze_format", should_cache=_is_cacheable_output
     )(_analyze_and_format_results_impl)
     analyze_and_format_results = function_tool(
         _analyze_and_format_results_cached, name_override="analyze_and_format_results"
@@ -1649,35 +2074,76 @@ else:
 # Helper Functions
 # ============================================================================
 
+KNOWN_BRANDS = (
+    "Samsung", "LG", "Bosch", "Siemens", "Miele", "AEG", "Electrolux",
+    "Haier", "Whirlpool", "Beko", "Candy", "Gorenje", "Hisense",
+    "Apple", "Sony", "Dell", "HP", "Lenovo", "Asus", "Acer",
+    "Panasonic", "Sharp", "Toshiba", "Hitachi", "Frigidaire",
+    "Amcor", "Tadiran", "Tornado", "Crystal", "General Electric", "GE",
+)
+
+# Lowercased brand -> position in KNOWN_BRANDS (regex hits keep the input's
+# casing). When a name mentions several brands, the earliest-listed one wins.
+_BRAND_RANK = {b.lower(): i for i, b in enumerate(KNOWN_BRANDS)}
+
+# Longest first, so the alternation prefers "General Electric" over "GE"
+# regardless of KNOWN_BRANDS order
+_BRANDS_BY_LENGTH = tuple(sorted(KNOWN_BRANDS, key=len, reverse=True))
+
+# Model number patterns, in priority order (first pattern with a hit wins)
+_MODEL_PATTERNS = (
+    r'[A-Z]{2,3}\d{2,}[A-Z0-9]*',
+    r'[A-Z]{1,2}-?\d{3,}[A-Z0-9]*',
+    r'\d{2,}[A-Z]{2,}[0-9]*',
+)
+
+# Single scanner for brand + model. The brand is captured in a lookahead so a
+# model token starting with a brand (e.g., "GE-425") still yields both. Brands
+# match case-insensitively (scoped flag), model numbers stay case-sensitive.
+# Word boundaries avoid partial matches (e.g., "GE" in "Generic").
+_NAME_RE = re.compile(
+    r'\b(?=(?P<brand>(?i:' + '|'.join(re.escape(b) for b in _BRANDS_BY_LENGTH) + r'))\b)?'
+    + '(?:' + '|'.join(
+        rf'(?P<model{i}>{pattern})\b' for i, pattern in enumerate(_MODEL_PATTERNS)
+    ) + ')?'
+)
+_MODEL_GROUPS = tuple(f"model{i}" for i in range(len(_MODEL_PATTERNS)))
+
+# Model number embedded in a product URL path (e.g., /product/BRAND-MODEL, /MODEL.html)
+_URL_MODEL_RE = re.compile(r'[/-]([A-Z]{2,}[\w-]{3,20})\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def extract_brand_and_model(product_name: str) -> tuple[Optional[str], Optional[str]]:
+    """Extract brand and model number from a product name in a single scan.
+
+    Memoized per process: the same names come back from many queries and
+    scrapers, and the rules are static, so no invalidation is needed.
+
+    Returns:
+        (brand, model_number) tuple; either may be None
+    """
+    brand_rank = len(KNOWN_BRANDS)
+    models: dict[str, str] = {}
+    for match in _NAME_RE.finditer(product_name):
+        if hit := match.group("brand"):
+            brand_rank = min(brand_rank, _BRAND_RANK[hit.lower()])
+        if (group := match.lastgroup) and group != "brand" and group not in models:
+            models[group] = match.group(group)
+
+    brand = KNOWN_BRANDS[brand_rank] if brand_rank < len(KNOWN_BRANDS) else None
+    model = next((models[g] for g in _MODEL_GROUPS if g in models), None)
+    return brand, model
+
+
 def extract_brand(product_name: str) -> Optional[str]:
     """Extract brand from product name."""
-    known_brands = [
-        "Samsung", "LG", "Bosch", "Siemens", "Miele", "AEG", "Electrolux",
-        "Haier", "Whirlpool", "Beko", "Candy", "Gorenje", "Hisense",
-        "Apple", "Sony", "Dell", "HP", "Lenovo", "Asus", "Acer",
-        "Panasonic", "Sharp", "Toshiba", "Hitachi", "Frigidaire",
-        "Amcor", "Tadiran", "Tornado", "Crystal", "General Electric", "GE",
-    ]
-    for brand in known_brands:
-        # Use word boundary matching to avoid partial matches (e.g., "GE" in "Generic")
-        pattern = r'\b' + re.escape(brand) + r'\b'
-        if re.search(pattern, product_name, re.IGNORECASE):
-            return brand
-    return None
+    return extract_brand_and_model(product_name)[0]
 
 
 def extract_model_number(product_name: str) -> Optional[str]:
     """Extract model number from product name."""
-    patterns = [
-        r'\b([A-Z]{2,3}\d{2,}[A-Z0-9]*)\b',
-        r'\b([A-Z]{1,2}-?\d{3,}[A-Z0-9]*)\b',
-        r'\b(\d{2,}[A-Z]{2,}[0-9]*)\b',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, product_name)
-        if match:
-            return match.group(1)
-    return None
+    return extract_brand_and_model(product_name)[1]
 
 
 # ============================================================================
@@ -1791,3 +2257,79 @@ Your final response must be the JSON from step 3. It includes:
 """,
     tools=[research_and_discover, search_products_smart, analyze_and_format_results],
 )
+
+
+# ============================================================================
+# Final Output Cache
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _discovery_pipeline_version(country: str) -> str:
+    """Combined version of the code that produces a discovery answer for a country.
+
+    Covers this module (agent prompt and tools), the result filters, the
+    scraper runner and the country's scrapers.
+    """
+    versions = [
+        get_component_version(_discovery_pipeline_version),
+        get_component_version(ResultDeduplicator),
+        get_component_version(run_scraper),
+        *(get_component_version(s) for s in ScraperRegistry.get_scrapers_for_country(country)),
+    ]
+    return hashlib.sha256("".join(versions).encode()).hexdigest()[:8]
+
+
+def _discovery_result_cache_key(query: str, country: str) -> str:
+    """Build the cache key for a discovery agent's final output."""
+    country = country.upper()
+    return make_cache_key(
+        "agent",
+        "discovery_final",
+        _discovery_pipeline_version(country),
+        _normalize_llm_text(query),
+        country,
+    )
+
+
+def _is_cacheable_discovery_result(output: str) -> bool:
+    """Check whether a discovery agent's final output may be cached.
+
+    Like _is_cacheable_output for the tools: answers that report an error or
+    found no products are usually transient (scraper outages, timeouts), so
+    they're not served to later requests. Outputs that aren't the expected
+    JSON object aren't cached either.
+    """
+    try:
+        data = orjson.loads(_strip_code_fence(output.strip()))
+    except orjson.JSONDecodeError:
+        return False
+    return isinstance(data, dict) and "error" not in data and bool(data.get("products"))
+
+
+async def get_cached_discovery_result(query: str, country: str) -> Optional[str]:
+    """Get a cached final output for a new (non-refinement) discovery query.
+
+    Queries are matched case- and whitespace-insensitively. The key includes
+    the version of the discovery pipeline's code (see
+    _discovery_pipeline_version), so changing it invalidates cached outputs.
+    """
+    return await _get_cached_llm_reply(_discovery_result_cache_key(query, country))
+
+
+async def set_cached_discovery_result(query: str, country: str, output: str) -> None:
+    """Cache a discovery agent's final output for its query and country.
+
+    Only answers with products are stored, for
+    settings.cache_ttl_discovery_result_seconds, since they carry scraped
+    store prices.
+    """
+    if _cache_disabled or not settings.cache_enabled:
+        return
+    if not _is_cacheable_discovery_result(output):
+        return
+    await get_cache_manager().set(
+        _discovery_result_cache_key(query, country),
+        output,
+        ttl_seconds=settings.cache_ttl_discovery_result_seconds,
+        cache_type="agent",
+    )
@@ -1,17 +1,33 @@
 """Product research agent for finding best purchase options."""
 
 import asyncio
-from agents import Agent, function_tool
+import heapq
+import re
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import unquote, urlparse
+
+import httpx
+import structlog
+from agents import Agent, function_tool
 
 # Import from scraping module to ensure scrapers are registered
-from src.tools.scraping import ScraperRegistry
+from src.tools.scraping import BaseScraper, ScraperRegistry
 from src.tools.scraping.filters import deduplicate_results
-from src.tools.aggregation import aggregate_by_seller, SELLER_DOMAINS
+from src.tools.scraping.http_client import get_http_client, get_research_http_client
+from src.tools.scraping.price_extractor import get_price_extractor
+from src.tools.scraping.runner import run_scraper
+from src.tools.aggregation import SellerAggregator, SELLER_DOMAINS
 from src.state.models import PriceOption, SellerInfo
 from src.cache import cached
 from src.observability import report_progress, record_search, record_error, record_warning
+from src.db.session import get_db_session
+from src.db.repository.sellers import SellerRepository
+
+logger = structlog.get_logger()
 
 
 # List of aggregator scraper names (prioritized for appliance/electronics searches)
@@ -20,6 +36,266 @@ AGGREGATOR_SCRAPERS = ["zap_http", "wisebuy"]
 # Domains to skip (aggregators, not actual sellers)
 AGGREGATOR_DOMAINS = ("zap.co.il", "wisebuy.co.il", "google.com", "google.co.il")
 
+# Headers for the Google site-searches that look for missing bundle products
+_SITE_SEARCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "he-IL,he;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+# Product URL domains that aren't the seller's own site
+_SITE_SEARCH_SKIP_DOMAINS = ("google.com", "zap.co.il", "pricez")
+# Empty search replies are cached this briefly, in case a scraper was down
+_EMPTY_RESULT_TTL_SECONDS = 300
+# search_products stops waiting for slower scrapers once it has this many
+# results from at least this many scrapers
+_EARLY_STOP_MIN_RESULTS = 20
+_EARLY_STOP_MIN_SCRAPERS = 2
+# Max site-searches in flight at once
+_SITE_SEARCH_CONCURRENCY = 3
+# Max missing products combined into one OR site-search
+_SITE_SEARCH_BATCH_SIZE = 5
+# Model-number candidates in a query (runs of letters and digits, optionally
+# joined by "-", "." or "/", e.g. "WH-1000XM5")
+_MODEL_TOKEN_RE = re.compile(r'[A-Za-z0-9]+(?:[-./][A-Za-z0-9]+)*')
+# Shorter model numbers ("S24", "TV1") match unrelated product URLs too easily
+_MODEL_TOKEN_MIN_LENGTH = 5
+
+
+def _format_results_preview(
+    header: str,
+    results: list[PriceOption],
+    show_rating: bool = False,
+) -> str:
+    """Format the top 5 results as a progress message.
+
+    Args:
+        header: First line of the message
+        results: Scraper results (only the first 5 are listed)
+        show_rating: Include seller ratings when available
+
+    Returns:
+        Header, one bullet per listed result, and a count of the rest
+    """
+    lines = [header]
+    for r in results[:5]:
+        rating_str = (
+            f" ({r.seller.reliability_score:.1f}★)"
+            if show_rating and r.seller.reliability_score
+            else ""
+        )
+        lines.append(f"  • {r.seller.name}{rating_str}: {r.listed_price:,.0f} {r.currency}")
+    if len(results) > 5:
+        lines.append(f"  ... and {len(results) - 5} more")
+    return "\n".join(lines)
+
+
+async def _search_scrapers(
+    scrapers: list[BaseScraper],
+    queries: list[str],
+    max_results: int,
+) -> AsyncIterator[tuple[BaseScraper, str, list[PriceOption] | Exception]]:
+    """Run queries on all scrapers concurrently, yielding outcomes as they finish.
+
+    Each search runs under its scraper's concurrency cap and timeout (shared
+    with the discovery agent), so different sites are searched in parallel
+    while each site works through the queries in order, without exceeding
+    its per-site limit. Searches still running when the generator is closed
+    (e.g. via contextlib.aclosing after breaking out early) are cancelled.
+
+    Yields:
+        (scraper, query, results or exception) tuples, in completion order
+    """
+    async def run_one(scraper: BaseScraper, query: str):
+        return scraper, query, await run_scraper(scraper, query, max_results)
+
+    # Query-major order: each site's semaphore admits its searches query by query
+    tasks = [
+        asyncio.create_task(run_one(scraper, query))
+        for query in queries
+        for scraper in scrapers
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@lru_cache(maxsize=4096)
+def _url_domain(url: str) -> str:
+    """Get a URL's lowercased domain without the "www." prefix.
+
+    Cached, since the same seller URLs come up across searches.
+    """
+    domain = urlparse(url).netloc.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain
+
+
+def _rank_score(result: PriceOption) -> float:
+    """Lower score = better. Combines price rank with reputation penalty."""
+    # Apply reputation bonus/penalty (rating is 0-5, default to 3 if unknown)
+    rating = result.seller.reliability_score or 3.0
+    # Higher rating = lower score (better). Max bonus is 20% discount for 5-star
+    reputation_multiplier = 1.0 - ((rating - 3.0) / 10.0)  # 5-star = 0.8x, 1-star = 1.2x
+    return result.listed_price * reputation_multiplier
+
+
+def _expected_price_range(results: list[PriceOption]) -> tuple[float, float]:
+    """Get the min/max reasonable price for a product based on existing results."""
+    prices = [r.listed_price for r in results if r.listed_price > 50]
+    if not prices:
+        return (100, 50000)  # Default range if no reference
+    min_price = min(prices) * 0.5  # Allow 50% below min
+    max_price = max(prices) * 2.0  # Allow 2x above max
+    return (min_price, max_price)
+
+
+def _format_result(index: int, result: PriceOption) -> str:
+    """Format one ranked result for the tool output.
+
+    NOTE: Format must match dashboard's parseSearchResults() regex patterns:
+    - Rating: "(Rating: X/5)"
+    - Price: "Price: X,XXX ILS"
+    - URL: "URL: https://..."
+    - Contact: "Contact: +972..."
+    """
+    seller = result.seller
+    rating_str = f" (Rating: {seller.reliability_score:.1f}/5)" if seller.reliability_score else ""
+    source_str = f" [{seller.source}]" if seller.source else ""
+    contact_str = f"   Contact: {seller.whatsapp_number}\n" if seller.whatsapp_number else ""
+    return (
+        f"{index}. {seller.name}{rating_str}{source_str}\n"
+        f"   Price: {result.listed_price:,.0f} {result.currency}\n"
+        f"   URL: {result.url}\n"
+        f"{contact_str}"
+    )
+
+
+def _empty_result_ttl(output: str) -> Optional[int]:
+    """Get the cache TTL for a "No products found" reply (others keep the default)."""
+    return _EMPTY_RESULT_TTL_SECONDS if output.startswith("No products found") else None
+
+
+def _error_text(error: Exception) -> str:
+    """Get a printable message for a scraper failure (timeouts have none)."""
+    return str(error) or error.__class__.__name__
+
+
+async def _google_site_search(
+    client: httpx.AsyncClient,
+    seller_domain: str,
+    query: str,
+    num: int = 5,
+) -> list[str]:
+    """Search Google for a query restricted to one seller's site.
+
+    Args:
+        client: HTTP client to send the request with
+        seller_domain: Seller domain to restrict the search to (without www.)
+        query: Search terms (may be an OR-expression)
+        num: Number of Google results to request
+
+    Returns:
+        Result URLs on the seller's domain, in page order (empty if blocked)
+    """
+    params = {
+        "q": f"site:{seller_domain} {query}",
+        "gl": "il",
+        "hl": "he",
+        "num": num,
+    }
+    response = await client.get(
+        "https://www.google.com/search",
+        params=params,
+        headers=_SITE_SEARCH_HEADERS,
+    )
+    if response.status_code != 200:
+        return []
+
+    html = response.text
+    domain = re.escape(seller_domain)
+    # Direct result links first, then Google's /url?q= redirect links
+    url_patterns = [
+        rf'href="(https?://(?:www\.)?{domain}[^"]*)"',
+        rf'href="/url\?q=(https?://(?:www\.)?{domain}[^&"]*)',
+    ]
+    urls: dict[str, None] = {}
+    for pattern in url_patterns:
+        urls.update(dict.fromkeys(re.findall(pattern, html, re.IGNORECASE)))
+    return list(urls)
+
+
+def _model_token(query: str) -> Optional[str]:
+    """Get the model number in a query, for site-search batching and URL matching.
+
+    The longest token mixing letters and digits (e.g. "OLED55C4",
+    "WH-1000XM5"), if it has at least _MODEL_TOKEN_MIN_LENGTH letters and
+    digits. Descriptive or Hebrew queries ("tv", "מקרר שקט") have none.
+    """
+    tokens = [
+        token for token in _MODEL_TOKEN_RE.findall(query)
+        if len(key := _compact(token)) >= _MODEL_TOKEN_MIN_LENGTH
+        and not key.isalpha() and not key.isdigit()
+    ]
+    return max(tokens, key=len, default=None)
+
+
+def _match_site_search_urls(urls: list[str], queries: list[str]) -> dict[str, str]:
+    """Assign batched site-search results to the queries they are for.
+
+    A URL matches a query when the query's model number appears in the URL,
+    ignoring case and separators (product pages usually carry the model
+    number in their path). Queries without a model number never match.
+
+    Returns:
+        Query -> first matching URL, for queries that matched
+    """
+    compact_urls = [(url, _compact(unquote(url))) for url in urls]
+    matches = {}
+    for query in queries:
+        token = _model_token(query)
+        if token is None:
+            continue
+        key = _compact(token)
+        for url, compact_url in compact_urls:
+            if key in compact_url:
+                matches[query] = url
+                break
+    return matches
+
+
+def _compact(text: str) -> str:
+    """Lowercase text and drop everything but letters and digits."""
+    return "".join(c for c in text.lower() if c.isalnum())
+
+
+async def _first_contact(scrapers: list[BaseScraper], seller_url: str) -> Optional[str]:
+    """Ask all scrapers for a seller's contact at once and take the first found.
+
+    The remaining lookups are cancelled as soon as one returns a contact,
+    so resolution takes as long as the fastest successful scraper rather
+    than the sum of all of them. Failing scrapers are skipped.
+    """
+    async def lookup(scraper: BaseScraper) -> Optional[str]:
+        try:
+            return await scraper.extract_contact_info(seller_url)
+        except Exception:
+            return None
+
+    tasks = [asyncio.create_task(lookup(s)) for s in scrapers]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            contact = await next_done
+            if contact:
+                return contact
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
 
 async def get_seller_contact_from_db_or_scrape(
     seller_url: str,
@@ -43,21 +319,12 @@ async def get_seller_contact_from_db_or_scrape(
     Returns:
         Contact phone number if found, None otherwise
     """
-    import structlog
-    from src.db.session import get_db_session
-    from src.db.repository.sellers import SellerRepository
-
-    logger = structlog.get_logger()
-
     if not seller_url:
         return None
 
     # Parse domain
     try:
-        parsed = urlparse(seller_url)
-        domain = parsed.netloc.lower()
-        if domain.startswith("www."):
-            domain = domain[4:]
+        domain = _url_domain(seller_url)
     except Exception:
         return None
 
@@ -80,14 +347,9 @@ async def get_seller_contact_from_db_or_scrape(
 
     # Step 2: Scrape if not in database
     scrapers = ScraperRegistry.get_scrapers_for_country(country)
-    for scraper in scrapers:
-        try:
-            contact = await scraper.extract_contact_info(seller_url)
-            if contact:
-                logger.info("Scraped contact info", seller=seller_name, contact=contact)
-                break
-        except Exception:
-            continue
+    contact = await _first_contact(scrapers, seller_url)
+    if contact:
+        logger.info("Scraped contact info", seller=seller_name, contact=contact)
 
     # Step 3: Save to database (whether we found contact or not - saves the seller)
     try:
@@ -127,9 +389,6 @@ async def enrich_and_save_sellers(
     Returns:
         Same list with contact info populated where possible
     """
-    import structlog
-    logger = structlog.get_logger()
-
     if not results:
         return results
 
@@ -160,9 +419,6 @@ async def enrich_and_save_sellers(
         # If already has contact, just save to DB
         if result.seller.whatsapp_number:
             try:
-                from src.db.session import get_db_session
-                from src.db.repository.sellers import SellerRepository
-
                 async with get_db_session() as session:
                     repo = SellerRepository(session)
                     await repo.create_or_update(
@@ -212,9 +468,6 @@ async def _search_products_impl(query: str, country: str = "IL", max_results: in
     Returns:
         A formatted list of products with prices, sellers, ratings, and contact info
     """
-    import structlog
-    logger = structlog.get_logger()
-
     scrapers = ScraperRegistry.get_scrapers_for_country(country)
 
     if not scrapers:
@@ -223,38 +476,59 @@ async def _search_products_impl(query: str, country: str = "IL", max_results: in
     all_results: list[PriceOption] = []
     errors: list[str] = []
 
-    # Run scrapers sequentially to avoid rate limiting
-    for scraper_idx, scraper in enumerate(scrapers):
-        # Report which scraper is running
-        await report_progress(
-            f"🔍 {scraper.name}",
-            f"Searching {scraper.name} for {query}..."
-        )
+    # Run scrapers concurrently, reporting each one as it finishes. The start
+    # is one event, so the fan-out doesn't wait on a span per scraper.
+    await report_progress(
+        "🔍 Searching",
+        f"Searching {', '.join(s.name for s in scrapers)} for {query}..."
+    )
 
-        try:
-            # Just do the search (fast, no contact extraction)
-            results = await scraper.search(query, max_results)
+    results_by_scraper: dict[str, list[PriceOption]] = {}
+    finished: set[str] = set()
+    collected = 0
+    async with aclosing(_search_scrapers(scrapers, [query], max_results)) as outcomes:
+        async for scraper, _, outcome in outcomes:
+            finished.add(scraper.name)
+            if isinstance(outcome, Exception):
+                error = _error_text(outcome)
+                await report_progress(f"❌ {scraper.name}", f"Error: {error[:100]}")
+                await record_error(f"{scraper.name}: {error[:200]}")
+                errors.append(f"{scraper.__class__.__name__}: {error}")
+                continue
 
             # Record search operation
             await record_search(scraper.name, cached=False)
 
-            if results:
+            if outcome:
                 # Report results immediately
-                progress_output = f"✅ Found {len(results)} results:\n"
-                for r in results[:5]:
-                    price_str = f"{r.listed_price:,.0f} {r.currency}"
-                    progress_output += f"  • {r.seller.name}: {price_str}\n"
-                if len(results) > 5:
-                    progress_output += f"  ... and {len(results) - 5} more"
-                await report_progress(f"✅ {scraper.name}", progress_output)
-                all_results.extend(results)
+                await report_progress(
+                    f"✅ {scraper.name}",
+                    _format_results_preview(f"✅ Found {len(outcome)} results:", outcome),
+                )
+                results_by_scraper[scraper.name] = outcome
+                collected += len(outcome)
             else:
                 await report_progress(f"⚠️ {scraper.name}", "No results found")
                 await record_warning(f"{scraper.name}: No results for {query}")
-        except Exception as e:
-            await report_progress(f"❌ {scraper.name}", f"Error: {str(e)[:100]}")
-            await record_error(f"{scraper.name}: {str(e)[:200]}")
-            errors.append(f"{scraper.__class__.__name__}: {str(e)}")
+
+            # Only the top 5 are returned, so once enough results from several
+            # sites are in, slower scrapers are cancelled rather than awaited
+            pending = [s.name for s in scrapers if s.name not in finished]
+            if (
+                pending
+                and collected >= _EARLY_STOP_MIN_RESULTS
+                and len(results_by_scraper) >= _EARLY_STOP_MIN_SCRAPERS
+            ):
+                await report_progress(
+                    "⏹ Enough results",
+                    f"Found {collected} results; skipping {', '.join(pending)}"
+                )
+                logger.info("Cancelling slow scrapers", query=query, cancelled=pending)
+                break
+
+    # Keep scraper order so deduplication doesn't depend on which site answered first
+    for scraper in scrapers:
+        all_results.extend(results_by_scraper.get(scraper.name, []))
 
     if not all_results:
         if errors:
@@ -267,51 +541,15 @@ async def _search_products_impl(query: str, country: str = "IL", max_results: in
     # Enrich with contacts (DB lookup or scrape) and save sellers to database
     all_results = await enrich_and_save_sellers(all_results, country)
 
-    # Rank results by combined score (price and reputation)
-    def rank_score(result: PriceOption) -> float:
-        """Lower score = better. Combines price rank with reputation penalty."""
-        # Normalize price (assuming most products are 100-50000 ILS)
-        price_score = result.listed_price
-
-        # Apply reputation bonus/penalty (rating is 0-5, default to 3 if unknown)
-        rating = result.seller.reliability_score or 3.0
-        # Higher rating = lower score (better). Max bonus is 20% discount for 5-star
-        reputation_multiplier = 1.0 - ((rating - 3.0) / 10.0)  # 5-star = 0.8x, 1-star = 1.2x
+    # Top 5 results by combined score (price and reputation)
+    top_results = heapq.nsmallest(5, all_results, key=_rank_score)
 
-        return price_score * reputation_multiplier
-
-    all_results.sort(key=rank_score)
-
-    # Limit to top 5 results
-    top_results = all_results[:5]
-
-    # Format results with ratings and contact info
-    # NOTE: Format must match dashboard's parseSearchResults() regex patterns:
-    # - Rating: "(Rating: X/5)"
-    # - Price: "Price: X,XXX ILS"
-    # - URL: "URL: https://..."
-    # - Contact: "Contact: +972..."
+    # Format results with ratings and contact info (see _format_result)
     output = [f"Top {len(top_results)} results for '{query}' (ranked by price + reputation):\n"]
 
-    for i, result in enumerate(top_results, 1):
-        rating_str = ""
-        if result.seller.reliability_score:
-            rating_str = f" (Rating: {result.seller.reliability_score:.1f}/5)"
-
-        source_str = ""
-        if result.seller.source:
-            source_str = f" [{result.seller.source}]"
-
-        contact_str = ""
-        if result.seller.whatsapp_number:
-            contact_str = f"   Contact: {result.seller.whatsapp_number}\n"
-
-        output.append(
-            f"{i}. {result.seller.name}{rating_str}{source_str}\n"
-            f"   Price: {result.listed_price:,.0f} {result.currency}\n"
-            f"   URL: {result.url}\n"
-            f"{contact_str}"
-        )
+    output.extend(
+        _format_result(i, result) for i, result in enumerate(top_results, 1)
+    )
 
     if errors:
         output.append(f"\nNote: Some scrapers had issues: {'; '.join(errors)}")
@@ -320,9 +558,11 @@ async def _search_products_impl(query: str, country: str = "IL", max_results: in
 
 
 # Create cached version (for testing) and tool version (for agents)
-_search_products_cached = cached(cache_type="agent", key_prefix="search_products")(
-    _search_products_impl
-)
+_search_products_cached = cached(
+    cache_type="agent",
+    key_prefix="search_products",
+    result_ttl_seconds=_empty_result_ttl,
+)(_search_products_impl)
 search_products = function_tool(_search_products_cached, name_override="search_products")
 
 
@@ -338,14 +578,9 @@ async def _get_seller_contact_impl(seller_url: str, country: str = "IL") -> str:
     Returns:
         Contact information including phone/WhatsApp if found
     """
-    from urllib.parse import urlparse
-
     # Extract seller name from URL for saving
     try:
-        parsed = urlparse(seller_url)
-        domain = parsed.netloc.lower()
-        if domain.startswith("www."):
-            domain = domain[4:]
+        domain = _url_domain(seller_url)
         seller_name = domain.split(".")[0].title()  # e.g., "example.com" -> "Example"
     except Exception:
         seller_name = "Unknown"
@@ -386,96 +621,100 @@ async def _search_multiple_products_impl(
     Returns:
         Formatted string with bundle opportunities and individual results
     """
-    import structlog
-    logger = structlog.get_logger()
-
     scrapers = ScraperRegistry.get_scrapers_for_country(country)
 
     if not scrapers:
         return f"No scrapers available for country: {country}"
 
-    # Search products sequentially to avoid rate limiting
-    results_by_query: dict[str, list[PriceOption]] = {}
-    total_queries = len(queries)
+    # Search all products on all scrapers concurrently. Each site has its own
+    # concurrency cap, so sites run in parallel while each one takes the
+    # products in turn instead of being hit with every query at once.
+    unique_queries = list(dict.fromkeys(queries))
+    total_queries = len(unique_queries)
 
-    for query_idx, query in enumerate(queries):
+    for query_idx, query in enumerate(unique_queries):
         # Report starting this product search
         await report_progress(
             f"📦 Product {query_idx + 1}/{total_queries}",
             f"Starting search for: {query}"
         )
 
-        logger.info(
-            "Searching product",
-            query=query,
-            progress=f"{query_idx + 1}/{total_queries}",
-        )
-
-        all_results: list[PriceOption] = []
-
-        # Run scrapers sequentially for this query
-        for scraper_idx, scraper in enumerate(scrapers):
-            # Report which scraper is running
-            await report_progress(
-                f"🔍 {scraper.name}",
-                f"Searching {scraper.name} for {query}..."
-            )
+    logger.info(
+        "Searching products",
+        queries=total_queries,
+        scrapers=len(scrapers),
+    )
 
-            logger.info(
-                "Running scraper",
-                scraper=scraper.name,
-                query=query,
-                progress=f"Scraper {scraper_idx + 1}/{len(scrapers)}",
-            )
-            try:
-                # First just do the search (fast)
-                results = await scraper.search(query, max_results_per_product)
-                if results:
-                    # Report results found
-                    progress_output = f"✅ Found {len(results)} results for {query}:\n"
-                    for r in results[:5]:  # Show top 5
-                        price_str = f"{r.listed_price:,.0f} {r.currency}"
-                        progress_output += f"  • {r.seller.name}: {price_str}\n"
-                    if len(results) > 5:
-                        progress_output += f"  ... and {len(results) - 5} more"
-                    await report_progress(f"✅ {scraper.name}: {query}", progress_output)
-
-                    all_results.extend(results)
-                    logger.info(
-                        "Scraper complete",
-                        scraper=scraper.name,
-                        results=len(results),
-                    )
-                else:
-                    await report_progress(
-                        f"⚠️ {scraper.name}: {query}",
-                        f"No results found"
-                    )
-            except Exception as e:
+    # Per query: scrapers still running, and results by scraper name
+    pending = {query: len(scrapers) for query in unique_queries}
+    scraper_results: dict[str, dict[str, list[PriceOption]]] = {
+        query: {} for query in unique_queries
+    }
+    enriched_by_query: dict[str, list[PriceOption]] = {}
+
+    async with aclosing(
+        _search_scrapers(scrapers, unique_queries, max_results_per_product)
+    ) as outcomes:
+        async for scraper, query, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                error = _error_text(outcome)
                 await report_progress(
                     f"❌ {scraper.name}: {query}",
-                    f"Error: {str(e)[:100]}"
+                    f"Error: {error[:100]}"
                 )
                 logger.warning(
                     "Scraper failed",
                     scraper=scraper.name,
-                    error=str(e),
+                    query=query,
+                    error=error,
+                )
+            elif outcome:
+                # Report results found
+                await report_progress(
+                    f"✅ {scraper.name}: {query}",
+                    _format_results_preview(
+                        f"✅ Found {len(outcome)} results for {query}:", outcome
+                    ),
                 )
 
-        # After all scrapers complete for this query, deduplicate and enrich
-        deduplicated = deduplicate_results(all_results)
-        enriched = await enrich_and_save_sellers(deduplicated, country)
-        results_by_query[query] = enriched
+                scraper_results[query][scraper.name] = outcome
+                logger.info(
+                    "Scraper complete",
+                    scraper=scraper.name,
+                    query=query,
+                    results=len(outcome),
+                )
+            else:
+                await report_progress(
+                    f"⚠️ {scraper.name}: {query}",
+                    f"No results found"
+                )
 
-        await report_progress(
-            f"📊 {query} complete",
-            f"Found {len(results_by_query[query])} unique results after deduplication"
-        )
-        logger.info(
-            "Product search complete",
-            query=query,
-            total_results=len(results_by_query[query]),
-        )
+            pending[query] -= 1
+            if pending[query]:
+                continue
+
+            # After all scrapers complete for this query, deduplicate and enrich
+            # (in scraper order, so deduplication doesn't depend on timing)
+            all_results = [
+                r for s in scrapers for r in scraper_results[query].get(s.name, [])
+            ]
+            deduplicated = deduplicate_results(all_results)
+            enriched_by_query[query] = await enrich_and_save_sellers(deduplicated, country)
+
+            await report_progress(
+                f"📊 {query} complete",
+                f"Found {len(enriched_by_query[query])} unique results after deduplication"
+            )
+            logger.info(
+                "Product search complete",
+                query=query,
+                total_results=len(enriched_by_query[query]),
+            )
+
+    results_by_query: dict[str, list[PriceOption]] = {
+        query: enriched_by_query[query] for query in unique_queries
+    }
 
     # Report starting aggregation
     await report_progress(
@@ -483,47 +722,49 @@ async def _search_multiple_products_impl(
         f"Finding bundle opportunities across {len(results_by_query)} products..."
     )
 
-    # Aggregate by seller
-    aggregations = aggregate_by_seller(results_by_query, top_stores)
+    # Aggregate by seller (kept incremental, so site-search finds can be added)
+    aggregator = SellerAggregator()
+    for query, results in results_by_query.items():
+        aggregator.add(query, results)
+    aggregations = aggregator.top(top_stores)
 
     # Step 2: Check availability of missing products at promising sellers
     bundle_sellers = [a for a in aggregations if a.product_count >= 2]
-    all_queries = set(queries)
-
-    # Helper: get expected price range for a product based on existing results
-    def get_price_range(query: str) -> tuple[float, float]:
-        """Get min/max reasonable price for a product based on existing results."""
-        prices = [r.listed_price for r in results_by_query.get(query, []) if r.listed_price > 50]
-        if not prices:
-            return (100, 50000)  # Default range if no reference
-        min_price = min(prices) * 0.5  # Allow 50% below min
-        max_price = max(prices) * 2.0  # Allow 2x above max
-        return (min_price, max_price)
+    all_queries = frozenset(unique_queries)
+
+    # Expected price range per product, from the scraped results. Computed
+    # once up front, so products found by site-search don't widen it.
+    price_ranges = {
+        query: _expected_price_range(results_by_query.get(query, []))
+        for query in all_queries
+    }
+
+    # Model number per product, for batching site-searches
+    model_tokens = {query: _model_token(query) for query in unique_queries}
+
+    # Google blocks bursts, so only a few site-searches run at once
+    site_search_limit = asyncio.Semaphore(_SITE_SEARCH_CONCURRENCY)
 
     for agg in bundle_sellers:
-        missing_queries = all_queries - set(agg.product_queries)
+        missing_queries = all_queries.difference(agg.product_queries)
         if not missing_queries:
             continue  # Seller already has all products
+        # Missing products in the caller's order
+        missing = [q for q in unique_queries if q in missing_queries]
 
         # Get seller's website domain from SELLER_DOMAINS mapping or product URL
-        seller_domain = None
-
         # First try the normalized name -> domain mapping
-        if agg.normalized_name in SELLER_DOMAINS:
-            seller_domain = SELLER_DOMAINS[agg.normalized_name]
-        else:
+        seller_domain = SELLER_DOMAINS.get(agg.normalized_name)
+        domain_source = "mapping" if seller_domain else "fallback"
+        if not seller_domain:
             # Fallback: try to extract from seller.website or product URL
             for product in agg.products:
                 # Prefer seller.website over product.url (product.url might be Zap/Google)
                 url_to_check = product.seller.website or product.url
                 if url_to_check:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url_to_check)
-                    domain = parsed.netloc
-                    if domain.startswith("www."):
-                        domain = domain[4:]
+                    domain = _url_domain(url_to_check)
                     # Skip aggregator domains
-                    if domain and not any(agg_domain in domain for agg_domain in ["google.com", "zap.co.il", "pricez"]):
+                    if domain and not any(d in domain for d in _SITE_SEARCH_SKIP_DOMAINS):
                         seller_domain = domain
                         break
 
@@ -540,161 +781,153 @@ async def _search_multiple_products_impl(
             seller=agg.seller_name,
             normalized_name=agg.normalized_name,
             seller_domain=seller_domain,
-            domain_source="mapping" if agg.normalized_name in SELLER_DOMAINS else "fallback",
-            missing_products=list(missing_queries),
+            domain_source=domain_source,
+            missing_products=missing,
         )
 
         await report_progress(
             f"🔎 Checking {agg.seller_name}",
-            f"Looking for {len(missing_queries)} missing products at {seller_domain}..."
+            f"Looking for {len(missing)} missing products at {seller_domain}..."
         )
 
-        # Search for missing products at this seller's site using direct Google scraping
-        import httpx
-        import re
-
-        GOOGLE_HEADERS = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "he-IL,he;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
+        # Search for missing products at this seller's site using direct Google
+        # scraping, a few at a time over the pooled HTTP client
+        client = get_research_http_client()
 
-        for missing_query in missing_queries:
+        # One OR-query on the model numbers of several products first; only
+        # products it doesn't turn up get their own search. Products without
+        # a model number can't be matched to result URLs, so they aren't batched.
+        found_urls: dict[str, str] = {}
+        batch = [q for q in missing if model_tokens[q]][:_SITE_SEARCH_BATCH_SIZE]
+        if len(batch) > 1:
             try:
-                # Use Google site-specific search via direct HTTP
-                search_query = f"site:{seller_domain} {missing_query}"
-
-                params = {
-                    "q": search_query,
-                    "gl": "il",
-                    "hl": "he",
-                    "num": 5,
-                }
-
-                async with httpx.AsyncClient(timeout=15.0, headers=GOOGLE_HEADERS) as client:
-                    response = await client.get("https://www.google.com/search", params=params)
-                    if response.status_code == 200:
-                        html = response.text
-
-                        # Extract URLs from Google search results
-                        # Pattern to find search result links
-                        url_patterns = [
-                            rf'href="(https?://(?:www\.)?{re.escape(seller_domain)}[^"]*)"',
-                            rf'href="/url\?q=(https?://(?:www\.)?{re.escape(seller_domain)}[^&"]*)',
-                        ]
-
-                        result_url = None
-                        for pattern in url_patterns:
-                            matches = re.findall(pattern, html, re.IGNORECASE)
-                            if matches:
-                                result_url = matches[0]
-                                break
-
-                        if result_url:
-                            # Found the product at this seller!
-                            logger.info(
-                                "Found missing product at seller",
-                                seller=agg.seller_name,
-                                query=missing_query,
-                                url=result_url[:80],
+                async with site_search_limit:
+                    urls = await _google_site_search(
+                        client,
+                        seller_domain,
+                        "(" + " OR ".join(f'"{model_tokens[q]}"' for q in batch) + ")",
+                        num=min(5 * len(batch), 20),
+                    )
+                found_urls = _match_site_search_urls(urls, batch)
+            except Exception as e:
+                logger.warning(
+                    "Batched site search failed",
+                    seller=agg.seller_name,
+                    queries=batch,
+                    error=str(e),
+                )
+
+        async def check_missing_product(missing_query: str) -> None:
+            async with site_search_limit:
+                try:
+                    result_url = found_urls.get(missing_query)
+                    if result_url is None:
+                        urls = await _google_site_search(client, seller_domain, missing_query)
+                        result_url = urls[0] if urls else None
+
+                    if result_url:
+                        # Found the product at this seller!
+                        logger.info(
+                            "Found missing product at seller",
+                            seller=agg.seller_name,
+                            query=missing_query,
+                            url=result_url[:80],
+                        )
+
+                        # Try to get price from the page
+                        http_client = get_http_client()
+                        page_response = await http_client.get(result_url)
+                        price = None
+                        if page_response:
+                            extractor = get_price_extractor()
+                            price_result = extractor.extract(page_response.text, result_url)
+                            if price_result:
+                                price = price_result.price
+
+                        # Validate price against expected range
+                        min_price, max_price = price_ranges[missing_query]
+
+                        if price and min_price <= price <= max_price:
+                            # Price is reasonable - add to results
+                            # Preserve contact from original seller
+                            original_contact = None
+                            if agg.products:
+                                original_contact = agg.products[0].seller.whatsapp_number or agg.contact
+
+                            new_result = PriceOption(
+                                product_id=missing_query,
+                                seller=SellerInfo(
+                                    name=agg.seller_name,
+                                    website=result_url,
+                                    whatsapp_number=original_contact,
+                                    country="IL",
+                                    source="site_search",
+                                ),
+                                listed_price=price,
+                                currency="ILS",
+                                url=result_url,
+                                scraped_at=datetime.now(),
                             )
 
-                            # Try to get price from the page
-                            from src.tools.scraping.http_client import get_http_client
-                            from src.tools.scraping.price_extractor import get_price_extractor
-
-                            http_client = get_http_client()
-                            page_response = await http_client.get(result_url)
-                            price = None
-                            if page_response:
-                                extractor = get_price_extractor()
-                                price_result = extractor.extract(page_response.text, result_url)
-                                if price_result:
-                                    price = price_result.price
-
-                            # Validate price against expected range
-                            min_price, max_price = get_price_range(missing_query)
-
-                            if price and min_price <= price <= max_price:
-                                # Price is reasonable - add to results
-                                from datetime import datetime
-
-                                # Preserve contact from original seller
-                                original_contact = None
-                                if agg.products:
-                                    original_contact = agg.products[0].seller.whatsapp_number or agg.contact
-
-                                new_result = PriceOption(
-                                    product_id=missing_query,
-                                    seller=SellerInfo(
-                                        name=agg.seller_name,
-                                        website=result_url,
-                                        whatsapp_number=original_contact,
-                                        country="IL",
-                                        source="site_search",
-                                    ),
-                                    listed_price=price,
-                                    currency="ILS",
-                                    url=result_url,
-                                    scraped_at=datetime.now(),
-                                )
-
-                                if missing_query not in results_by_query:
-                                    results_by_query[missing_query] = []
-                                results_by_query[missing_query].append(new_result)
-
-                                await report_progress(
-                                    f"✅ Found at {agg.seller_name}",
-                                    f"{missing_query}: {price:,.0f} ILS"
-                                )
-                            elif price:
-                                # Price extracted but out of expected range
-                                logger.warning(
-                                    "Price out of expected range",
-                                    seller=agg.seller_name,
-                                    query=missing_query,
-                                    price=price,
-                                    expected_range=(min_price, max_price),
-                                )
-                                await report_progress(
-                                    f"⚠️ {agg.seller_name}",
-                                    f"{missing_query}: price {price:,.0f} ILS seems wrong (expected {min_price:,.0f}-{max_price:,.0f})"
-                                )
-                            else:
-                                await report_progress(
-                                    f"⚠️ {agg.seller_name}",
-                                    f"Found {missing_query} but couldn't extract price"
-                                )
-                        else:
-                            logger.debug(
-                                "Product not found at seller site",
+                            results_by_query.setdefault(missing_query, []).append(new_result)
+                            aggregator.add(missing_query, [new_result])
+
+                            await report_progress(
+                                f"✅ Found at {agg.seller_name}",
+                                f"{missing_query}: {price:,.0f} ILS"
+                            )
+                        elif price:
+                            # Price extracted but out of expected range
+                            logger.warning(
+                                "Price out of expected range",
                                 seller=agg.seller_name,
                                 query=missing_query,
+                                price=price,
+                                expected_range=(min_price, max_price),
+                            )
+                            await report_progress(
+                                f"⚠️ {agg.seller_name}",
+                                f"{missing_query}: price {price:,.0f} ILS seems wrong (expected {min_price:,.0f}-{max_price:,.0f})"
                             )
+                        else:
+                            await report_progress(
+                                f"⚠️ {agg.seller_name}",
+                                f"Found {missing_query} but couldn't extract price"
+                            )
+                    else:
+                        logger.debug(
+                            "Product not found at seller site",
+                            seller=agg.seller_name,
+                            query=missing_query,
+                        )
+
+                except Exception as e:
+                    logger.warning(
+                        "Site search failed",
+                        seller=agg.seller_name,
+                        query=missing_query,
+                        error=str(e),
+                    )
 
-            except Exception as e:
-                logger.warning(
-                    "Site search failed",
-                    seller=agg.seller_name,
-                    query=missing_query,
-                    error=str(e),
-                )
+        await asyncio.gather(*(check_missing_product(q) for q in missing))
 
-    # Re-aggregate with any newly found products
+    # Re-rank with any newly found products
     if bundle_sellers:
         await report_progress(
             "🔄 Re-aggregating",
             "Updating bundle opportunities with newly found products..."
         )
-        aggregations = aggregate_by_seller(results_by_query, top_stores)
+        aggregations = aggregator.top(top_stores)
 
     # Report final aggregation results
     bundle_sellers = [a for a in aggregations if a.product_count >= 2]
     if bundle_sellers:
-        bundle_summary = f"Found {len(bundle_sellers)} stores with bundle opportunities:\n"
-        for agg in bundle_sellers[:5]:
-            bundle_summary += f"  • {agg.seller_name}: {agg.product_count}/{len(queries)} products, {agg.total_price:,.0f} ILS total\n"
-        await report_progress("🎯 Final bundle opportunities", bundle_summary)
+        bundle_summary = [f"Found {len(bundle_sellers)} stores with bundle opportunities:"]
+        bundle_summary.extend(
+            f"  • {agg.seller_name}: {agg.product_count}/{len(queries)} products, {agg.total_price:,.0f} ILS total"
+            for agg in bundle_sellers[:5]
+        )
+        await report_progress("🎯 Final bundle opportunities", "\n".join(bundle_summary))
     else:
         await report_progress("ℹ️ No bundles", "No stores found selling multiple products")
 
@@ -711,13 +944,8 @@ async def _search_multiple_products_impl(
             output.append(f"{i}. {agg.seller_name}{rating_str}")
             output.append(f"   Offers {agg.product_count}/{len(queries)} products:")
 
-            for product in agg.products:
-                # Find which query this product matched
-                query_match = ""
-                for query, price_option in zip(agg.product_queries, agg.products):
-                    if price_option == product:
-                        query_match = query
-                        break
+            # product_queries[i] is the query products[i] matched
+            for query_match, product in zip(agg.product_queries, agg.products):
                 output.append(f"   - {query_match}: {product.listed_price:,.0f} {product.currency} | {product.url}")
 
             output.append(f"   Total: {agg.total_price:,.0f} ILS")
@@ -737,38 +965,14 @@ async def _search_multiple_products_impl(
             output.append("No results found\n")
             continue
 
-        # Rank results by combined score (price and reputation)
-        def rank_score(result: PriceOption) -> float:
-            """Lower score = better. Combines price rank with reputation penalty."""
-            price_score = result.listed_price
-            rating = result.seller.reliability_score or 3.0
-            reputation_multiplier = 1.0 - ((rating - 3.0) / 10.0)
-            return price_score * reputation_multiplier
-
-        results_sorted = sorted(results, key=rank_score)
-        top_results = results_sorted[:5]
+        # Top 5 results by combined score (price and reputation)
+        top_results = heapq.nsmallest(5, results, key=_rank_score)
 
         output.append(f"Top {len(top_results)} results (ranked by price + reputation):\n")
 
-        for i, result in enumerate(top_results, 1):
-            rating_str = ""
-            if result.seller.reliability_score:
-                rating_str = f" (Rating: {result.seller.reliability_score:.1f}/5)"
-
-            source_str = ""
-            if result.seller.source:
-                source_str = f" [{result.seller.source}]"
-
-            contact_str = ""
-            if result.seller.whatsapp_number:
-                contact_str = f"   Contact: {result.seller.whatsapp_number}\n"
-
-            output.append(
-                f"{i}. {result.seller.name}{rating_str}{source_str}\n"
-                f"   Price: {result.listed_price:,.0f} {result.currency}\n"
-                f"   URL: {result.url}\n"
-                f"{contact_str}"
-            )
+        output.extend(
+            _format_result(i, result) for i, result in enumerate(top_results, 1)
+        )
 
     return "\n".join(output)
 
@@ -801,14 +1005,6 @@ async def _search_aggregators_impl(
     Returns:
         Formatted string with results from aggregator sites
     """
-    import structlog
-    logger = structlog.get_logger()
-
-    await report_progress(
-        "🔍 Aggregator Search",
-        f"Searching price comparison sites for: {query}"
-    )
-
     all_scrapers = ScraperRegistry.get_scrapers_for_country(country)
 
     # Filter to only aggregator scrapers
@@ -820,34 +1016,41 @@ async def _search_aggregators_impl(
     all_results: list[PriceOption] = []
     errors: list[str] = []
 
-    for scraper in aggregator_scrapers:
-        await report_progress(
-            f"🔍 {scraper.name}",
-            f"Deep search on {scraper.name} for {query}..."
-        )
+    # One start event for all aggregators, then one per aggregator as it finishes
+    await report_progress(
+        "🔍 Aggregator Search",
+        f"Searching price comparison sites "
+        f"({', '.join(s.name for s in aggregator_scrapers)}) for: {query}"
+    )
+
+    results_by_scraper: dict[str, list[PriceOption]] = {}
+    async with aclosing(
+        _search_scrapers(aggregator_scrapers, [query], max_results)
+    ) as outcomes:
+        async for scraper, _, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                error = _error_text(outcome)
+                await report_progress(f"❌ {scraper.name}", f"Error: {error[:100]}")
+                await record_error(f"{scraper.name}: {error[:200]}")
+                errors.append(f"{scraper.__class__.__name__}: {error}")
+                continue
 
-        try:
-            results = await scraper.search(query, max_results)
             await record_search(scraper.name, cached=False)
 
-            if results:
-                progress_output = f"✅ Found {len(results)} listings:\n"
-                for r in results[:5]:
-                    price_str = f"{r.listed_price:,.0f} {r.currency}"
-                    rating_str = f" ({r.seller.reliability_score:.1f}★)" if r.seller.reliability_score else ""
-                    progress_output += f"  • {r.seller.name}{rating_str}: {price_str}\n"
-                if len(results) > 5:
-                    progress_output += f"  ... and {len(results) - 5} more"
-                await report_progress(f"✅ {scraper.name}", progress_output)
-                all_results.extend(results)
+            if outcome:
+                await report_progress(
+                    f"✅ {scraper.name}",
+                    _format_results_preview(
+                        f"✅ Found {len(outcome)} listings:", outcome, show_rating=True
+                    ),
+                )
+                results_by_scraper[scraper.name] = outcome
             else:
                 await report_progress(f"⚠️ {scraper.name}", "No results found")
                 await record_warning(f"{scraper.name}: No results for {query}")
 
-        except Exception as e:
-            await report_progress(f"❌ {scraper.name}", f"Error: {str(e)[:100]}")
-            await record_error(f"{scraper.name}: {str(e)[:200]}")
-            errors.append(f"{scraper.__class__.__name__}: {str(e)}")
+    for scraper in aggregator_scrapers:
+        all_results.extend(results_by_scraper.get(scraper.name, []))
 
     if not all_results:
         if errors:
@@ -873,23 +1076,9 @@ async def _search_aggregators_impl(
     # Format output
     output = [f"Aggregator Search Results for '{query}' ({len(top_results)} listings from price comparison sites):\n"]
 
-    for i, result in enumerate(top_results, 1):
-        rating_str = ""
-        if result.seller.reliability_score:
-            rating_str = f" (Rating: {result.seller.reliability_score:.1f}/5)"
-
-        source_str = f" [{result.seller.source}]" if result.seller.source else ""
-
-        contact_str = ""
-        if result.seller.whatsapp_number:
-            contact_str = f"   Contact: {result.seller.whatsapp_number}\n"
-
-        output.append(
-            f"{i}. {result.seller.name}{rating_str}{source_str}\n"
-            f"   Price: {result.listed_price:,.0f} {result.currency}\n"
-            f"   URL: {result.url}\n"
-            f"{contact_str}"
-        )
+    output.extend(
+        _format_result(i, result) for i, result in enumerate(top_results, 1)
+    )
 
     if errors:
         output.append(f"\nNote: Some aggregators had issues: {'; '.join(errors)}")
@@ -899,7 +1088,9 @@ async def _search_aggregators_impl(
 
 # Create cached version and tool version for aggregator search
 _search_aggregators_cached = cached(
-    cache_type="agent", key_prefix="search_aggregators"
+    cache_type="agent",
+    key_prefix="search_aggregators",
+    result_ttl_seconds=_empty_result_ttl,
 )(_search_aggregators_impl)
 search_aggregators = function_tool(
     _search_aggregators_cached, name_override="search_aggregators"
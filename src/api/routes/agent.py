@@ -1,7 +1,9 @@
 """API routes for running agent queries."""
 
 import asyncio
-from typing import Optional
+import sys
+from collections.abc import Coroutine
+from typing import Any, Optional
 from urllib.parse import quote
 
 from fastapi import APIRouter
@@ -9,12 +11,32 @@ from pydantic import BaseModel
 
 from agents import Runner
 from src.agents.product_research import product_research_agent
-from src.agents.product_discovery import product_discovery_agent
+from src.agents.product_discovery import (
+    get_cached_discovery_result,
+    product_discovery_agent,
+    set_cached_discovery_result,
+)
 from src.agents.orchestrator import orchestrator_agent
 from src.observability import ObservabilityHooks, get_trace_store
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 
+# Characters stripped from phone numbers for wa.me links
+_PHONE_STRIP = str.maketrans("", "", "+ -")
+
+
+def _start_background_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Start a background task, eagerly where supported (Python 3.12+).
+
+    An eager task runs inline until its first real suspension instead of
+    waiting for the next loop iteration. Only this route's own tasks are
+    started this way; the loop's default task factory is left alone.
+    """
+    loop = asyncio.get_running_loop()
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+    return loop.create_task(coro)
+
 
 class ConversationMessage(BaseModel):
     """A message in the conversation history."""
@@ -83,17 +105,30 @@ Based on the conversation history, refine the product recommendations accordingl
     )
     trace_id = trace.id if trace else ""
 
-    # Run agent in background using asyncio.create_task
-    # This schedules the coroutine on the current event loop
+    # New discovery searches reuse a cached final output; refinements depend
+    # on the conversation, so they always run the agent
+    cache_result = agent is product_discovery_agent and not request.conversation_history
+
+    # Run agent in background on the current event loop
     async def run_agent():
         try:
+            if cache_result:
+                cached_output = await get_cached_discovery_result(request.query, request.country)
+                if cached_output is not None:
+                    await hooks.end_trace(final_output=cached_output)
+                    return
+
             result = await Runner.run(agent, prompt, hooks=hooks)
+            if cache_result and isinstance(result.final_output, str) and result.final_output:
+                await set_cached_discovery_result(
+                    request.query, request.country, result.final_output
+                )
             await hooks.end_trace(final_output=result.final_output)
         except Exception as e:
             await hooks.end_trace(error=str(e))
 
-    # Create task directly on the running event loop
-    asyncio.create_task(run_agent())
+    # Start the task on the running event loop
+    _start_background_task(run_agent())
 
     return QueryResponse(trace_id=trace_id, status="started")
 
@@ -242,7 +277,7 @@ async def generate_negotiation_drafts(
         message = generate_message(products, language)
 
         # Generate wa.me link with pre-filled message
-        phone_clean = seller.phone_number.replace("+", "").replace(" ", "").replace("-", "")
+        phone_clean = seller.phone_number.translate(_PHONE_STRIP)
         wa_link = f"https://wa.me/{phone_clean}?text={quote(message)}"
 
         drafts.append(
@@ -58,6 +58,16 @@ ACTION_MAP = {
 async def receive_events(batch: EventBatch, request: Request):
     """Receive analytics events from client.
 
+    Each batch is logged as one entry per user action type plus one entry
+    for all unmapped events, not one entry per event:
+
+    - "user_action" (via log_user_action): data={"session_id": ...},
+      count, and events, a list whose items have the per-event data layout
+      of the old single-event entry (label, value, session_id, **event.data)
+    - "client_event_batch": session_id, count, and events, a list whose
+      items have the fields of the old "client_event" entry (category,
+      action, label, value, data, session_id, client_timestamp)
+
     Args:
         batch: Batch of events
         request: FastAPI request
@@ -67,33 +77,47 @@ async def receive_events(batch: EventBatch, request: Request):
     """
     session_id = batch.session_id or request.headers.get("X-Session-ID")
 
+    # Bucket the batch so it is logged as one entry per user action type plus
+    # one entry for all unmapped events, rather than one entry per event
+    user_actions: dict[UserAction, list[dict]] = {}
+    client_events: list[dict] = []
     for event in batch.events:
         # Map to UserAction if possible
-        action_key = (event.category, event.action)
-        user_action = ACTION_MAP.get(action_key)
+        user_action = ACTION_MAP.get((event.category, event.action))
 
         if user_action:
-            log_user_action(
-                action=user_action,
-                data={
-                    "label": event.label,
-                    "value": event.value,
-                    "session_id": session_id,
-                    **(event.data or {}),
-                },
-            )
+            user_actions.setdefault(user_action, []).append({
+                "label": event.label,
+                "value": event.value,
+                "session_id": session_id,
+                **(event.data or {}),
+            })
         else:
             # Log as generic event
-            logger.info(
-                "client_event",
-                category=event.category,
-                action=event.action,
-                label=event.label,
-                value=event.value,
-                data=event.data,
-                session_id=session_id,
-                client_timestamp=event.timestamp,
-            )
+            client_events.append({
+                "category": event.category,
+                "action": event.action,
+                "label": event.label,
+                "value": event.value,
+                "data": event.data,
+                "session_id": session_id,
+                "client_timestamp": event.timestamp,
+            })
+
+    for user_action, events in user_actions.items():
+        log_user_action(
+            action=user_action,
+            data={"session_id": session_id},
+            events=events,
+        )
+
+    if client_events:
+        logger.info(
+            "client_event_batch",
+            session_id=session_id,
+            count=len(client_events),
+            events=client_events,
+        )
 
     return {"received": len(batch.events)}
 
@@ -102,6 +126,12 @@ async def receive_events(batch: EventBatch, request: Request):
 async def receive_logs(batch: LogBatch, request: Request):
     """Receive log entries from client.
 
+    Logs are grouped by level and each group is logged once, at that
+    level, as "client_log_batch" with source="frontend", count, and logs:
+    a list whose items have the fields of the old single "client_log"
+    entry (message, session_id, url, user_agent, client_timestamp,
+    source, **context).
+
     Args:
         batch: Batch of log entries
         request: FastAPI request
@@ -109,20 +139,27 @@ async def receive_logs(batch: LogBatch, request: Request):
     Returns:
         Acknowledgment
     """
+    # One entry per log level instead of one per client log
+    logs_by_level: dict[str, list[dict]] = {}
     for log_entry in batch.logs:
+        logs_by_level.setdefault(log_entry.level.lower(), []).append({
+            "message": log_entry.message,
+            "session_id": log_entry.session_id,
+            "url": log_entry.url,
+            "user_agent": log_entry.user_agent,
+            "client_timestamp": log_entry.timestamp,
+            "source": "frontend",
+            **(log_entry.context or {}),
+        })
+
+    for level, logs in logs_by_level.items():
         # Map client log level to server logger method
-        level = log_entry.level.lower()
         log_method = getattr(logger, level, logger.info)
-
         log_method(
-            "client_log",
-            message=log_entry.message,
-            session_id=log_entry.session_id,
-            url=log_entry.url,
-            user_agent=log_entry.user_agent,
-            client_timestamp=log_entry.timestamp,
+            "client_log_batch",
             source="frontend",
-            **(log_entry.context or {}),
+            count=len(logs),
+            logs=logs,
         )
 
     return {"received": len(batch.logs)}
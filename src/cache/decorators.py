@@ -40,6 +40,8 @@ def cached(
     cache_type: str = "general",
     ttl_hours: Optional[int] = None,
     key_prefix: Optional[str] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+    result_ttl_seconds: Optional[Callable[[Any], Optional[int]]] = None,
 ) -> Callable[[F], F]:
     """Decorator to cache async function results.
 
@@ -50,6 +52,11 @@ def cached(
         cache_type: Category for TTL lookup (scraper, contact, http, agent)
         ttl_hours: Override TTL in hours (uses settings default if None)
         key_prefix: Override component name in key
+        should_cache: Optional predicate on the result; results it rejects
+            (e.g. transient failures) are returned but not stored
+        result_ttl_seconds: Optional function of the result returning a TTL
+            in seconds to store it with instead (e.g. a short TTL for empty
+            results); returning None keeps the default TTL
 
     Usage:
         @cached(cache_type="scraper", ttl_hours=24)
@@ -140,9 +147,22 @@ def cached(
             # Set cache miss status for observability
             _cache_hit_status.set(False)
 
+            if should_cache is not None and not should_cache(result):
+                logger.debug(
+                    "Cache miss - result not cacheable",
+                    func=func.__name__,
+                    key=key[:60],
+                    type=cache_type,
+                )
+                return result
+
             # Determine TTL
             ttl = ttl_hours if ttl_hours is not None else _get_default_ttl(cache_type)
             ttl_seconds = ttl * 3600
+            if result_ttl_seconds is not None:
+                override = result_ttl_seconds(result)
+                if override is not None:
+                    ttl_seconds = override
 
             # Cache the result
             await cache.set(
@@ -158,7 +178,7 @@ def cached(
                 func=func.__name__,
                 key=key[:60],
                 type=cache_type,
-                ttl_hours=ttl,
+                ttl_seconds=ttl_seconds,
             )
 
             return result
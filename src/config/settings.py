@@ -15,6 +15,15 @@ class Settings(BaseSettings):
         default=None,
         description="OpenAI API key (required for agent functionality)",
     )
+    extraction_llm_base_url: Optional[str] = Field(
+        default=None,
+        description="OpenAI-compatible endpoint (e.g. a local vLLM server) for the small "
+        "classification/translation/query-generation calls. If not set, uses OpenAI.",
+    )
+    extraction_llm_model: str = Field(
+        default="gpt-4o-mini",
+        description="Model name for the small extraction calls",
+    )
 
     # WhatsApp Bridge
     whatsapp_bridge_url: str = Field(
@@ -70,6 +79,20 @@ class Settings(BaseSettings):
         description="Enable trace logging (disable for tests)",
     )
 
+    # Scraping settings
+    scraper_timeout_seconds: float = Field(
+        default=30.0,
+        description="Per-scraper search timeout; slower scrapers are cancelled",
+    )
+    scraper_max_concurrency: int = Field(
+        default=4,
+        description="Max concurrent searches per scraper across all requests",
+    )
+    scraper_prefetch_enabled: bool = Field(
+        default=True,
+        description="Start the model searches as soon as research finishes, before the search tool is called",
+    )
+
     # Cache settings
     cache_enabled: bool = Field(default=True, description="Enable caching")
     cache_path: Path = Field(
@@ -87,6 +110,10 @@ class Settings(BaseSettings):
     cache_ttl_agent_hours: int = Field(
         default=24, description="TTL for agent tool results in hours"
     )
+    cache_ttl_discovery_result_seconds: int = Field(
+        default=3600,
+        description="TTL for the discovery agent's final answers (they include scraped store prices)",
+    )
     cache_memory_max_items: int = Field(
         default=1000, description="Max items in memory cache"
     )
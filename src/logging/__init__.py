@@ -465,6 +465,7 @@ def log_user_action(
     action: UserAction,
     data: Optional[dict] = None,
     duration_ms: Optional[float] = None,
+    events: Optional[list[dict]] = None,
 ):
     """Log a user action for engagement tracking.
 
@@ -472,13 +473,17 @@ def log_user_action(
         action: Type of user action
         data: Additional context data
         duration_ms: Duration of the action in milliseconds
+        events: Per-occurrence data when several actions of this type are
+            logged as a single entry
     """
+    batch = {} if events is None else {"count": len(events), "events": events}
     logger.info(
         "user_action",
         category=EventCategory.USER_ACTION.value,
         action=action.value,
         data=data or {},
         duration_ms=duration_ms,
+        **batch,
     )
 
 
@@ -39,6 +39,7 @@ from src.api.routes.logs import router as logs_router
 from src.api.routes.criteria import router as criteria_router
 from src.api.middleware import RequestLoggingMiddleware
 from src.db.base import init_db
+from src.tools.scraping.http_client import close_http_client, close_research_http_client
 from src.db import models as db_models  # noqa: F401 - Import to register models with Base
 from src.logging import configure_production_logging
 
@@ -191,8 +192,10 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up Next.js subprocess on shutdown."""
+    """Clean up Next.js subprocess and pooled HTTP connections on shutdown."""
     global nextjs_process
+    await close_http_client()
+    await close_research_http_client()
     if nextjs_process and nextjs_process.poll() is None:
         logger.info("Stopping Next.js subprocess")
         nextjs_process.terminate()
@@ -458,5 +461,15 @@ async def main():
     await runner.interactive_mode()
 
 
+def install_event_loop_policy() -> None:
+    """Use uvloop for the event loop when it is available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
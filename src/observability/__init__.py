@@ -10,12 +10,14 @@ from .hooks import (
     record_warning,
     report_progress,
 )
+from .phase_timer import PhaseTimer
 from .models import OperationalSummary, Span, SpanStatus, SpanType, Trace, TraceEvent
 from .store import TraceStore, get_trace_store, set_trace_store
 
 __all__ = [
     "ObservabilityHooks",
     "OperationalSummary",
+    "PhaseTimer",
     "record_contact_extraction",
     "record_error",
     "record_price_extraction",
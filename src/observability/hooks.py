@@ -3,6 +3,7 @@
 import json
 from typing import Any, Optional
 
+import structlog
 from agents import Agent
 from agents.items import ModelResponse, TResponseInputItem
 from agents.lifecycle import RunHooksBase
@@ -14,6 +15,8 @@ from src.cache import clear_cache_hit_status, get_cache_hit_status
 from .models import OperationalSummary, Span, SpanStatus, SpanType, Trace
 from .store import TraceStore, get_trace_store
 
+logger = structlog.get_logger()
+
 
 # Global reference to current hooks instance for progress reporting
 _current_hooks: Optional["ObservabilityHooks"] = None
@@ -317,12 +320,27 @@ class ObservabilityHooks(RunHooksBase):
         if not span_id:
             return
 
+        usage = response.usage
         await self.store.complete_span(
             self._current_trace_id,
             span_id,
             output_content=self._extract_output_content(response),
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+        )
+
+        # The agent's static instructions lead every request and tool results
+        # are appended after them, so OpenAI's automatic prefix caching should
+        # cover the instructions on every turn after the first - this shows it.
+        # Older openai-agents versions have no input_tokens_details.
+        logger.info(
+            "LLM usage",
+            agent=agent.name,
+            input_tokens=usage.input_tokens,
+            cached_input_tokens=getattr(
+                getattr(usage, "input_tokens_details", None), "cached_tokens", None
+            ),
+            output_tokens=usage.output_tokens,
         )
 
     async def on_tool_start(
@@ -0,0 +1,44 @@
+"""Per-phase latency measurement for agent tools."""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class PhaseTimer:
+    """Accumulate wall-clock time per named phase of a tool call.
+
+    Re-entering a phase adds to its total, so phases that run concurrently
+    (e.g. one per scraper) report summed time, which can exceed the total.
+
+    Usage:
+        timer = PhaseTimer()
+        with timer.phase("analyze.llm"):
+            ...
+        logger.info("Analysis timings", **timer.summary())
+    """
+
+    def __init__(self) -> None:
+        """Start the timer; the summary's total is measured from here."""
+        self._start = time.perf_counter()
+        self._phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under the given phase name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    def summary(self) -> dict[str, int]:
+        """Get phase durations in milliseconds, plus the total elapsed time.
+
+        Returns:
+            Mapping of phase name to milliseconds, in first-entered order,
+            with a final "total" entry
+        """
+        timings = {name: round(seconds * 1000) for name, seconds in self._phases.items()}
+        timings["total"] = round((time.perf_counter() - self._start) * 1000)
+        return timings
@@ -4,12 +4,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
-import uuid
+import secrets
 
 
 def generate_id() -> str:
-    """Generate a unique ID."""
-    return str(uuid.uuid4())[:8]
+    """Generate a unique ID (8 random hex characters)."""
+    # Same format as the first 8 chars of a uuid4, without building a UUID
+    # object - every scraped PriceOption and SellerInfo gets one
+    return secrets.token_hex(4)
 
 
 class NegotiationStatus(str, Enum):
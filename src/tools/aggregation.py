@@ -155,6 +155,92 @@ def normalize_seller_name(name: str, url: Optional[str] = None) -> str:
     return normalized
 
 
+class SellerAggregator:
+    """Incremental seller aggregation across multiple product queries.
+
+    Results are grouped by normalized seller name as they are added, so
+    callers can add products found later (e.g. by site-search) without
+    re-normalizing everything already grouped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        # Normalized seller name -> (query, result) pairs, in insertion order
+        self._seller_groups: dict[str, list[tuple[str, PriceOption]]] = defaultdict(list)
+
+    def add(self, query: str, results: list[PriceOption]) -> None:
+        """Group results for a query under their normalized seller names.
+
+        Args:
+            query: Product query the results were found for
+            results: PriceOptions to add
+        """
+        for result in results:
+            # Use URL for better matching
+            key = normalize_seller_name(result.seller.name, result.url)
+            self._seller_groups[key].append((query, result))
+
+    def top(self, top_stores: int = 10) -> list[SellerAggregation]:
+        """Build the seller aggregations from everything added so far.
+
+        Args:
+            top_stores: Max number of stores to return
+
+        Returns:
+            List of SellerAggregation, sorted by:
+            1. Number of products (descending)
+            2. Total price (ascending)
+        """
+        aggregations = []
+        for normalized_name, items in self._seller_groups.items():
+            # Get unique products (one per query, lowest price)
+            best_per_query: dict[str, PriceOption] = {}
+            for query, result in items:
+                if (
+                    query not in best_per_query
+                    or result.listed_price < best_per_query[query].listed_price
+                ):
+                    best_per_query[query] = result
+
+            products = list(best_per_query.values())
+
+            # Calculate aggregates
+            total_price = sum(p.listed_price for p in products)
+            ratings = [
+                p.seller.reliability_score
+                for p in products
+                if p.seller.reliability_score is not None
+            ]
+            avg_rating = sum(ratings) / len(ratings) if ratings else None
+
+            # Get contact (prefer WhatsApp)
+            contacts = [
+                p.seller.whatsapp_number for p in products if p.seller.whatsapp_number
+            ]
+            contact = contacts[0] if contacts else None
+
+            # Get sources
+            sources = list(set(p.seller.source for p in products if p.seller.source))
+
+            aggregations.append(
+                SellerAggregation(
+                    seller_name=products[0].seller.name,  # Use first occurrence
+                    normalized_name=normalized_name,
+                    products=products,
+                    product_queries=list(best_per_query.keys()),
+                    total_price=total_price,
+                    average_rating=avg_rating,
+                    contact=contact,
+                    sources=sources,
+                )
+            )
+
+        # Sort: most products first, then lowest total price
+        aggregations.sort(key=lambda a: (-a.product_count, a.total_price))
+
+        return aggregations[:top_stores]
+
+
 def aggregate_by_seller(
     results_by_query: dict[str, list[PriceOption]],
     top_stores: int = 10,
@@ -170,61 +256,7 @@ def aggregate_by_seller(
         1. Number of products (descending)
         2. Total price (ascending)
     """
-    # Group by normalized seller name
-    seller_groups: dict[str, list[tuple[str, PriceOption]]] = defaultdict(list)
-
+    aggregator = SellerAggregator()
     for query, results in results_by_query.items():
-        for result in results:
-            # Use URL for better matching
-            key = normalize_seller_name(result.seller.name, result.url)
-            seller_groups[key].append((query, result))
-
-    # Build aggregations
-    aggregations = []
-    for normalized_name, items in seller_groups.items():
-        # Get unique products (one per query, lowest price)
-        best_per_query: dict[str, PriceOption] = {}
-        for query, result in items:
-            if (
-                query not in best_per_query
-                or result.listed_price < best_per_query[query].listed_price
-            ):
-                best_per_query[query] = result
-
-        products = list(best_per_query.values())
-
-        # Calculate aggregates
-        total_price = sum(p.listed_price for p in products)
-        ratings = [
-            p.seller.reliability_score
-            for p in products
-            if p.seller.reliability_score is not None
-        ]
-        avg_rating = sum(ratings) / len(ratings) if ratings else None
-
-        # Get contact (prefer WhatsApp)
-        contacts = [
-            p.seller.whatsapp_number for p in products if p.seller.whatsapp_number
-        ]
-        contact = contacts[0] if contacts else None
-
-        # Get sources
-        sources = list(set(p.seller.source for p in products if p.seller.source))
-
-        aggregations.append(
-            SellerAggregation(
-                seller_name=products[0].seller.name,  # Use first occurrence
-                normalized_name=normalized_name,
-                products=products,
-                product_queries=list(best_per_query.keys()),
-                total_price=total_price,
-                average_rating=avg_rating,
-                contact=contact,
-                sources=sources,
-            )
-        )
-
-    # Sort: most products first, then lowest total price
-    aggregations.sort(key=lambda a: (-a.product_count, a.total_price))
-
-    return aggregations[:top_stores]
+        aggregator.add(query, results)
+    return aggregator.top(top_stores)
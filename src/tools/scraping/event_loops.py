@@ -0,0 +1,23 @@
+"""Helpers for state that is bound to an event loop."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+
+def drop_closed_loops(
+    entries: dict[Any, Any],
+    loop_of: Callable[[Any], asyncio.AbstractEventLoop] = lambda key: key,
+) -> None:
+    """Forget entries whose event loop has been closed.
+
+    Loop-bound objects (semaphores, pooled HTTP clients) can no longer be
+    used or closed through a closed loop; dropping the last reference lets
+    them be garbage-collected.
+
+    Args:
+        entries: Mapping keyed by event loop, or by a key containing one
+        loop_of: Gets the event loop from a key (default: the key itself)
+    """
+    for key in [key for key in entries if loop_of(key).is_closed()]:
+        del entries[key]
@@ -7,6 +7,39 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Alphanumeric runs in a lowercased query that may be model numbers
+_QUERY_TOKEN_RE = re.compile(r'[a-z0-9]{4,}')
+
+# Brand names (English and Hebrew) that must appear in the product when queried
+RELEVANCE_BRANDS = (
+    'samsung', 'סמסונג',
+    'apple', 'אפל',
+    'sony', 'סוני',
+    'lg', 'אל ג\'י',
+    'philips', 'פיליפס',
+    'bosch', 'בוש',
+    'siemens', 'סימנס',
+    'electra', 'אלקטרה',
+    'tadiran', 'תדיראן',
+    'amcor', 'אמקור',
+)
+
+# One scan finds every brand occurrence; the lookahead lets matches overlap,
+# same as testing each brand as a substring
+_RELEVANCE_BRAND_RE = re.compile(
+    "(?=(" + "|".join(re.escape(b) for b in sorted(RELEVANCE_BRANDS, key=len, reverse=True)) + "))"
+)
+
+# Common model number patterns, in priority order
+_MODEL_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'[A-Z]{2,3}[-]?\d{2,}[A-Z]{0,3}\d*[A-Z]*',  # Samsung: RF72DG9620B1
+        r'[A-Z]\d{2,}[A-Z]{0,2}\d*',  # Short codes: A2345XY
+        r'\d{2,}[A-Z]{2,}\d*',  # Number first: 55UQ8000
+    )
+)
+
 
 def is_relevant_product(query: str, product_name: str, strict_model_match: bool = True) -> bool:
     """Check if product name is relevant to the search query.
@@ -26,7 +59,7 @@ def is_relevant_product(query: str, product_name: str, strict_model_match: bool
     product_lower = product_name.lower()
 
     # Extract potential model numbers from query (alphanumeric sequences)
-    model_patterns = re.findall(r'[a-z0-9]{4,}', query_lower)
+    model_patterns = _QUERY_TOKEN_RE.findall(query_lower)
 
     # Check if any significant part of the query appears in product name
     for pattern in model_patterns:
@@ -51,19 +84,7 @@ def is_relevant_product(query: str, product_name: str, strict_model_match: bool
                     return True
 
     # Check brand names
-    brands = [
-        'samsung', 'סמסונג',
-        'apple', 'אפל',
-        'sony', 'סוני',
-        'lg', 'אל ג\'י',
-        'philips', 'פיליפס',
-        'bosch', 'בוש',
-        'siemens', 'סימנס',
-        'electra', 'אלקטרה',
-        'tadiran', 'תדיראן',
-        'amcor', 'אמקור',
-    ]
-    query_brands = [b for b in brands if b in query_lower]
+    query_brands = set(_RELEVANCE_BRAND_RE.findall(query_lower))
     if query_brands:
         # If brand specified in query, it must appear in product
         for brand in query_brands:
@@ -89,15 +110,8 @@ def extract_model_number(text: str) -> Optional[str]:
     Returns:
         Extracted model number or None
     """
-    # Common model number patterns
-    patterns = [
-        r'[A-Z]{2,3}[-]?\d{2,}[A-Z]{0,3}\d*[A-Z]*',  # Samsung: RF72DG9620B1
-        r'[A-Z]\d{2,}[A-Z]{0,2}\d*',  # Short codes: A2345XY
-        r'\d{2,}[A-Z]{2,}\d*',  # Number first: 55UQ8000
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _MODEL_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(0).upper()
 
@@ -119,49 +133,74 @@ def normalize_price_for_comparison(price: float, currency: str = "ILS") -> float
     return price
 
 
-def deduplicate_results(
-    results: list, price_bucket_size: float = 150.0, min_price: float = 20.0
-) -> list:
-    """Deduplicate search results by seller and price bucket.
+class ResultDeduplicator:
+    """Incremental seller/price-bucket deduplication.
 
-    Also filters out unreasonably low prices that are likely extraction errors.
+    Lets callers drop duplicates as results arrive instead of collecting
+    everything and deduplicating in a second pass.
+    """
 
-    Args:
-        results: List of PriceOption objects
-        price_bucket_size: Size of price buckets for grouping similar prices
-        min_price: Minimum valid price (filters likely extraction errors)
+    def __init__(self, price_bucket_size: float = 150.0, min_price: float = 20.0):
+        """Initialize the deduplicator.
 
-    Returns:
-        Deduplicated list of PriceOption objects
-    """
-    seen = set()
-    unique_results = []
+        Args:
+            price_bucket_size: Size of price buckets for grouping similar prices
+            min_price: Minimum valid price (filters likely extraction errors)
+        """
+        self.price_bucket_size = price_bucket_size
+        self.min_price = min_price
+        self._seen: set[tuple[str, int]] = set()
+
+    def accept(self, result) -> bool:
+        """Check a PriceOption, recording it if it is not a duplicate.
 
-    for result in results:
+        Returns:
+            True if the result should be kept, False if it is filtered
+        """
         # Filter unreasonably low prices (likely extraction errors)
-        if result.listed_price < min_price:
+        if result.listed_price < self.min_price:
             logger.warning(
                 "Filtered unreasonably low price",
                 seller=result.seller.name,
                 price=result.listed_price,
                 url=result.url[:80] if result.url else None,
             )
-            continue
+            return False
 
         # Create deduplication key: seller name + price bucket
         seller_name = result.seller.name.lower().strip()
-        price_bucket = int(result.listed_price / price_bucket_size)
+        price_bucket = int(result.listed_price / self.price_bucket_size)
         key = (seller_name, price_bucket)
 
-        if key not in seen:
-            seen.add(key)
-            unique_results.append(result)
-        else:
+        if key in self._seen:
             logger.debug(
                 "Duplicate filtered",
                 seller=seller_name,
                 price=result.listed_price,
             )
+            return False
+
+        self._seen.add(key)
+        return True
+
+
+def deduplicate_results(
+    results: list, price_bucket_size: float = 150.0, min_price: float = 20.0
+) -> list:
+    """Deduplicate search results by seller and price bucket.
+
+    Also filters out unreasonably low prices that are likely extraction errors.
+
+    Args:
+        results: List of PriceOption objects
+        price_bucket_size: Size of price buckets for grouping similar prices
+        min_price: Minimum valid price (filters likely extraction errors)
+
+    Returns:
+        Deduplicated list of PriceOption objects
+    """
+    deduplicator = ResultDeduplicator(price_bucket_size, min_price)
+    unique_results = [result for result in results if deduplicator.accept(result)]
 
     logger.info(
         "Deduplication complete",
@@ -7,6 +7,7 @@ from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 import structlog
 
 from playwright.async_api import async_playwright, Page
@@ -93,7 +94,7 @@ class GoogleSearchScraperSerpAPI(BaseScraper):
                         continue
 
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
 
                     organic_results = data.get("organic_results", [])
                     logger.info("Got Google organic results", count=len(organic_results))
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 import httpx
+import orjson
 import structlog
 
 from src.config.settings import settings
@@ -86,7 +87,7 @@ class GoogleShoppingScraperSerpAPI(BaseScraper):
                         continue
 
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
 
                     shopping_results = data.get("shopping_results", [])
                     logger.info("Got Google Shopping results", count=len(shopping_results))
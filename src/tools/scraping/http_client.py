@@ -1,12 +1,14 @@
 """Robust HTTP client with rate limiting, retries, and error handling."""
 
 import asyncio
+from operator import itemgetter
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
 import structlog
 
+from src.tools.scraping.event_loops import drop_closed_loops
 from src.tools.scraping.rate_limiter import get_rate_limiter
 
 logger = structlog.get_logger()
@@ -24,6 +26,23 @@ BROWSER_HEADERS = {
 # Domains with known SSL issues - use verify=False
 SSL_BYPASS_DOMAINS = {"wisebuy.co.il", "www.wisebuy.co.il"}
 
+# Connection pool limits for the shared clients
+POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Timeout and pool limits for the research clients (Google research queries)
+RESEARCH_TIMEOUT = 15.0
+RESEARCH_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+
+async def _close_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Close a pooled client on the event loop its connections belong to."""
+    if loop is asyncio.get_running_loop():
+        await client.aclose()
+    elif loop.is_running():
+        # Owned by a loop in another thread (e.g. the dev CLI's API server)
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+    # Otherwise the loop has stopped and the client can only be dropped
+
 
 class RobustHttpClient:
     """HTTP client with rate limiting, retries, and graceful error handling."""
@@ -45,6 +64,40 @@ class RobustHttpClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self._rate_limiter = get_rate_limiter()
+        # Pooled clients by (event loop, SSL verification mode)
+        self._clients: dict[tuple[asyncio.AbstractEventLoop, bool], httpx.AsyncClient] = {}
+
+    def _get_client(self, verify_ssl: bool) -> httpx.AsyncClient:
+        """Get the running loop's pooled client for an SSL mode, creating it if needed.
+
+        Reusing one client keeps TCP/TLS connections alive across requests.
+        Connections are bound to an event loop, so each running loop gets its
+        own client (e.g. API thread vs. CLI loop) rather than replacing the
+        other loop's client while it may still be in use.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get((loop, verify_ssl))
+        if client is not None and not client.is_closed:
+            return client
+
+        # Clients of closed loops can only be dropped; their sockets are
+        # released when they are garbage-collected
+        drop_closed_loops(self._clients, loop_of=itemgetter(0))
+        client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            verify=verify_ssl,
+            limits=POOL_LIMITS,
+        )
+        self._clients[(loop, verify_ssl)] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled clients and their connections."""
+        clients = list(self._clients.items())
+        self._clients.clear()
+        for (loop, _), client in clients:
+            await _close_client(loop, client)
 
     async def get(
         self,
@@ -77,62 +130,58 @@ class RobustHttpClient:
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    verify=verify_ssl,
-                ) as client:
-                    response = await client.get(
-                        url, headers=merged_headers, params=params
-                    )
+                client = self._get_client(verify_ssl)
+                response = await client.get(
+                    url, headers=merged_headers, params=params
+                )
 
-                    # Handle rate limiting (429)
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning(
-                            "Rate limited by server",
-                            url=url,
-                            retry_after=retry_after,
-                            attempt=attempt + 1,
-                        )
-                        await asyncio.sleep(min(retry_after, 30))
+                # Handle rate limiting (429)
+                if response.status_code == 429:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    logger.warning(
+                        "Rate limited by server",
+                        url=url,
+                        retry_after=retry_after,
+                        attempt=attempt + 1,
+                    )
+                    await asyncio.sleep(min(retry_after, 30))
+                    continue
+
+                # Handle 403 with retry
+                if response.status_code == 403:
+                    logger.warning(
+                        "Forbidden response",
+                        url=url,
+                        attempt=attempt + 1,
+                    )
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
                         continue
+                    return None
+
+                # Handle other client errors (4xx)
+                if 400 <= response.status_code < 500:
+                    logger.warning(
+                        "Client error",
+                        url=url,
+                        status=response.status_code,
+                    )
+                    return None
+
+                # Handle server errors (5xx) with retry
+                if response.status_code >= 500:
+                    logger.warning(
+                        "Server error",
+                        url=url,
+                        status=response.status_code,
+                        attempt=attempt + 1,
+                    )
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                        continue
+                    return None
 
-                    # Handle 403 with retry
-                    if response.status_code == 403:
-                        logger.warning(
-                            "Forbidden response",
-                            url=url,
-                            attempt=attempt + 1,
-                        )
-                        if attempt < self.max_retries - 1:
-                            await asyncio.sleep(self.retry_delay * (attempt + 1))
-                            continue
-                        return None
-
-                    # Handle other client errors (4xx)
-                    if 400 <= response.status_code < 500:
-                        logger.warning(
-                            "Client error",
-                            url=url,
-                            status=response.status_code,
-                        )
-                        return None
-
-                    # Handle server errors (5xx) with retry
-                    if response.status_code >= 500:
-                        logger.warning(
-                            "Server error",
-                            url=url,
-                            status=response.status_code,
-                            attempt=attempt + 1,
-                        )
-                        if attempt < self.max_retries - 1:
-                            await asyncio.sleep(self.retry_delay * (attempt + 1))
-                            continue
-                        return None
-
-                    return response
+                return response
 
             except httpx.TimeoutException:
                 logger.warning(
@@ -179,3 +228,41 @@ def reset_http_client() -> None:
     """Reset the global HTTP client (useful for testing)."""
     global _http_client
     _http_client = None
+
+
+async def close_http_client() -> None:
+    """Close the global HTTP client's pooled connections and reset it."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Pooled clients for the Google research queries, one per event loop.
+# Research requests are stateless GETs, so one process-wide pool is safe.
+_research_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_research_http_client() -> httpx.AsyncClient:
+    """Get the running loop's pooled research HTTP client, creating it if needed.
+
+    Keeps connections to Google and seller sites alive across the research
+    and site-search calls of both the discovery and research agents.
+    """
+    loop = asyncio.get_running_loop()
+    client = _research_http_clients.get(loop)
+    if client is not None and not client.is_closed:
+        return client
+
+    drop_closed_loops(_research_http_clients)
+    client = httpx.AsyncClient(timeout=RESEARCH_TIMEOUT, limits=RESEARCH_POOL_LIMITS)
+    _research_http_clients[loop] = client
+    return client
+
+
+async def close_research_http_client() -> None:
+    """Close the pooled research HTTP clients' connections."""
+    clients = list(_research_http_clients.items())
+    _research_http_clients.clear()
+    for loop, client in clients:
+        await _close_client(loop, client)
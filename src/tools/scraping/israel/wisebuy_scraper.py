@@ -22,6 +22,15 @@ WISEBUY_HEADERS = {
     "Accept-Language": "he,en;q=0.9",
 }
 
+# Price patterns for _parse_price, tried in order (compiled once - this runs per seller)
+_PRICE_PATTERNS = [
+    re.compile(r"₪?\s*([\d,]+(?:\.\d{1,2})?)", re.IGNORECASE),
+    re.compile(r"([\d,]+(?:\.\d{1,2})?)\s*(?:₪|ש[\"']?ח|ILS)", re.IGNORECASE),
+    re.compile(r"(?:מחיר|price)[:\s]*([\d,]+(?:\.\d{1,2})?)", re.IGNORECASE),
+    re.compile(r"([\d]{3,}(?:,\d{3})*(?:\.\d{1,2})?)", re.IGNORECASE),
+]
+_RATING_RE = re.compile(r"(\d+\.?\d*)")
+
 
 @ScraperRegistry.register("IL", "wisebuy")
 class WiseBuyScraper(BaseScraper):
@@ -246,7 +255,7 @@ class WiseBuyScraper(BaseScraper):
         if rating_elem:
             rating_str = rating_elem.get("data-rating") or rating_elem.get_text()
             try:
-                rating = float(re.search(r"(\d+\.?\d*)", rating_str).group(1))
+                rating = float(_RATING_RE.search(rating_str).group(1))
             except (AttributeError, ValueError):
                 pass
 
@@ -282,16 +291,8 @@ class WiseBuyScraper(BaseScraper):
         if not price_text:
             return None
 
-        # Price patterns
-        price_patterns = [
-            r"₪?\s*([\d,]+(?:\.\d{1,2})?)",
-            r"([\d,]+(?:\.\d{1,2})?)\s*(?:₪|ש[\"']?ח|ILS)",
-            r"(?:מחיר|price)[:\s]*([\d,]+(?:\.\d{1,2})?)",
-            r"([\d]{3,}(?:,\d{3})*(?:\.\d{1,2})?)",
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, price_text, re.IGNORECASE)
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(price_text)
             if match:
                 price_str = match.group(1).replace(",", "")
                 try:
@@ -30,6 +30,27 @@ ZAP_HEADERS = {
     "Accept-Language": "he,en;q=0.9",
 }
 
+# Price patterns for _parse_price, tried in order (compiled once - this runs per listing):
+# ₪1,234(.99) / 1,234₪ or 1,234 ש"ח / Hebrew or English prefix / bare 3+ digit number
+_PRICE_PATTERNS = [
+    re.compile(r"₪?\s*([\d,]+(?:\.\d{1,2})?)", re.IGNORECASE),
+    re.compile(r"([\d,]+(?:\.\d{1,2})?)\s*(?:₪|ש[\"']?ח|ILS)", re.IGNORECASE),
+    re.compile(r"(?:ממחיר|החל מ|מחיר|price)[:\s]*([\d,]+(?:\.\d{1,2})?)", re.IGNORECASE),
+    re.compile(r"([\d]{3,}(?:,\d{3})*(?:\.\d{1,2})?)", re.IGNORECASE),
+]
+_PRICE_STRIP_RE = re.compile(r"[₪,\s]|ש\"ח|ILS")
+_BID_PRICE_RE = re.compile(r"₪?([\d,]+)")
+_URL_MODEL_RE = re.compile(r'([a-zA-Z]+[-_]?[a-zA-Z0-9]{5,15})')
+_QUERY_TOKEN_RE = re.compile(r'[a-z0-9]{4,}')
+
+# Brands that must appear in the product when the query names them
+_RELEVANCE_BRANDS = ('samsung', 'סמסונג', 'apple', 'אפל', 'sony', 'lg', 'philips', 'bosch')
+# One scan of the query finds every brand; the lookahead lets matches overlap,
+# same as testing each brand as a substring
+_RELEVANCE_BRAND_RE = re.compile(
+    "(?=(" + "|".join(re.escape(b) for b in sorted(_RELEVANCE_BRANDS, key=len, reverse=True)) + "))"
+)
+
 
 @ScraperRegistry.register("IL", "zap_http")
 class ZapHttpScraper(BaseScraper):
@@ -121,13 +142,13 @@ class ZapHttpScraper(BaseScraper):
         if model_elem:
             model_number = model_elem.get_text(strip=True)
         if not model_number:
-            import re
             from urllib.parse import unquote
             decoded_url = unquote(page_url)
-            model_match = re.search(r'([a-zA-Z]+[-_]?[a-zA-Z0-9]{5,15})', decoded_url)
+            model_match = _URL_MODEL_RE.search(decoded_url)
             if model_match:
                 potential_model = model_match.group(1).upper()
-                if re.search(r'[A-Z]', potential_model) and re.search(r'[0-9]', potential_model):
+                # The match starts with letters, so it only needs a digit too
+                if any(c.isdigit() for c in potential_model):
                     model_number = potential_model
 
         if model_number and model_number not in product_name:
@@ -336,7 +357,7 @@ class ZapHttpScraper(BaseScraper):
         if not price:
             # Fallback: search in text
             all_text = bid.get_text()
-            price_match = re.search(r"₪?([\d,]+)", all_text)
+            price_match = _BID_PRICE_RE.search(all_text)
             if price_match:
                 price = self._parse_price(price_match.group(1))
 
@@ -558,15 +579,8 @@ class ZapHttpScraper(BaseScraper):
         # First try to extract just the numeric part with regex
         # This handles Hebrew prefixes like "ממחיר" (from price), "החל מ" (starting from), etc.
         # Match pattern: optional currency, then digits with optional comma/period separators
-        price_patterns = [
-            r"₪?\s*([\d,]+(?:\.\d{1,2})?)",  # ₪1,234 or ₪1,234.99
-            r"([\d,]+(?:\.\d{1,2})?)\s*(?:₪|ש[\"']?ח|ILS)",  # 1,234₪ or 1,234 ש"ח
-            r"(?:ממחיר|החל מ|מחיר|price)[:\s]*([\d,]+(?:\.\d{1,2})?)",  # Hebrew/English prefixes
-            r"([\d]{3,}(?:,\d{3})*(?:\.\d{1,2})?)",  # Just numbers with optional commas/decimals
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, price_text, re.IGNORECASE)
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(price_text)
             if match:
                 price_str = match.group(1).replace(",", "")
                 try:
@@ -578,7 +592,7 @@ class ZapHttpScraper(BaseScraper):
                     continue
 
         # Fallback: try original simple approach
-        cleaned = re.sub(r"[₪,\s]|ש\"ח|ILS", "", price_text)
+        cleaned = _PRICE_STRIP_RE.sub("", price_text)
         try:
             price = float(cleaned)
             if 1 <= price <= 1_000_000:
@@ -788,7 +802,7 @@ class ZapHttpScraper(BaseScraper):
         product_lower = product_name.lower()
 
         # Extract potential model numbers from query (alphanumeric sequences)
-        model_patterns = re.findall(r'[a-z0-9]{4,}', query_lower)
+        model_patterns = _QUERY_TOKEN_RE.findall(query_lower)
 
         # Check if any significant part of the query appears in product name
         for pattern in model_patterns:
@@ -802,8 +816,7 @@ class ZapHttpScraper(BaseScraper):
                     return True
 
         # Check brand names
-        brands = ['samsung', 'סמסונג', 'apple', 'אפל', 'sony', 'lg', 'philips', 'bosch']
-        query_brands = [b for b in brands if b in query_lower]
+        query_brands = set(_RELEVANCE_BRAND_RE.findall(query_lower))
         if query_brands:
             # If brand specified in query, it must appear in product
             for brand in query_brands:
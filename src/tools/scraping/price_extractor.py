@@ -9,6 +9,21 @@ from bs4 import BeautifulSoup
 
 logger = structlog.get_logger()
 
+# Price number pattern: handles both comma-formatted and plain numbers
+# Examples: 50, 999, 1234, 12345, 1,234, 12,345, 123,456
+_PRICE_NUM = r"([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{1,2})?|[0-9]+(?:\.[0-9]{1,2})?)"
+
+# Shekel price formats, in priority order
+_SHEKEL_PRICE_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
+        rf"₪\s*{_PRICE_NUM}",  # ₪1,234 or ₪1234
+        rf"{_PRICE_NUM}\s*₪",  # 1,234₪ or 1234₪
+        rf'{_PRICE_NUM}\s*ש["\']?ח',  # 1,234 ש"ח
+        rf"ILS\s*{_PRICE_NUM}",  # ILS 1,234
+    )
+)
+
 
 class PriceResult(NamedTuple):
     """Price extraction result with confidence score."""
@@ -315,19 +330,8 @@ class PriceExtractor:
         if not text:
             return None
 
-        # Price number pattern: handles both comma-formatted and plain numbers
-        # Examples: 50, 999, 1234, 12345, 1,234, 12,345, 123,456
-        price_num = r"([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{1,2})?|[0-9]+(?:\.[0-9]{1,2})?)"
-
-        patterns = [
-            rf"₪\s*{price_num}",  # ₪1,234 or ₪1234
-            rf"{price_num}\s*₪",  # 1,234₪ or 1234₪
-            rf'{price_num}\s*ש["\']?ח',  # 1,234 ש"ח
-            rf"ILS\s*{price_num}",  # ILS 1,234
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _SHEKEL_PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 price_str = match.group(1).replace(",", "")
                 try:
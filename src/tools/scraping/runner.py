@@ -0,0 +1,61 @@
+"""Run scraper searches under per-scraper concurrency caps and timeouts."""
+
+import asyncio
+
+from src.config.settings import settings
+from src.observability import PhaseTimer
+from src.state.models import PriceOption
+from src.tools.scraping.base_scraper import BaseScraper
+from src.tools.scraping.event_loops import drop_closed_loops
+
+# Per-scraper concurrency caps, shared across requests so parallel queries
+# don't exceed a site's fair-use budget. A semaphore is bound to the loop it
+# is first used on, so each running loop (API thread vs. CLI loop) gets its own.
+_scraper_semaphores: dict[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = {}
+
+
+def get_scraper_semaphore(name: str) -> asyncio.Semaphore:
+    """Get the running loop's concurrency cap for a scraper (creates if needed)."""
+    loop = asyncio.get_running_loop()
+    semaphores = _scraper_semaphores.get(loop)
+    if semaphores is None:
+        # Drop the caps of loops that have since been closed
+        drop_closed_loops(_scraper_semaphores)
+        semaphores = _scraper_semaphores[loop] = {}
+
+    semaphore = semaphores.get(name)
+    if semaphore is None:
+        semaphore = semaphores[name] = asyncio.Semaphore(settings.scraper_max_concurrency)
+    return semaphore
+
+
+def reset_scraper_semaphores() -> None:
+    """Reset the per-scraper concurrency caps (for testing)."""
+    _scraper_semaphores.clear()
+
+
+async def run_scraper(
+    scraper: BaseScraper,
+    query: str,
+    max_results: int,
+    timer: PhaseTimer | None = None,
+) -> list[PriceOption] | Exception:
+    """Run one scraper search under the per-scraper concurrency cap and timeout.
+
+    The timeout starts once a slot is acquired, so queueing behind the
+    scraper's other searches doesn't count against it. If a timer is given,
+    the search is timed as "search.scraper.<name>" (excluding queueing).
+
+    Returns the exception instead of raising, so a slow or failing scraper
+    doesn't cancel its siblings in the task group.
+    """
+    try:
+        async with get_scraper_semaphore(scraper.name):
+            if timer is None:
+                async with asyncio.timeout(settings.scraper_timeout_seconds):
+                    return await scraper.search(query, max_results=max_results)
+            with timer.phase(f"search.scraper.{scraper.name}"):
+                async with asyncio.timeout(settings.scraper_timeout_seconds):
+                    return await scraper.search(query, max_results=max_results)
+    except Exception as e:
+        return e
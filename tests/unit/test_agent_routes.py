@@ -1,10 +1,13 @@
 """Tests for agent API routes."""
 
+import asyncio
+import sys
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.api.routes.agent import router as agent_router
+from src.api.routes.agent import _start_background_task, router as agent_router
 
 
 def create_test_app() -> FastAPI:
@@ -313,3 +316,23 @@ class TestGenerateDrafts:
         assert "המוצרים הבאים" in draft["message"]
         # Should mention bulk purchase discount
         assert "במרוכז" in draft["message"]
+
+
+class TestStartBackgroundTask:
+    """Tests for the background-task helper used by POST /agent/run."""
+
+    @pytest.mark.asyncio
+    async def test_runs_eagerly_where_supported(self):
+        """Should run inline up to the first await on 3.12+, and complete either way."""
+        steps = []
+
+        async def work():
+            steps.append("started")
+            await asyncio.sleep(0)
+            steps.append("finished")
+
+        task = _start_background_task(work())
+        assert steps == (["started"] if sys.version_info >= (3, 12) else [])
+
+        await task
+        assert steps == ["started", "finished"]
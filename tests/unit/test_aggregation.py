@@ -1,8 +1,16 @@
 """Tests for seller aggregation logic."""
 
+from datetime import datetime
+
 import pytest
 
-from src.tools.aggregation import normalize_seller_name, ZAP_STORE_NAMES
+from src.state.models import PriceOption, SellerInfo
+from src.tools.aggregation import (
+    SellerAggregator,
+    aggregate_by_seller,
+    normalize_seller_name,
+    ZAP_STORE_NAMES,
+)
 
 
 class TestNormalizeSellerName:
@@ -125,3 +133,46 @@ class TestZapStoreNames:
         """רכישה בזאפ is a marketplace section, not Zap's own store."""
         # Third-party sellers list under רכישה בזאפ, so it's not a Zap store name
         assert "רכישה בזאפ" not in ZAP_STORE_NAMES
+
+
+def _option(query: str, seller: str, price: float) -> PriceOption:
+    """Create a PriceOption for aggregation tests."""
+    return PriceOption(
+        product_id=query,
+        seller=SellerInfo(name=seller, country="IL"),
+        listed_price=price,
+        currency="ILS",
+        url=f"https://{seller.lower()}.co.il/{query}",
+        scraped_at=datetime.now(),
+    )
+
+
+class TestSellerAggregator:
+    """Tests for incremental seller aggregation."""
+
+    def test_matches_aggregate_by_seller(self):
+        """Adding query by query should give the same result as aggregate_by_seller."""
+        results_by_query = {
+            "fridge": [_option("fridge", "KSP", 3000), _option("fridge", "Bug", 3100)],
+            "oven": [_option("oven", "KSP", 2000), _option("oven", "KSP", 1900)],
+        }
+        aggregator = SellerAggregator()
+        for query, results in results_by_query.items():
+            aggregator.add(query, results)
+
+        assert aggregator.top() == aggregate_by_seller(results_by_query)
+
+    def test_later_results_update_bundles(self):
+        """Results added after a top() call should be included in the next one."""
+        aggregator = SellerAggregator()
+        aggregator.add("fridge", [_option("fridge", "KSP", 3000), _option("fridge", "Bug", 3100)])
+        aggregator.add("oven", [_option("oven", "KSP", 2000)])
+        assert aggregator.top()[0].normalized_name == "ksp"
+
+        aggregator.add("oven", [_option("oven", "Bug", 1000)])
+        top = aggregator.top()
+
+        assert [(a.normalized_name, a.product_count, a.total_price) for a in top] == [
+            ("bug", 2, 4100),
+            ("ksp", 2, 5000),
+        ]
@@ -0,0 +1,95 @@
+"""Tests for analytics API routes."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes.analytics import router as analytics_router
+from src.logging import UserAction
+
+
+def create_test_app() -> FastAPI:
+    """Create a minimal FastAPI app for testing."""
+    app = FastAPI()
+    app.include_router(analytics_router)
+    return app
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(create_test_app())
+
+
+class TestReceiveEvents:
+    """Tests for POST /api/analytics/events endpoint."""
+
+    def test_events_logged_once_per_action_type(self, client):
+        """Should log one entry per user action type and one for unmapped events."""
+        events = [
+            {"category": "search", "action": "submit", "label": "tv", "timestamp": 1},
+            {"category": "search", "action": "submit", "label": "fridge", "timestamp": 2},
+            {"category": "contact", "action": "whatsapp", "timestamp": 3},
+            {"category": "misc", "action": "scroll", "timestamp": 4},
+            {"category": "misc", "action": "hover", "timestamp": 5},
+        ]
+
+        with patch("src.api.routes.analytics.log_user_action") as log_action, \
+                patch("src.api.routes.analytics.logger") as logger:
+            response = client.post(
+                "/api/analytics/events",
+                json={"events": events, "session_id": "s1"},
+            )
+
+        assert response.json() == {"received": 5}
+
+        assert log_action.call_count == 2
+        by_action = {c.kwargs["action"]: c.kwargs for c in log_action.call_args_list}
+        search = by_action[UserAction.SEARCH_SUBMIT]
+        assert search["data"] == {"session_id": "s1"}
+        assert search["events"][0] == {"label": "tv", "value": None, "session_id": "s1"}
+        assert [e["label"] for e in search["events"]] == ["tv", "fridge"]
+        assert len(by_action[UserAction.WHATSAPP_CLICK]["events"]) == 1
+
+        logger.info.assert_called_once()
+        kwargs = logger.info.call_args.kwargs
+        assert kwargs["session_id"] == "s1"
+        assert [e["action"] for e in kwargs["events"]] == ["scroll", "hover"]
+        assert kwargs["events"][0] == {
+            "category": "misc",
+            "action": "scroll",
+            "label": None,
+            "value": None,
+            "data": None,
+            "session_id": "s1",
+            "client_timestamp": 4,
+        }
+
+
+class TestReceiveLogs:
+    """Tests for POST /api/analytics/logs endpoint."""
+
+    def test_logs_grouped_by_level(self, client):
+        """Should log one entry per client log level."""
+        logs = [
+            {"level": "ERROR", "message": "boom", "timestamp": "t1", "context": {"code": 1}},
+            {"level": "info", "message": "a", "timestamp": "t2"},
+            {"level": "info", "message": "b", "timestamp": "t3"},
+        ]
+
+        logger = MagicMock()
+        with patch("src.api.routes.analytics.logger", logger):
+            response = client.post("/api/analytics/logs", json={"logs": logs})
+
+        assert response.json() == {"received": 3}
+
+        logger.error.assert_called_once()
+        error_logs = logger.error.call_args.kwargs["logs"]
+        assert error_logs[0]["message"] == "boom"
+        assert error_logs[0]["code"] == 1
+        assert error_logs[0]["source"] == "frontend"
+
+        logger.info.assert_called_once()
+        assert [entry["message"] for entry in logger.info.call_args.kwargs["logs"]] == ["a", "b"]
@@ -248,6 +248,44 @@ class TestCacheDecorator:
                 assert call_count == 0
                 mock_cache_manager.set.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_should_cache_rejects_result(self, mock_cache_manager):
+        """Test that results rejected by should_cache are returned but not stored."""
+        @cached(cache_type="test", should_cache=lambda result: result != "error")
+        async def my_func(arg1: str) -> str:
+            return arg1
+
+        with patch("src.cache.decorators.get_cache_manager", return_value=mock_cache_manager):
+            with patch("src.cache.decorators.settings") as mock_settings:
+                mock_settings.cache_enabled = True
+
+                assert await my_func("error") == "error"
+                mock_cache_manager.set.assert_not_called()
+
+                assert await my_func("ok") == "ok"
+                mock_cache_manager.set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_result_ttl_overrides_default(self, mock_cache_manager):
+        """Test that result_ttl_seconds sets the TTL per result, None keeping the default."""
+        @cached(
+            cache_type="test",
+            ttl_hours=1,
+            result_ttl_seconds=lambda result: 60 if result == "empty" else None,
+        )
+        async def my_func(arg1: str) -> str:
+            return arg1
+
+        with patch("src.cache.decorators.get_cache_manager", return_value=mock_cache_manager):
+            with patch("src.cache.decorators.settings") as mock_settings:
+                mock_settings.cache_enabled = True
+
+                await my_func("empty")
+                assert mock_cache_manager.set.call_args.kwargs["ttl_seconds"] == 60
+
+                await my_func("full")
+                assert mock_cache_manager.set.call_args.kwargs["ttl_seconds"] == 3600
+
     @pytest.mark.asyncio
     async def test_no_cache_bypasses_cache(self, mock_cache_manager):
         """Test that no_cache=True bypasses the cache."""
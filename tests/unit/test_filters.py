@@ -0,0 +1,99 @@
+"""Tests for shared scraper relevance filters."""
+
+from datetime import datetime
+
+from src.state.models import PriceOption, SellerInfo
+from src.tools.scraping.filters import (
+    ResultDeduplicator,
+    deduplicate_results,
+    extract_model_number,
+    is_relevant_product,
+)
+
+
+def make_price_option(seller_name: str, price: float) -> PriceOption:
+    """Helper to create a PriceOption for testing."""
+    return PriceOption(
+        product_id="test-query",
+        product_name="Bosch WAN24170BY",
+        seller=SellerInfo(
+            name=seller_name,
+            website=f"https://{seller_name.lower()}.co.il",
+            country="IL",
+            source="test",
+        ),
+        listed_price=price,
+        currency="ILS",
+        url=f"https://{seller_name.lower()}.co.il/{price}",
+        scraped_at=datetime.now(),
+    )
+
+
+class TestIsRelevantProduct:
+    """Tests for query/product relevance matching."""
+
+    def test_model_number_match(self):
+        """Should accept products containing the queried model number."""
+        assert is_relevant_product("Samsung RF72DG9620B1", "מקרר Samsung RF72DG9620B1 לבן")
+
+    def test_model_number_mismatch(self):
+        """Should reject products with a different model number."""
+        assert not is_relevant_product("RF72DG9620B1", "Samsung RB34T600ESA")
+
+    def test_queried_brand_must_appear(self):
+        """Should require one of the queried brands in the product name."""
+        assert is_relevant_product("מקרר בוש", "מקרר בוש 2 דלתות")
+        assert not is_relevant_product("מקרר בוש", "מקרר סמסונג 2 דלתות")
+
+    def test_brand_substring_in_query(self):
+        """Should treat brands as substrings of the query, like 'lg' in 'lg55'."""
+        assert not is_relevant_product("lgx", "Samsung TV")
+        assert is_relevant_product("lgx", "LG TV")
+
+    def test_generic_query_accepts_all(self):
+        """Should accept any product for generic queries without brand or model."""
+        assert is_relevant_product("מקרר", "Haier fridge")
+
+
+class TestExtractModelNumber:
+    """Tests for model number extraction."""
+
+    def test_brand_style_model(self):
+        """Should extract letter-prefixed model numbers, uppercased."""
+        assert extract_model_number("Bosch wan24170by") == "WAN24170BY"
+
+    def test_short_code(self):
+        """Should fall back to single-letter short codes."""
+        assert extract_model_number("model A2345") == "A2345"
+
+    def test_no_model(self):
+        """Should return None when no model-like token exists."""
+        assert extract_model_number("מקרר שקט") is None
+
+
+class TestDeduplicateResults:
+    """Tests for seller/price-bucket deduplication."""
+
+    def test_drops_same_seller_in_same_bucket(self):
+        """Should keep the first listing per seller and price bucket."""
+        results = [
+            make_price_option("Shop", 3000),
+            make_price_option("shop ", 3050),
+            make_price_option("Shop", 3500),
+            make_price_option("Other", 3000),
+        ]
+
+        assert [r.listed_price for r in deduplicate_results(results)] == [3000, 3500, 3000]
+
+    def test_drops_unreasonably_low_prices(self):
+        """Should filter prices below min_price."""
+        results = [make_price_option("Shop", 5), make_price_option("Shop", 3000)]
+
+        assert [r.listed_price for r in deduplicate_results(results)] == [3000]
+
+    def test_incremental_matches_batch(self):
+        """Should accept exactly the results deduplicate_results keeps."""
+        results = [make_price_option(f"Shop{i % 3}", 1000 + i * 40) for i in range(20)]
+        deduplicator = ResultDeduplicator()
+
+        assert [r for r in results if deduplicator.accept(r)] == deduplicate_results(results)
@@ -1,5 +1,7 @@
 """Tests for RobustHttpClient."""
 
+import asyncio
+
 import pytest
 import httpx
 from unittest.mock import patch, AsyncMock, MagicMock
@@ -9,6 +11,7 @@ from src.tools.scraping.http_client import (
     SSL_BYPASS_DOMAINS,
     BROWSER_HEADERS,
     get_http_client,
+    get_research_http_client,
     reset_http_client,
 )
 
@@ -109,7 +112,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com")
 
@@ -127,7 +130,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com/missing")
 
@@ -153,7 +156,7 @@ class TestRobustHttpClient:
                 mock_response_500,
                 mock_response_200,
             ]
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com")
 
@@ -169,7 +172,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.side_effect = httpx.ConnectError("DNS lookup failed")
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com")
 
@@ -194,7 +197,7 @@ class TestRobustHttpClient:
                 httpx.TimeoutException("timeout"),
                 mock_response_200,
             ]
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com")
 
@@ -213,7 +216,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             result = await client.get("https://example.com/forbidden")
 
@@ -232,7 +235,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             await client.get("https://example.com")
 
@@ -249,7 +252,7 @@ class TestRobustHttpClient:
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             await client.get(
                 "https://example.com", headers={"X-Custom": "value"}
@@ -259,6 +262,50 @@ class TestRobustHttpClient:
             assert "X-Custom" in call_kwargs["headers"]
             assert "User-Agent" in call_kwargs["headers"]
 
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_client(self, mock_rate_limiter):
+        """Requests with the same SSL mode should share one pooled client."""
+        client = RobustHttpClient(retry_delay=0.01)
+
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.get.return_value = mock_response
+            mock_async_client.return_value = mock_client_instance
+
+            await client.get("https://example.com/a")
+            await client.get("https://example.com/b")
+            await client.get("https://wisebuy.co.il/c")
+
+            # One client with SSL verification, one without for bypass domains
+            assert mock_async_client.call_count == 2
+            assert mock_client_instance.get.call_count == 3
+
+            await client.aclose()
+            assert mock_client_instance.aclose.await_count == 2
+
+    def test_closed_loop_clients_are_dropped(self, mock_rate_limiter):
+        """A new event loop should get its own client and forget closed loops' clients."""
+        client = RobustHttpClient()
+
+        async def get_pooled():
+            return client._get_client(True)
+
+        pooled = []
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: MagicMock(is_closed=False)):
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                try:
+                    pooled.append(loop.run_until_complete(get_pooled()))
+                finally:
+                    loop.close()
+
+        assert pooled[0] is not pooled[1]
+        assert list(client._clients.values()) == [pooled[1]]
+
 
 class TestGetHttpClient:
     """Tests for the global client getter."""
@@ -284,3 +331,31 @@ class TestGetHttpClient:
             reset_http_client()
             client2 = get_http_client()
             assert client1 is not client2
+
+
+class TestResearchHttpClient:
+    """Tests for the pooled research client."""
+
+    def test_one_client_per_open_loop(self):
+        """Each loop gets its own client, and closed loops' clients are forgotten."""
+        from src.tools.scraping import http_client
+
+        async def get_pooled():
+            return get_research_http_client(), get_research_http_client()
+
+        pooled = []
+        try:
+            with patch("httpx.AsyncClient", side_effect=lambda **kwargs: MagicMock(is_closed=False)):
+                for _ in range(2):
+                    loop = asyncio.new_event_loop()
+                    try:
+                        pooled.append(loop.run_until_complete(get_pooled()))
+                    finally:
+                        loop.close()
+
+            (first, first_again), (second, _) = pooled
+            assert first is first_again
+            assert first is not second
+            assert list(http_client._research_http_clients.values()) == [second]
+        finally:
+            http_client._research_http_clients.clear()
@@ -0,0 +1,35 @@
+"""Tests for ObservabilityHooks."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.observability import ObservabilityHooks
+
+
+class TestOnLlmEnd:
+    """Tests for the LLM span completion hook."""
+
+    @pytest.mark.asyncio
+    async def test_usage_without_token_details_completes_span(self):
+        """Should complete the span when usage has no input_tokens_details (older openai-agents)."""
+        store = MagicMock()
+        store.complete_span = AsyncMock()
+        hooks = ObservabilityHooks(store=store)
+        hooks._current_trace_id = "trace-1"
+        hooks._llm_spans["Agent"] = "span-1"
+
+        agent = MagicMock()
+        agent.name = "Agent"
+        response = SimpleNamespace(
+            output=[],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+        await hooks.on_llm_end(MagicMock(), agent, response)
+
+        store.complete_span.assert_awaited_once()
+        kwargs = store.complete_span.await_args.kwargs
+        assert kwargs["input_tokens"] == 10
+        assert kwargs["output_tokens"] == 5
@@ -0,0 +1,41 @@
+"""Tests for per-phase latency measurement."""
+
+import time
+
+from src.observability import PhaseTimer
+
+
+class TestPhaseTimer:
+    """Tests for PhaseTimer."""
+
+    def test_summary_lists_phases_then_total(self):
+        """Should report phases in first-entered order with a final total."""
+        timer = PhaseTimer()
+        with timer.phase("search.scrapers"):
+            pass
+        with timer.phase("analyze.llm"):
+            pass
+
+        assert list(timer.summary()) == ["search.scrapers", "analyze.llm", "total"]
+
+    def test_reentered_phase_accumulates(self):
+        """Should add up the time of every entry into the same phase."""
+        timer = PhaseTimer()
+        for _ in range(2):
+            with timer.phase("search.scraper.ksp"):
+                time.sleep(0.01)
+
+        summary = timer.summary()
+        assert summary["search.scraper.ksp"] >= 20
+        assert summary["total"] >= summary["search.scraper.ksp"]
+
+    def test_phase_recorded_when_block_raises(self):
+        """Should still record the phase if the timed block fails."""
+        timer = PhaseTimer()
+        try:
+            with timer.phase("analyze.json_parse"):
+                raise ValueError("bad json")
+        except ValueError:
+            pass
+
+        assert "analyze.json_parse" in timer.summary()
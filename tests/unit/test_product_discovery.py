@@ -1,17 +1,62 @@
 """Tests for product discovery agent and models."""
 
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.api.routes.agent import router as agent_router
+from src.api.routes.agent import QueryRequest, router as agent_router, run_agent_query
 from src.state.models import (
     DiscoveredProduct,
     ShoppingListItem,
     PriceSearchSession,
     PriceSearchStatus,
+    PriceOption,
+    SellerInfo,
+)
+from src.agents.product_discovery import (
+    _analyze_and_format_results_impl,
+    _parse_google_search_results,
+    _prefetch_model_searches,
+    _prefetched_searches,
+    _search_products_smart_impl,
+    _slim_products,
+    _strip_code_fence,
+    _take_prefetched_search,
+    detect_category_with_llm,
+    extract_brand,
+    extract_brand_and_model,
+    extract_model_number,
+    get_cached_discovery_result,
+    get_extraction_client,
+    get_openai_client,
+    reset_openai_client,
+    reset_prefetched_searches,
+    set_cached_discovery_result,
 )
-from src.agents.product_discovery import extract_brand, extract_model_number
+from src.tools.scraping.runner import get_scraper_semaphore, reset_scraper_semaphores
+
+
+def make_price_option(name: str, price: float, seller_name: str) -> PriceOption:
+    """Helper to create a PriceOption for testing."""
+    return PriceOption(
+        product_id="test-query",
+        product_name=name,
+        seller=SellerInfo(
+            name=seller_name,
+            website=f"https://{seller_name.lower()}.co.il",
+            country="IL",
+            source="test",
+        ),
+        listed_price=price,
+        currency="ILS",
+        url=f"https://{seller_name.lower()}.co.il/{name.replace(' ', '-').lower()}",
+        scraped_at=datetime.now(),
+    )
 
 
 def create_test_app() -> FastAPI:
@@ -137,6 +182,20 @@ class TestExtractBrand:
         """Should return None for unknown brand."""
         assert extract_brand("Generic Product XYZ") is None
 
+    def test_longest_brand_wins(self):
+        """Should prefer the longer brand when a shorter one is its prefix."""
+        assert extract_brand("General Electric GTE18 fridge") == "General Electric"
+
+    def test_no_substring_match(self):
+        """Should not match a short brand inside a longer word."""
+        assert extract_brand("Gorenje NRK6192") == "Gorenje"
+        assert extract_brand("Generic hood") is None
+
+    def test_brand_list_order_wins(self):
+        """Should prefer the earlier KNOWN_BRANDS entry, not the earlier mention."""
+        assert extract_brand("LG compatible filter for Samsung fridge") == "Samsung"
+        assert extract_brand("Samsung compatible filter for LG fridge") == "Samsung"
+
 
 class TestExtractModelNumber:
     """Tests for extract_model_number utility function."""
@@ -159,12 +218,662 @@ class TestExtractModelNumber:
         assert result is None
 
 
+class TestExtractBrandAndModel:
+    """Tests for extract_brand_and_model single-pass helper."""
+
+    def test_extracts_both(self):
+        """Should extract brand and model in one call."""
+        assert extract_brand_and_model("Samsung RF72DG9620B1 Refrigerator") == (
+            "Samsung",
+            "RF72DG9620B1",
+        )
+
+    def test_model_starting_with_brand(self):
+        """Should keep both when the model token starts with a brand."""
+        assert extract_brand_and_model("GE-425 oven") == ("GE", "GE-425")
+
+    def test_model_pattern_priority(self):
+        """Should prefer earlier model patterns even if a later one matches first."""
+        assert extract_brand_and_model("55UQ8000 LG RF72DG9620B1") == ("LG", "RF72DG9620B1")
+
+    def test_nothing_found(self):
+        """Should return (None, None) when nothing matches."""
+        assert extract_brand_and_model("Generic Product XYZ") == (None, None)
+
+
+class TestStripCodeFence:
+    """Tests for stripping markdown fences from LLM output."""
+
+    def test_strips_json_fence(self):
+        """Should remove ```json fences and surrounding newlines."""
+        assert _strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_strips_plain_fence(self):
+        """Should remove plain ``` fences."""
+        assert _strip_code_fence("```\n[1, 2]\n```") == "[1, 2]"
+
+    def test_unfenced_text_unchanged(self):
+        """Should leave text without a leading fence untouched."""
+        assert _strip_code_fence('{"a": "```"}') == '{"a": "```"}'
+
+
+class TestSlimProducts:
+    """Tests for trimming products before they go into the analysis prompt."""
+
+    def test_keeps_prompt_fields_only(self):
+        """Should drop unused fields and empty values."""
+        product = {
+            "name": "Samsung RF72DG9620B1",
+            "brand": "Samsung",
+            "model_number": None,
+            "price": 4000,
+            "currency": "ILS",
+            "url": "https://shop.example/p/1",
+            "source": "zap",
+            "rating": 4.5,
+        }
+
+        assert _slim_products([product]) == [{
+            "name": "Samsung RF72DG9620B1",
+            "brand": "Samsung",
+            "price": 4000,
+            "currency": "ILS",
+            "url": "https://shop.example/p/1",
+            "source": "zap",
+        }]
+
+
+class TestParseGoogleSearchResults:
+    """Tests for Google research result parsing."""
+
+    @staticmethod
+    def _result_div(i: int, href: str) -> str:
+        return (
+            f'<div class="g"><a href="{href}">link</a><h3>Title {i}</h3>'
+            f'<div class="VwiC3b">Snippet {i}</div></div>'
+        )
+
+    def test_caps_at_ten_results(self):
+        """Should parse at most the first 10 result divs."""
+        html = "".join(self._result_div(i, f"https://shop{i}.co.il/p") for i in range(15))
+        results = _parse_google_search_results(html)
+        assert len(results) == 10
+        assert results[0] == {
+            "title": "Title 0",
+            "snippet": "Snippet 0",
+            "url": "https://shop0.co.il/p",
+        }
+
+    def test_unwraps_google_redirect(self):
+        """Should extract the target URL from /url?q= redirects."""
+        html = self._result_div(0, "/url?q=https://shop.co.il/item&sa=U&ved=x")
+        assert _parse_google_search_results(html)[0]["url"] == "https://shop.co.il/item"
+
+    def test_skips_google_pages(self):
+        """Should skip links pointing back to Google."""
+        html = self._result_div(0, "https://www.google.com/maps")
+        assert _parse_google_search_results(html) == []
+
+
+class TestSearchProductsSmart:
+    """Tests for the smart search scraper fan-out."""
+
+    RESEARCH = json.dumps({
+        "category": "refrigerator",
+        "recommended_models": [{"model": "RF72DG9620B1"}],
+        "search_terms": {
+            "native_language": ["מקרר שקט"],
+            "category_searches": ["מקרר 600 ליטר"],
+        },
+    })
+
+    @pytest.fixture
+    def mock_scrapers(self):
+        """One working scraper and one that always fails."""
+        good = MagicMock()
+        good.name = "good"
+        good.search = AsyncMock(side_effect=lambda query, max_results=10: [
+            make_price_option(f"Samsung {query}", 4000, f"Shop{len(query)}"),
+        ])
+
+        bad = MagicMock()
+        bad.name = "bad"
+        bad.search = AsyncMock(side_effect=RuntimeError("blocked"))
+
+        return [good, bad]
+
+    async def _run(self, scrapers, progress=None) -> dict:
+        with patch(
+            "src.agents.product_discovery.ScraperRegistry.get_scrapers_for_country",
+            return_value=scrapers,
+        ), patch(
+            "src.agents.product_discovery.report_progress",
+            progress or AsyncMock(),
+        ), patch(
+            "src.agents.product_discovery.record_search",
+            new_callable=AsyncMock,
+        ):
+            return json.loads(await _search_products_smart_impl(self.RESEARCH, "IL"))
+
+    @pytest.mark.asyncio
+    async def test_failing_scraper_does_not_block_others(self, mock_scrapers):
+        """Should keep results from healthy scrapers when one fails."""
+        result = await self._run(mock_scrapers)
+
+        assert result["total_found"] == 3
+        assert all(a["results"] == 1 for a in result["search_attempts"])
+        assert all(a["scrapers"] == [{"name": "good", "count": 1}] for a in result["search_attempts"])
+
+    @pytest.mark.asyncio
+    async def test_attempts_keep_strategy_order(self, mock_scrapers):
+        """Should report attempts in strategy order: model, local, category."""
+        result = await self._run(mock_scrapers)
+
+        assert [a["strategy"] for a in result["search_attempts"]] == [
+            "specific_model",
+            "local_language",
+            "category",
+        ]
+        assert result["products"][0]["model_number"] == "RF72DG9620B1"
+
+    @pytest.mark.asyncio
+    async def test_progress_is_flushed_in_order(self, mock_scrapers):
+        """Should deliver every queued progress step, in order, before returning."""
+        progress = AsyncMock()
+        await self._run(mock_scrapers, progress)
+
+        names = [c.args[0] for c in progress.await_args_list]
+        assert names[0] == "🔍 Model search"
+        assert names[-2:] == ["✅ Search complete", "⏱ Timings"]
+        assert names.count("✅ good") == 2
+
+    @pytest.mark.asyncio
+    async def test_scraper_concurrency_is_capped(self, monkeypatch):
+        """Should not run more than scraper_max_concurrency searches per scraper."""
+        from src.config.settings import settings
+
+        in_flight = 0
+        peak = 0
+
+        async def search(query, max_results=10):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        scraper = MagicMock()
+        scraper.name = "capped"
+        scraper.search = AsyncMock(side_effect=search)
+        monkeypatch.setattr(settings, "scraper_max_concurrency", 1)
+        reset_scraper_semaphores()
+
+        try:
+            await self._run([scraper])
+        finally:
+            reset_scraper_semaphores()
+
+        assert scraper.search.await_count == 3
+        assert peak == 1
+
+    def test_scraper_semaphores_are_per_event_loop(self):
+        """Should not reuse a semaphore bound to another (closed) event loop."""
+        async def get_semaphore():
+            semaphore = get_scraper_semaphore("zap")
+            async with semaphore:
+                pass
+            return semaphore
+
+        semaphores = []
+        try:
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                try:
+                    semaphores.append(loop.run_until_complete(get_semaphore()))
+                finally:
+                    loop.close()
+        finally:
+            reset_scraper_semaphores()
+
+        first, second = semaphores
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_slow_scraper_is_timed_out(self, mock_scrapers, monkeypatch):
+        """Should cancel scrapers that exceed the per-scraper timeout."""
+        from src.config.settings import settings
+
+        async def hang(query, max_results=10):
+            await asyncio.sleep(5)
+
+        slow = MagicMock()
+        slow.name = "slow"
+        slow.search = AsyncMock(side_effect=hang)
+        monkeypatch.setattr(settings, "scraper_timeout_seconds", 0.05)
+
+        result = await self._run([mock_scrapers[0], slow])
+
+        assert result["total_found"] == 3
+        assert all(a["scrapers"] == [{"name": "good", "count": 1}] for a in result["search_attempts"])
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_are_dropped(self):
+        """Should keep one product per URL across queries and scrapers."""
+        listing = make_price_option("Samsung RF72DG9620B1", 4000, "Shop")
+        scrapers = []
+        for name in ("zap", "wisebuy"):
+            scraper = MagicMock()
+            scraper.name = name
+            scraper.search = AsyncMock(return_value=[listing])
+            scrapers.append(scraper)
+
+        result = await self._run(scrapers)
+
+        assert result["total_found"] == 1
+        assert all(a["results"] == 2 for a in result["search_attempts"])
+
+    @pytest.mark.asyncio
+    async def test_results_without_url_skip_url_dedup(self):
+        """Should keep URL-less listings from different sellers, deduping by seller/price only."""
+        listings = [
+            make_price_option("Samsung RF72DG9620B1", 4000, "ShopA"),
+            make_price_option("Samsung RF72DG9620B1", 4000, "ShopB"),
+            make_price_option("Samsung RF72DG9620B1", 4010, "ShopA"),
+        ]
+        for listing in listings:
+            listing.url = ""
+        scraper = MagicMock()
+        scraper.name = "zap"
+        scraper.search = AsyncMock(return_value=listings)
+
+        result = await self._run([scraper])
+
+        assert [p["url"] for p in result["products"]] == ["", ""]
+        assert result["total_found"] == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetched_model_searches_are_reused(self, mock_scrapers):
+        """Should consume searches started after research instead of repeating them."""
+        good = mock_scrapers[0]
+        with patch(
+            "src.agents.product_discovery.ScraperRegistry.get_scrapers_for_country",
+            return_value=[good],
+        ):
+            _prefetch_model_searches(json.loads(self.RESEARCH), "IL")
+
+        try:
+            result = await self._run([good])
+        finally:
+            reset_prefetched_searches()
+
+        model_calls = [c for c in good.search.await_args_list if c.args[0] == "RF72DG9620B1"]
+        assert len(model_calls) == 1
+        assert result["search_attempts"][0]["results"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_not_served_to_other_country(self, mock_scrapers):
+        """Should only hand a prefetched search to a search for the same country."""
+        good = mock_scrapers[0]
+        with patch(
+            "src.agents.product_discovery.ScraperRegistry.get_scrapers_for_country",
+            return_value=[good],
+        ):
+            _prefetch_model_searches(json.loads(self.RESEARCH), "US")
+
+        try:
+            await self._run([good])
+        finally:
+            reset_prefetched_searches()
+
+        model_calls = [c for c in good.search.await_args_list if c.args[0] == "RF72DG9620B1"]
+        assert len(model_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_prefetch_cancelled_on_lookup(self, monkeypatch):
+        """Should cancel and drop unclaimed prefetches once they expire."""
+        async def hang(query, max_results=10):
+            await asyncio.sleep(5)
+
+        slow = MagicMock()
+        slow.name = "slow"
+        slow.search = AsyncMock(side_effect=hang)
+        with patch(
+            "src.agents.product_discovery.ScraperRegistry.get_scrapers_for_country",
+            return_value=[slow],
+        ):
+            _prefetch_model_searches(json.loads(self.RESEARCH), "IL")
+
+        try:
+            (task,) = [task for _, task in _prefetched_searches.values()]
+            monkeypatch.setattr("src.agents.product_discovery._PREFETCH_TTL_SECONDS", -1.0)
+            assert _take_prefetched_search("IL", "slow", "other query", 8) is None
+            await asyncio.sleep(0)
+        finally:
+            reset_prefetched_searches()
+
+        assert task.cancelled()
+        assert not _prefetched_searches
+
+
+class TestAnalyzeAndFormatResults:
+    """Tests for the analyze-and-format tool with a mocked LLM."""
+
+    RESEARCH = json.dumps({
+        "category": "refrigerator",
+        "country": "IL",
+        "original_requirement": "quiet fridge",
+        "criteria": [{"attribute": "noise", "market_value": "<40dB"}],
+        "recommended_models": [{"model": "RF72DG9620B1"}],
+    })
+
+    @pytest.fixture
+    def llm(self, cache_manager):
+        """Mock OpenAI client returning the given products as the pick."""
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock()
+
+        def respond(products: list[dict]) -> None:
+            message = MagicMock()
+            message.content = "```json\n" + json.dumps({"products": products}) + "\n```"
+            client.chat.completions.create.return_value = MagicMock(
+                choices=[MagicMock(message=message)]
+            )
+
+        client.respond = respond
+        with patch(
+            "src.agents.product_discovery.get_openai_client",
+            return_value=client,
+        ), patch(
+            "src.agents.product_discovery.get_cache_manager",
+            return_value=cache_manager,
+        ), patch(
+            "src.agents.product_discovery.report_progress",
+            new_callable=AsyncMock,
+        ):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_by_model_keeping_cheapest(self, llm):
+        """Should keep only the cheapest listing per model number."""
+        products = [
+            {"name": "Samsung RF72DG9620B1", "model_number": "RF72DG9620B1", "price": 9000, "url": "https://a.co.il/1"},
+            {"name": "Bosch KGN39", "model_number": "KGN39", "price": 5000, "url": "https://b.co.il/2"},
+            {"name": "Samsung RF72DG9620B1", "model_number": "rf72dg9620b1", "price": 8000, "url": "https://c.co.il/3"},
+            {"name": "", "price": 100, "url": "https://d.co.il/4"},
+        ]
+        llm.respond([{"name": "Samsung RF72DG9620B1", "model_number": "RF72DG9620B1"}])
+
+        result = json.loads(await _analyze_and_format_results_impl(
+            self.RESEARCH, json.dumps({"products": products})
+        ))
+
+        summary = result["search_summary"]
+        assert summary["total_products_found"] == 3
+        assert summary["unique_models_found"] == 2
+        assert result["products"][0]["model_number"] == "RF72DG9620B1"
+        prompt = llm.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "https://c.co.il/3" in prompt
+        assert "https://a.co.il/1" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_reordered_input_reuses_llm_analysis(self, llm):
+        """Should skip the LLM when the same inputs arrive reordered/reformatted."""
+        products = [
+            {"name": "Samsung RF72DG9620B1", "model_number": "RF72DG9620B1", "price": 9000},
+            {"name": "Bosch KGN39", "model_number": "KGN39", "price": 5000},
+        ]
+        llm.respond([{"name": "Bosch KGN39", "model_number": "KGN39"}])
+
+        first = json.loads(await _analyze_and_format_results_impl(
+            self.RESEARCH, json.dumps({"products": products})
+        ))
+        second = json.loads(await _analyze_and_format_results_impl(
+            json.dumps(json.loads(self.RESEARCH), indent=2),
+            json.dumps({"products": [dict(reversed(p.items())) for p in reversed(products)]}),
+        ))
+
+        assert llm.chat.completions.create.await_count == 1
+        assert second["products"][0]["model_number"] == first["products"][0]["model_number"]
+
+    @pytest.mark.asyncio
+    async def test_prescoring_sends_recommended_models_first(self, llm):
+        """Should cap the LLM candidates and keep recommended models in the cut."""
+        products = [
+            {"name": f"מקרר {i}", "price": 3000 + i, "url": f"https://a.co.il/{i}"}
+            for i in range(20)
+        ]
+        products.append({
+            "name": "Samsung RF72DG9620B1",
+            "model_number": "RF72DG9620B1",
+            "price": 9000,
+            "url": "https://b.co.il/rec",
+        })
+        llm.respond([{"name": "Samsung RF72DG9620B1", "model_number": "RF72DG9620B1"}])
+
+        await _analyze_and_format_results_impl(
+            self.RESEARCH, json.dumps({"products": products})
+        )
+
+        prompt = llm.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        sent = json.loads(prompt.rsplit("\n", 1)[-1])
+        assert len(sent) == 15
+        assert sent[0]["url"] == "https://b.co.il/rec"
+        assert [p["url"] for p in sent[1:]] == [f"https://a.co.il/{i}" for i in range(14)]
+
+    @pytest.mark.asyncio
+    async def test_no_products_returns_summary(self, llm):
+        """Should return suggestions without calling the LLM when nothing was found."""
+        result = json.loads(await _analyze_and_format_results_impl(
+            self.RESEARCH, json.dumps({"products": []})
+        ))
+
+        assert result["products"] == []
+        assert result["suggestions"]
+        llm.chat.completions.create.assert_not_called()
+
+
+class TestDetectCategory:
+    """Tests for LLM category detection and its reply cache."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_requirement_reuses_reply(self, cache_manager):
+        """Should call the LLM once for requirements differing only in case/spacing."""
+        message = MagicMock()
+        message.content = "Refrigerator"
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(choices=[MagicMock(message=message)])
+        )
+
+        with patch(
+            "src.agents.product_discovery.get_openai_client",
+            return_value=client,
+        ), patch(
+            "src.agents.product_discovery.get_cache_manager",
+            return_value=cache_manager,
+        ):
+            first = await detect_category_with_llm("Quiet fridge  for family")
+            second = await detect_category_with_llm("quiet fridge for family")
+
+        assert first == second == "refrigerator"
+        assert client.chat.completions.create.await_count == 1
+
+
+class TestDiscoveryResultCache:
+    """Tests for the discovery agent's final output cache."""
+
+    OUTPUT = json.dumps({"products": [{"name": "Samsung RF72DG9620B1"}]})
+
+    @pytest.fixture
+    def cache(self, cache_manager):
+        with patch(
+            "src.agents.product_discovery.get_cache_manager",
+            return_value=cache_manager,
+        ):
+            yield cache_manager
+
+    @pytest.mark.asyncio
+    async def test_normalized_query_hits(self, cache):
+        """Should return the stored output for the same query and country."""
+        await set_cached_discovery_result("Quiet fridge", "il", self.OUTPUT)
+
+        assert await get_cached_discovery_result("quiet  FRIDGE", "IL") == self.OUTPUT
+        assert await get_cached_discovery_result("quiet fridge", "US") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output", [
+        '{"products": [], "no_results_message": "Nothing matched"}',
+        '{"error": "Search failed", "products": []}',
+        "Sorry, the search tools are unavailable right now.",
+    ])
+    async def test_empty_or_failed_outputs_not_stored(self, cache, output):
+        """Should not cache answers without products, errors, or non-JSON replies."""
+        await set_cached_discovery_result("quiet fridge", "IL", output)
+
+        assert await get_cached_discovery_result("quiet fridge", "IL") is None
+
+    @pytest.mark.asyncio
+    async def test_stored_with_discovery_ttl(self, cache, monkeypatch):
+        """Should store answers with the short discovery-result TTL."""
+        from src.config.settings import settings
+
+        monkeypatch.setattr(settings, "cache_ttl_discovery_result_seconds", 123)
+        with patch.object(cache, "set", new_callable=AsyncMock) as cache_set:
+            await set_cached_discovery_result("quiet fridge", "IL", self.OUTPUT)
+
+        assert cache_set.await_args.kwargs["ttl_seconds"] == 123
+
+
+class TestDiscoveryRouteResultCache:
+    """Tests for the final output cache as used by POST /agent/run."""
+
+    OUTPUT = json.dumps({"products": [{"name": "Samsung RF72DG9620B1"}]})
+
+    @pytest.fixture
+    def route(self, cache_manager):
+        """Run /agent/run handlers to completion with a mocked agent runner."""
+        hooks = MagicMock()
+        hooks.start_trace = AsyncMock(return_value=MagicMock(id="trace-1"))
+        hooks.end_trace = AsyncMock()
+        runner = AsyncMock()
+
+        async def run(**request) -> None:
+            tasks = []
+            with patch(
+                "src.api.routes.agent._start_background_task", side_effect=tasks.append
+            ):
+                await run_agent_query(QueryRequest(agent="discovery", **request))
+            for task in tasks:
+                await task
+
+        with patch(
+            "src.agents.product_discovery.get_cache_manager", return_value=cache_manager
+        ), patch(
+            "src.api.routes.agent.ObservabilityHooks", return_value=hooks
+        ), patch(
+            "src.api.routes.agent.Runner.run", runner
+        ):
+            run.hooks, run.runner = hooks, runner
+            yield run
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_runner(self, route):
+        """Should serve a repeated query from the cache without running the agent."""
+        route.runner.return_value = MagicMock(final_output=self.OUTPUT)
+
+        await route(query="quiet fridge")
+        await route(query="Quiet  Fridge")
+
+        assert route.runner.await_count == 1
+        assert route.hooks.end_trace.await_args.kwargs == {"final_output": self.OUTPUT}
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_bypasses_cache(self, route):
+        """Should always run the agent for refinements."""
+        route.runner.return_value = MagicMock(final_output=self.OUTPUT)
+        history = [
+            {"role": "user", "content": "quiet fridge"},
+            {"role": "assistant", "content": self.OUTPUT},
+            {"role": "user", "content": "quiet fridge"},
+        ]
+
+        await route(query="quiet fridge")
+        await route(query="quiet fridge", conversation_history=history)
+
+        assert route.runner.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_output_not_stored(self, route):
+        """Should rerun the agent when the previous answer found no products."""
+        route.runner.return_value = MagicMock(final_output='{"products": []}')
+
+        await route(query="quiet fridge")
+        await route(query="quiet fridge")
+
+        assert route.runner.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_not_stored(self, route):
+        """Should end the trace with the error and cache nothing when the run fails."""
+        route.runner.side_effect = RuntimeError("scrapers down")
+
+        await route(query="quiet fridge")
+
+        assert route.hooks.end_trace.await_args.kwargs == {"error": "scrapers down"}
+        assert await get_cached_discovery_result("quiet fridge", "IL") is None
+
+
+class TestOpenAIClient:
+    """Tests for the shared OpenAI client."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_client(self):
+        reset_openai_client()
+        yield
+        reset_openai_client()
+
+    def test_client_is_reused(self, monkeypatch):
+        """Should return the same client instance across calls."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        assert get_openai_client() is get_openai_client()
+
+    def test_missing_api_key(self, monkeypatch):
+        """Should raise when no API key is configured."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            get_openai_client()
+
+    def test_extraction_client_defaults_to_openai(self, monkeypatch):
+        """Should use the shared OpenAI client when no extraction endpoint is set."""
+        from src.config.settings import settings
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(settings, "extraction_llm_base_url", None)
+        assert get_extraction_client() is get_openai_client()
+
+    def test_extraction_client_uses_configured_endpoint(self, monkeypatch):
+        """Should point extraction calls at the configured OpenAI-compatible server."""
+        from src.config.settings import settings
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(settings, "extraction_llm_base_url", "http://vllm:8000/v1")
+        client = get_extraction_client()
+
+        assert str(client.base_url).rstrip("/") == "http://vllm:8000/v1"
+        assert get_extraction_client() is client
+
+
 class TestDiscoveryAgentRoute:
     """Tests for POST /agent/run with discovery agent."""
 
     @pytest.fixture
-    def client(self):
-        """Create a test client."""
+    def client(self, cache_manager, monkeypatch):
+        """Create a test client, with the result cache on a temporary database."""
+        monkeypatch.setattr(
+            "src.agents.product_discovery.get_cache_manager", lambda: cache_manager
+        )
         app = create_test_app()
         return TestClient(app)
 
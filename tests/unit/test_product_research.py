@@ -4,7 +4,16 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from src.agents.product_research import _search_products_impl, _search_multiple_products_impl
+from src.agents.product_research import (
+    _first_contact,
+    _format_results_preview,
+    _google_site_search,
+    _match_site_search_urls,
+    _model_token,
+    _search_multiple_products_impl,
+    _search_products_impl,
+    _url_domain,
+)
 from src.state.models import PriceOption, SellerInfo
 
 
@@ -122,6 +131,78 @@ class TestSearchProductsResultLimit:
             # The first price should be among the lowest
             assert prices[0] <= 1200, f"First price {prices[0]} should be among lowest"
 
+    @pytest.mark.asyncio
+    async def test_scrapers_run_concurrently(self):
+        """A slow scraper shouldn't hold up the others."""
+        import asyncio
+
+        second_started = asyncio.Event()
+
+        async def slow_search(query, max_results):
+            # Only finishes if the second scraper starts while this one is running
+            await second_started.wait()
+            return [make_price_option(1000, "Slow")]
+
+        async def fast_search(query, max_results):
+            second_started.set()
+            return [make_price_option(1100, "Fast")]
+
+        slow, fast = MagicMock(), MagicMock()
+        slow.name, slow.search = "slow", slow_search
+        fast.name, fast.search = "fast", fast_search
+
+        with patch(
+            "src.agents.product_research.ScraperRegistry.get_scrapers_for_country",
+            return_value=[slow, fast],
+        ), patch(
+            "src.agents.product_research.report_progress",
+            new_callable=AsyncMock,
+        ), patch(
+            "src.agents.product_research.record_search",
+            new_callable=AsyncMock,
+        ), patch(
+            "src.agents.product_research.enrich_and_save_sellers",
+            new=AsyncMock(side_effect=lambda results, country: results),
+        ):
+            result = await asyncio.wait_for(_search_products_impl("test query", "IL"), 5)
+
+        assert "Slow" in result and "Fast" in result
+
+    @pytest.mark.asyncio
+    async def test_slow_scraper_cancelled_once_enough_results(self, mock_scrapers):
+        """Slower scrapers are cancelled once enough results from several sites are in."""
+        import asyncio
+
+        slow_cancelled = asyncio.Event()
+
+        async def slow_search(query, max_results):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        slow = MagicMock()
+        slow.name, slow.search = "slow", slow_search
+
+        with patch(
+            "src.agents.product_research.ScraperRegistry.get_scrapers_for_country",
+            return_value=[*mock_scrapers, slow],
+        ), patch(
+            "src.agents.product_research.report_progress",
+            new_callable=AsyncMock,
+        ), patch(
+            "src.agents.product_research.record_search",
+            new_callable=AsyncMock,
+        ), patch(
+            "src.agents.product_research.enrich_and_save_sellers",
+            new=AsyncMock(side_effect=lambda results, country: results),
+        ):
+            result = await asyncio.wait_for(_search_products_impl("test query", "IL"), 5)
+
+        assert "Top 5 results" in result
+        assert slow_cancelled.is_set()
+
 
 class TestSearchMultipleProductsResultLimit:
     """Tests for the 5 result limit per product in search_multiple_products."""
@@ -172,6 +253,91 @@ class TestSearchMultipleProductsResultLimit:
                 if result_lines:  # Only check sections with results
                     assert len(result_lines) <= 5, f"Section has {len(result_lines)} results, expected max 5:\n{section}"
 
+    @pytest.mark.asyncio
+    async def test_products_share_per_scraper_cap(self, monkeypatch):
+        """Each site takes the products in turn while sites run in parallel."""
+        import asyncio
+        from src.tools.scraping.runner import reset_scraper_semaphores
+        from src.config.settings import settings
+
+        in_flight: dict[str, int] = {"a": 0, "b": 0}
+        peak: dict[str, int] = {"a": 0, "b": 0}
+        calls: dict[str, list[str]] = {"a": [], "b": []}
+
+        def make_scraper(name: str) -> MagicMock:
+            async def search(query, max_results=10):
+                in_flight[name] += 1
+                peak[name] = max(peak[name], in_flight[name])
+                calls[name].append(query)
+                await asyncio.sleep(0.01)
+                in_flight[name] -= 1
+                return [make_price_option(1000, f"{name}_{query}")]
+
+            scraper = MagicMock()
+            scraper.name = name
+            scraper.search = search
+            return scraper
+
+        monkeypatch.setattr(settings, "scraper_max_concurrency", 1)
+        reset_scraper_semaphores()
+        try:
+            with patch(
+                "src.agents.product_research.ScraperRegistry.get_scrapers_for_country",
+                return_value=[make_scraper("a"), make_scraper("b")],
+            ), patch(
+                "src.agents.product_research.report_progress",
+                new_callable=AsyncMock,
+            ), patch(
+                "src.agents.product_research.enrich_and_save_sellers",
+                new=AsyncMock(side_effect=lambda results, country: results),
+            ):
+                result = await _search_multiple_products_impl(["p1", "p2", "p3"], "IL")
+        finally:
+            reset_scraper_semaphores()
+
+        assert peak == {"a": 1, "b": 1}
+        assert calls == {"a": ["p1", "p2", "p3"], "b": ["p1", "p2", "p3"]}
+        for query in ("p1", "p2", "p3"):
+            assert f"a_{query}" in result and f"b_{query}" in result
+
+    @pytest.mark.asyncio
+    async def test_pending_scrapers_cancelled_when_loop_body_raises(self):
+        """An error while handling one outcome cancels the scrapers still running."""
+        import asyncio
+
+        slow_cancelled = asyncio.Event()
+
+        async def slow_search(query, max_results=10):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        async def fast_search(query, max_results=10):
+            return [make_price_option(1000, f"fast_{query}")]
+
+        fast, slow = MagicMock(), MagicMock()
+        fast.name, fast.search = "fast", fast_search
+        slow.name, slow.search = "slow", slow_search
+
+        async def report_progress(name, output):
+            if name.startswith("✅"):
+                raise RuntimeError("progress sink down")
+
+        with patch(
+            "src.agents.product_research.ScraperRegistry.get_scrapers_for_country",
+            return_value=[fast, slow],
+        ), patch(
+            "src.agents.product_research.report_progress",
+            new=report_progress,
+        ):
+            with pytest.raises(RuntimeError):
+                await _search_multiple_products_impl(["p1", "p2"], "IL")
+            await asyncio.sleep(0)
+
+        assert slow_cancelled.is_set()
+
 
 class TestOutputFormat:
     """Tests for output format matching dashboard expectations."""
@@ -266,3 +432,127 @@ class TestOutputFormat:
             result = await _search_products_impl("test", "IL")
 
             assert "Contact: +972501234567" in result, f"Expected contact format in:\n{result}"
+
+
+class TestFormatResultsPreview:
+    """Tests for the scraper progress preview."""
+
+    def test_lists_top_5_and_counts_rest(self):
+        """Should list 5 results and summarize the remainder."""
+        results = [make_price_option(1000 + i, f"Seller{i}") for i in range(7)]
+
+        lines = _format_results_preview("✅ Found 7 results:", results).split("\n")
+
+        assert lines[0] == "✅ Found 7 results:"
+        assert lines[1] == "  • Seller0: 1,000 ILS"
+        assert len(lines) == 7
+        assert lines[-1] == "  ... and 2 more"
+
+    def test_rating_is_optional(self):
+        """Should only show seller ratings when requested."""
+        result = make_price_option(1000, "Shop")
+        result.seller.reliability_score = 4.5
+
+        assert "(4.5★)" not in _format_results_preview("h", [result])
+        assert "  • Shop (4.5★): 1,000 ILS" in _format_results_preview("h", [result], show_rating=True)
+
+
+class TestSiteSearch:
+    """Tests for the Google site-search helpers used for bundle products."""
+
+    def test_match_urls_by_model_number(self):
+        """Each query gets the first URL that mentions it, ignoring case and separators."""
+        urls = [
+            "https://shop.co.il/oven-bfl523mb1f",
+            "https://shop.co.il/fridge-RF72-DG9620B1",
+            "https://shop.co.il/fridge-rf72dg9620b1-black",
+        ]
+
+        matches = _match_site_search_urls(urls, ["RF72DG9620B1", "BFL523MB1F", "LG F4V5"])
+
+        assert matches == {
+            "RF72DG9620B1": "https://shop.co.il/fridge-RF72-DG9620B1",
+            "BFL523MB1F": "https://shop.co.il/oven-bfl523mb1f",
+        }
+
+    def test_match_uses_model_number_of_descriptive_query(self):
+        """Words around the model number don't stop its product page from matching."""
+        url = "https://shop.co.il/category/tvs/lg-oled55c4"
+
+        assert _match_site_search_urls([url], ["LG OLED55C4 TV"]) == {"LG OLED55C4 TV": url}
+
+    def test_queries_without_model_number_never_match(self):
+        """Generic, Hebrew and short-code queries don't claim unrelated URLs."""
+        urls = ["https://shop.co.il/category/tvs/lg-oled55c4", "https://shop.co.il/s24-case"]
+
+        assert _match_site_search_urls(urls, ["tv", "מקרר שקט", "Galaxy S24"]) == {}
+
+    def test_model_token(self):
+        """The longest letters-and-digits token of at least five characters is the model."""
+        assert _model_token("Sony WH-1000XM5 headphones") == "WH-1000XM5"
+        assert _model_token("LG OLED55C4 TV") == "OLED55C4"
+        assert _model_token("iPhone 15 Pro") is None
+        assert _model_token("מקרר סמסונג") is None
+
+    def test_url_domain_strips_www_and_case(self):
+        """Seller domains are compared without case or the www. prefix."""
+        assert _url_domain("https://WWW.Shop.co.il/item?id=1") == "shop.co.il"
+        assert _url_domain("https://m.shop.co.il/") == "m.shop.co.il"
+
+    @pytest.mark.asyncio
+    async def test_google_site_search_extracts_seller_urls(self):
+        """Should return the seller's URLs from both link styles, without duplicates."""
+        html = (
+            '<a href="https://www.shop.co.il/a">A</a>'
+            '<a href="https://other.co.il/b">B</a>'
+            '<a href="/url?q=https://shop.co.il/c&amp;sa=U">C</a>'
+            '<a href="https://www.shop.co.il/a">A again</a>'
+        )
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(status_code=200, text=html))
+
+        urls = await _google_site_search(client, "shop.co.il", '("x" OR "y")')
+
+        assert urls == ["https://www.shop.co.il/a", "https://shop.co.il/c"]
+        params = client.get.await_args.kwargs["params"]
+        assert params["q"] == 'site:shop.co.il ("x" OR "y")'
+
+
+class TestFirstContact:
+    """Tests for concurrent seller contact lookup."""
+
+    @pytest.mark.asyncio
+    async def test_returns_first_contact_and_cancels_rest(self):
+        """The first scraper to find a contact wins; slower lookups are cancelled."""
+        import asyncio
+
+        slow_cancelled = asyncio.Event()
+
+        async def slow_lookup(url):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        failing, empty, found, slow = (MagicMock() for _ in range(4))
+        failing.extract_contact_info = AsyncMock(side_effect=RuntimeError("blocked"))
+        empty.extract_contact_info = AsyncMock(return_value=None)
+        found.extract_contact_info = AsyncMock(return_value="+972501234567")
+        slow.extract_contact_info = slow_lookup
+
+        contact = await asyncio.wait_for(
+            _first_contact([failing, slow, empty, found], "https://shop.co.il"), 5
+        )
+        await asyncio.sleep(0)
+
+        assert contact == "+972501234567"
+        assert slow_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_no_scraper_finds_contact(self):
+        """Should return None if every lookup fails or finds nothing."""
+        empty = MagicMock()
+        empty.extract_contact_info = AsyncMock(return_value=None)
+
+        assert await _first_contact([empty], "https://shop.co.il") is None
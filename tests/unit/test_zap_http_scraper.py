@@ -20,6 +20,20 @@ class TestZapHttpScraper:
         assert scraper.name == "zap_http"
         assert "zap.co.il" in scraper.base_url
 
+    def test_parse_price_formats(self, scraper):
+        """Test price parsing across currency, Hebrew prefix and separator formats."""
+        assert scraper._parse_price("₪1,234") == 1234.0
+        assert scraper._parse_price('2,499.90 ש"ח') == 2499.90
+        assert scraper._parse_price("ממחיר 3,100") == 3100.0
+        assert scraper._parse_price("אין מחיר") is None
+        assert scraper._parse_price("") is None
+
+    def test_is_relevant_product_requires_queried_brand(self, scraper):
+        """Test that a brand named in the query must appear in the product."""
+        assert scraper._is_relevant_product("מקרר סמסונג", "מקרר סמסונג 600 ליטר")
+        assert not scraper._is_relevant_product("מקרר סמסונג", "מקרר LG 600 ליטר")
+        assert scraper._is_relevant_product("מקרר", "מקרר LG 600 ליטר")
+
     @pytest.mark.asyncio
     async def test_search_uses_valid_headers(self, scraper):
         """Test that search() can be called without NameError.